@@ -0,0 +1,200 @@
+"""Console entry point for analyzing many model files in parallel."""
+
+# Copyright (c) 2025 Linus Held. All rights reserved.
+
+import argparse
+import glob
+import os
+import sys
+from collections import Counter
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Optional
+
+from .streaming import FORMATS, write_rows
+
+# Process exit codes.
+EXIT_OK = 0
+EXIT_TARGET_MISSED = 1
+EXIT_ERROR = 2
+
+MODEL_SUFFIXES = (".json", ".yaml", ".yml", ".eccb")
+OUTPUT_FIELDS = ("file", "name", "total_fit", "SPFM", "LFM", "Lambda_RF_Sum", "ASIL_Achieved", "meets_target", "error")
+
+
+def expand_models(specs: list[str], default_total_fit: Optional[float]) -> list[tuple[str, float]]:
+    """Expands model arguments into (file, total FIT) pairs.
+
+    Each argument is a file, a directory (searched recursively for model files) or a
+    glob pattern, optionally followed by ``=<total_fit>`` to override the default.
+
+    Args:
+        specs (list[str]): The model arguments.
+        default_total_fit (Optional[float]): The total FIT for arguments without their own value.
+
+    Returns:
+        list[tuple[str, float]]: The model files with their total FIT, in argument order.
+
+    Raises:
+        ValueError: If an argument matches no model file or has no total FIT.
+    """
+    models = []
+    for spec in specs:
+        pattern, separator, fit = spec.rpartition("=") if "=" in spec else (spec, "", "")
+        total_fit = float(fit) if separator else default_total_fit
+        if total_fit is None:
+            raise ValueError(f"No total FIT for '{pattern}'. Use --total-fit or '{pattern}=<fit>'.")
+
+        if os.path.isdir(pattern):
+            paths = sorted(str(path) for path in Path(pattern).rglob("*") if path.suffix.lower() in MODEL_SUFFIXES)
+        else:
+            paths = sorted(glob.glob(pattern, recursive=True))
+        if not paths:
+            raise ValueError(f"No model files match '{pattern}'.")
+        models.extend((path, total_fit) for path in paths)
+    return models
+
+
+def report_names(config_paths: list[str]) -> list[str]:
+    """Derives a distinct PDF report name for every model file of a batch.
+
+    A name is the path of the file relative to the deepest directory holding all files,
+    without its suffix, so ``fleet/a/model.json`` and ``fleet/b/model.json`` become
+    ``a/model`` and ``b/model``. Files that only differ in their suffix keep it, and a
+    file listed more than once gets a counter.
+
+    Args:
+        config_paths (list[str]): The model files, as returned by `expand_models`.
+
+    Returns:
+        list[str]: One report name per file, relative to the report directory.
+    """
+    if not config_paths:
+        return []
+    paths = [Path(config_path).resolve() for config_path in config_paths]
+    root = Path(os.path.commonpath([path.parent for path in paths]))
+    relative = [path.relative_to(root) for path in paths]
+    stems = Counter(path.with_suffix("") for path in relative)
+
+    names: list[str] = []
+    used: set[str] = set()
+    for path in relative:
+        name = (path if stems[path.with_suffix("")] > 1 else path.with_suffix("")).as_posix()
+        candidate, counter = name, 1
+        while candidate in used:
+            counter += 1
+            candidate = f"{name}_{counter}"
+        used.add(candidate)
+        names.append(candidate)
+    return names
+
+
+def analyze_file(config_path: str, total_fit: float, pdf_dir: Optional[str] = None, require_code: Optional[int] = None, report_name: Optional[str] = None) -> dict[str, Any]:
+    """Analyzes one model file and never raises, so a batch always completes.
+
+    Args:
+        config_path (str): The model file.
+        total_fit (float): The total FIT of the system.
+        pdf_dir (Optional[str]): If given, a PDF report is rendered into this directory.
+        require_code (Optional[int]): Index of the required ASIL in `AsilBlock.ASIL_LABELS`.
+        report_name (Optional[str]): Name of the PDF report relative to `pdf_dir` (see
+            `report_names`). Defaults to the file name without suffix.
+
+    Returns:
+        dict[str, Any]: One output row with all `OUTPUT_FIELDS`.
+    """
+    from .core import AsilBlock
+    from .generic_safety_system import GenericSafetySystem
+
+    row = dict.fromkeys(OUTPUT_FIELDS)
+    row.update(file=config_path, name=Path(config_path).stem, total_fit=total_fit)
+    try:
+        system = GenericSafetySystem(row["name"], total_fit, config_path)
+        if pdf_dir is None:
+            metrics = system.run_analysis()
+        else:
+            report_path = os.path.join(pdf_dir, report_name or row["name"])
+            os.makedirs(os.path.dirname(report_path), exist_ok=True)
+            metrics = system.generate_pdf(report_path, view=False)
+    except Exception as error:
+        row["error"] = f"{type(error).__name__}: {error}"
+        return row
+
+    row.update(metrics)
+    if require_code is not None:
+        row["meets_target"] = AsilBlock.ASIL_LABELS.index(metrics["ASIL_Achieved"]) <= require_code
+    return row
+
+
+def _analyze_all(models: list[tuple[str, float]], workers: int, pdf_dir: Optional[str], require_code: Optional[int]) -> Iterator[dict[str, Any]]:
+    """Analyzes the models and yields each row as soon as it is complete."""
+    names = report_names([config_path for config_path, _ in models])
+    if workers == 1:
+        for (config_path, total_fit), name in zip(models, names):
+            yield analyze_file(config_path, total_fit, pdf_dir, require_code, name)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(analyze_file, config_path, total_fit, pdf_dir, require_code, name) for (config_path, total_fit), name in zip(models, names)]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Command line entry point (``ecc-analyzer``).
+
+    Example:
+        ecc-analyzer 'models/**/*.json' extra.yaml=5000 --total-fit 4200 --no-pdf --require-asil B > results.jsonl
+
+    Returns:
+        int: `EXIT_OK`, `EXIT_TARGET_MISSED` if a model misses the required ASIL, or
+        `EXIT_ERROR` if a model could not be analyzed.
+    """
+    from .core import AsilBlock
+
+    parser = argparse.ArgumentParser(prog="ecc-analyzer", description="Analyze many model files in parallel and stream one result row per model.")
+    parser.add_argument("models", nargs="+", help="Model files, directories or glob patterns, each optionally as PATH=TOTAL_FIT.")
+    parser.add_argument("--total-fit", type=float, default=None, help="Total FIT for models without their own value.")
+    parser.add_argument("--workers", type=int, default=None, help="Number of worker processes (default: all CPU cores).")
+    parser.add_argument("--no-pdf", action="store_true", help="Skip PDF rendering (fast path).")
+    parser.add_argument("--pdf-dir", default="reports", help="Directory for PDF reports (default: reports).")
+    parser.add_argument("--format", choices=FORMATS, default="jsonl", help="Output format (default: jsonl).")
+    parser.add_argument("--output", default="-", help="Output file (default: stdout).")
+    parser.add_argument("--require-asil", choices=("D", "C", "B", "A"), default=None, help="Exit with code 1 if a model achieves less.")
+    args = parser.parse_args(argv)
+
+    try:
+        models = expand_models(args.models, args.total_fit)
+    except ValueError as error:
+        parser.error(str(error))
+
+    pdf_dir = None
+    if not args.no_pdf:
+        pdf_dir = args.pdf_dir
+        os.makedirs(pdf_dir, exist_ok=True)
+    require_code = AsilBlock.ASIL_LABELS.index(f"ASIL {args.require_asil}") if args.require_asil else None
+    workers = max(1, min(args.workers or os.cpu_count() or 1, len(models)))
+
+    exit_code = EXIT_OK
+
+    def track(rows: Iterator[dict[str, Any]]) -> Iterator[dict[str, Any]]:
+        nonlocal exit_code
+        for row in rows:
+            if row["error"] is not None:
+                exit_code = EXIT_ERROR
+            elif row["meets_target"] is False and exit_code == EXIT_OK:
+                exit_code = EXIT_TARGET_MISSED
+            yield row
+
+    target = sys.stdout if args.output == "-" else open(args.output, "w", newline="")
+    try:
+        write_rows(track(_analyze_all(models, workers, pdf_dir, require_code)), target, args.format, flush_every=1)
+    finally:
+        if target is not sys.stdout:
+            target.close()
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
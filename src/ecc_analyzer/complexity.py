@@ -0,0 +1,373 @@
+"""Static complexity analysis and evaluation-cost estimates of model layouts."""
+
+# Copyright (c) 2025 Linus Held. All rights reserved.
+
+import argparse
+import json
+import sys
+from collections import Counter
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from .core import Base, BasicEvent, CompiledLayout, CoverageBlock, InstanceArray, ParallelLayout, ParameterOverrides, PipelineBlock, ReplicateBlock, SplitBlock, SumBlock, TransformationBlock
+from .core.frozen_block import FrozenBlock
+from .interfaces import BlockInterface
+from .system_base import SystemBase
+
+# Relative weights of the evaluation steps, in units of roughly the cost of one leaf
+# block. They are rough estimates, not measurements: only ratios between engines and
+# between models are meaningful. "per_fault" terms scale with the number of fault types
+# in the rate state.
+COSTS = {
+    "leaf": 0.5,
+    "leaf_per_fault": 0.05,
+    "sum_child": 1.8,
+    "sum_child_per_fault": 0.55,
+    "pipeline": 0.3,
+    "pipeline_per_fault": 0.1,
+    "component": 0.3,
+    "compiled_call": 4.0,
+    "compiled_row": 0.6,
+    "compiled_coefficient": 0.25,
+    "compiled_offset": 0.25,
+    "compiled_output": 0.4,
+    "metrics": 2.5,
+    "override_level": 2.5,
+    "override_build": 6.0,
+}
+
+# Python frames `compute_fit` adds per nesting level of a block type (default: 1).
+# SumBlock evaluates its children from a generator passed to `SumBlock.merge`.
+EVALUATION_FRAMES = {SumBlock: 3}
+
+# Frames kept free for the callers of an evaluation (systems, sweeps, the service).
+RECURSION_HEADROOM = 100
+
+# Thresholds of the pathological shapes reported by `ComplexityAnalyzer`.
+WRAPPER_CHAIN_LIMIT = 16
+WIDE_SUM_LIMIT = 256
+MIN_REPEATED_SIZE = 3
+REPORT_LIMIT = 10
+
+
+def _parameters(block: BlockInterface) -> tuple:
+    """Returns the own parameters of a block (without children) in hashable form."""
+    if isinstance(block, FrozenBlock):
+        values = []
+        for name, value in block.fields().items():
+            if name == "sub_blocks":
+                continue
+            if isinstance(value, InstanceArray):
+                value = tuple(value)
+            elif isinstance(value, Mapping):
+                value = tuple(value.items())
+            values.append(value)
+        return tuple(values)
+    if isinstance(block, Base):
+        return (block.name,)
+    return (id(block),)
+
+
+def _is_wrapper(block: BlockInterface, children: list[BlockInterface]) -> bool:
+    """Checks whether a block merely wraps a single child."""
+    if len(children) != 1:
+        return False
+    if isinstance(block, ReplicateBlock):
+        return block.count == 1
+    return isinstance(block, (SumBlock, PipelineBlock, Base))
+
+
+class ComplexityAnalyzer:
+    """Static analysis of a layout: size, shape, fault types and per-evaluation cost.
+
+    The analyzer walks the block tree once (iteratively, so that pathologically deep
+    models can be analyzed as well), without evaluating it. Shared sub-trees, e.g. from
+    configuration definitions, are visited once but counted at every position, because
+    every position is evaluated.
+
+    The cost estimates weigh the evaluation steps with the relative weights in `COSTS`
+    for three engines:
+
+    * "interpreted": `compute_fit` on the block tree,
+    * "compiled": `CompiledLayout.compute_fit` (``None`` if the layout cannot be compiled),
+    * "sweep_row": one row of a `ParameterSweep` chunk, i.e. applying one parameter
+      override, evaluating the tree and computing the metrics.
+
+    Example:
+        report = ComplexityAnalyzer(system).analyze()
+        print(ComplexityAnalyzer.format_report(report))
+    """
+
+    def __init__(self, model: Union[SystemBase, BlockInterface], compile_layout: bool = True):
+        """Initializes the analyzer.
+
+        Args:
+            model (Union[SystemBase, BlockInterface]): The system or the root block of a layout.
+            compile_layout (bool): Whether to compile the layout for the "compiled" estimate.
+
+        Raises:
+            ValueError: If the system has no layout.
+        """
+        layout = model.system_layout if isinstance(model, SystemBase) else model
+        if layout is None:
+            raise ValueError("System layout is not configured.")
+        self.layout = layout
+        self.compile_layout = compile_layout
+
+    def _unique_blocks(self) -> tuple[list[BlockInterface], dict[int, list[BlockInterface]]]:
+        """Returns the distinct block objects in post-order (children first) and their children."""
+        order: list[BlockInterface] = []
+        children: dict[int, list[BlockInterface]] = {}
+        stack: list[tuple[BlockInterface, bool]] = [(self.layout, False)]
+        while stack:
+            block, expanded = stack.pop()
+            if expanded:
+                order.append(block)
+                continue
+            if id(block) in children:
+                continue
+            children[id(block)] = ParameterOverrides.children(block)
+            stack.append((block, True))
+            stack.extend((child, False) for child in reversed(children[id(block)]) if id(child) not in children)
+        return order, children
+
+    def analyze(self) -> dict[str, Any]:
+        """Analyzes the layout.
+
+        Returns:
+            dict[str, Any]: The report, containing:
+                - "blocks" (int): Block evaluations per analysis (positions in the tree).
+                - "unique_blocks" (int): Distinct block objects.
+                - "by_type" (dict[str, int]): Block positions per block type.
+                - "depth" (int): Nesting depth of the tree.
+                - "recursion_depth" (int): Python frames `compute_fit` nests along the
+                  deepest path (see `EVALUATION_FRAMES`).
+                - "sum_fan_out" (dict[str, float]): Count, maximum and mean number of
+                  children of the SumBlocks.
+                - "fault_types" (list[str]): Names of the fault types the blocks touch.
+                - "repeated_subtrees" (list[dict]): The largest sub-trees occurring more
+                  than once, with their type, name, size and occurrences.
+                - "compiled" (Optional[dict]): `CompiledLayout.statistics()`, if compiled.
+                - "cost" (dict[str, Optional[float]]): Relative cost per evaluation of the
+                  "interpreted", "compiled" and "sweep_row" engines (see `COSTS`).
+                - "suggested_engine" (str): The cheaper engine for repeated evaluations of
+                  one parameter set.
+                - "flags" (list[dict[str, str]]): Pathological shapes, each with the
+                  "issue", the affected "block" and a "suggestion".
+        """
+        order, children = self._unique_blocks()
+
+        size: dict[int, int] = {}
+        height: dict[int, int] = {}
+        frames: dict[int, int] = {}
+        chain: dict[int, int] = {}
+        key: dict[int, int] = {}
+        keys: dict[tuple, int] = {}
+        faults: set[str] = set()
+        for block in order:
+            kids = children[id(block)]
+            size[id(block)] = 1 + sum(size[id(child)] for child in kids)
+            height[id(block)] = 1 + max((height[id(child)] for child in kids), default=0)
+            frames[id(block)] = EVALUATION_FRAMES.get(type(block), 1) + max((frames[id(child)] for child in kids), default=0)
+            chain[id(block)] = 1 + chain[id(kids[0])] if _is_wrapper(block, kids) else 0
+            key[id(block)] = keys.setdefault((type(block).__name__, _parameters(block), tuple(key[id(child)] for child in kids)), len(keys))
+            faults.update(fault.name for fault in self._faults(block))
+
+        occurrences: Counter = Counter({id(self.layout): 1})
+        for block in reversed(order):
+            for child in children[id(block)]:
+                occurrences[id(child)] += occurrences[id(block)]
+
+        by_type: Counter = Counter()
+        fan_outs: Counter = Counter()
+        for block in order:
+            by_type[type(block).__name__] += occurrences[id(block)]
+            if isinstance(block, SumBlock):
+                fan_outs[len(children[id(block)])] += occurrences[id(block)]
+
+        report: dict[str, Any] = {
+            "blocks": size[id(self.layout)],
+            "unique_blocks": len(order),
+            "by_type": dict(sorted(by_type.items())),
+            "depth": height[id(self.layout)],
+            "recursion_depth": frames[id(self.layout)],
+            "sum_fan_out": {
+                "count": sum(fan_outs.values()),
+                "max": max(fan_outs, default=0),
+                "mean": sum(fan * count for fan, count in fan_outs.items()) / sum(fan_outs.values()) if fan_outs else 0.0,
+            },
+            "fault_types": sorted(faults),
+            "repeated_subtrees": self._repeated(order, children, size, key, occurrences),
+        }
+
+        compiled, compile_error = self._compile()
+        report["compiled"] = compiled.statistics() if compiled is not None else None
+        report["cost"] = self._costs(order, children, size, height, occurrences, len(faults), compiled)
+        costs = report["cost"]
+        report["suggested_engine"] = "compiled" if costs["compiled"] is not None and costs["compiled"] < costs["interpreted"] else "interpreted"
+        report["flags"] = self._flags(order, children, size, frames, chain, key, compile_error)
+        return report
+
+    @staticmethod
+    def _faults(block: BlockInterface) -> list:
+        """Returns the fault types a block reads or writes."""
+        if isinstance(block, BasicEvent):
+            return [block.fault_type]
+        if isinstance(block, CoverageBlock):
+            return [block.target_fault]
+        if isinstance(block, SplitBlock):
+            return [block.fault_to_split, *block.distribution_rates]
+        if isinstance(block, TransformationBlock):
+            return [block.source, block.target]
+        return []
+
+    def _repeated(self, order: list, children: dict, size: dict, key: dict, occurrences: Counter) -> list[dict[str, Any]]:
+        """Lists the largest repeated sub-trees that do not only occur inside larger repeated ones."""
+        total: Counter = Counter()
+        example: dict[int, BlockInterface] = {}
+        for block in order:
+            total[key[id(block)]] += occurrences[id(block)]
+            example.setdefault(key[id(block)], block)
+
+        standalone = {key[id(self.layout)]}
+        for block in order:
+            if total[key[id(block)]] < 2:
+                standalone.update(key[id(child)] for child in children[id(block)])
+
+        repeated = [
+            {"type": type(block).__name__, "name": getattr(block, "name", None), "size": size[id(block)], "occurrences": total[block_key]}
+            for block_key, block in example.items()
+            if total[block_key] >= 2 and size[id(block)] >= MIN_REPEATED_SIZE and block_key in standalone
+        ]
+        repeated.sort(key=lambda entry: entry["size"] * (entry["occurrences"] - 1), reverse=True)
+        return repeated[:REPORT_LIMIT]
+
+    def _compile(self) -> tuple[Optional[CompiledLayout], Optional[str]]:
+        """Compiles the layout, returning the reason instead if that is not possible."""
+        if not self.compile_layout:
+            return None, None
+        try:
+            return CompiledLayout(self.layout), None
+        except ValueError as error:
+            return None, str(error)
+        except RecursionError:
+            return None, "The layout is nested too deeply to be compiled."
+
+    def _costs(self, order: list, children: dict, size: dict, height: dict, occurrences: Counter, fault_count: int, compiled: Optional[CompiledLayout]) -> dict[str, Optional[float]]:
+        """Estimates the relative cost per evaluation of each engine."""
+        interpreted = 0.0
+        component_sizes: Counter = Counter()
+        for block in order:
+            kids = children[id(block)]
+            if isinstance(block, (SumBlock, ReplicateBlock)):
+                own = len(kids) * (COSTS["sum_child"] + COSTS["sum_child_per_fault"] * fault_count)
+            elif isinstance(block, PipelineBlock):
+                own = COSTS["pipeline"] + COSTS["pipeline_per_fault"] * fault_count
+            elif isinstance(block, Base):
+                own = COSTS["component"]
+                component_sizes[size[id(block)]] += occurrences[id(block)]
+            else:
+                own = COSTS["leaf"] + COSTS["leaf_per_fault"] * fault_count
+            interpreted += own * occurrences[id(block)]
+
+        compiled_cost = None
+        if compiled is not None:
+            if compiled.mode == "sparse":
+                rows, coefficients = len(compiled.row_keys), compiled.nnz
+            else:
+                rows, coefficients = compiled.dimension, compiled.dimension * compiled.dimension
+            compiled_cost = (
+                COSTS["compiled_call"]
+                + COSTS["compiled_row"] * rows
+                + COSTS["compiled_coefficient"] * coefficients
+                + COSTS["compiled_offset"] * len(compiled.offset_keys)
+                + COSTS["compiled_output"] * compiled.dimension
+            )
+
+        components = sum(component_sizes.values())
+        rebuild = sum(component_size * count for component_size, count in component_sizes.items()) / components if components else 0.0
+        sweep_row = interpreted + COSTS["metrics"] + COSTS["override_level"] * height[id(self.layout)] + COSTS["override_build"] * rebuild
+        return {"interpreted": interpreted, "compiled": compiled_cost, "sweep_row": sweep_row}
+
+    def _flags(self, order: list, children: dict, size: dict, frames: dict, chain: dict, key: dict, compile_error: Optional[str]) -> list[dict[str, str]]:
+        """Detects pathological shapes and suggests a remedy for each."""
+        flags = []
+
+        def flag(issue: str, block: BlockInterface, suggestion: str):
+            flags.append({"issue": issue, "block": getattr(block, "name", None) or type(block).__name__, "suggestion": suggestion})
+
+        wrapped = set()
+        for block in reversed(order):
+            if chain[id(block)] >= WRAPPER_CHAIN_LIMIT and id(block) not in wrapped:
+                flag("wrapper_chain", block, f"{chain[id(block)]} nested single-child wrappers; flatten them or use the compiled engine, which folds them into one operator.")
+                inner = block
+                while chain[id(inner)]:
+                    inner = children[id(inner)][0]
+                    wrapped.add(id(inner))
+
+        if frames[id(self.layout)] + RECURSION_HEADROOM >= sys.getrecursionlimit():
+            flag("deep_nesting", self.layout, f"Evaluation nests {frames[id(self.layout)]} frames, close to the recursion limit of {sys.getrecursionlimit()}; flatten the nesting.")
+
+        for block in order:
+            kids = children[id(block)]
+            if isinstance(block, SumBlock) and len(kids) >= WIDE_SUM_LIMIT:
+                common, count = Counter(key[id(child)] for child in kids).most_common(1)[0]
+                if count * 2 >= len(kids):
+                    flag("wide_identical_sum", block, f"{count} of {len(kids)} children are identical; use a ReplicateBlock with count={count}.")
+            if isinstance(block, SumBlock) and sum(size[id(child)] >= ParallelLayout.DEFAULT_MIN_COST for child in kids) >= 2:
+                flag("parallel_candidate", block, "Several heavy independent children; evaluate single analyses with ParallelLayout.")
+
+        if compile_error is not None:
+            flag("not_compilable", self.layout, f"{compile_error} Use the interpreted engine.")
+        return flags
+
+    @staticmethod
+    def format_report(report: dict[str, Any]) -> str:
+        """Formats a report for the terminal.
+
+        Args:
+            report (dict[str, Any]): The result of `analyze`.
+
+        Returns:
+            str: A human-readable summary.
+        """
+        fan_out = report["sum_fan_out"]
+        lines = [
+            f"Blocks:           {report['blocks']} ({report['unique_blocks']} distinct)",
+            "By type:          " + ", ".join(f"{name}={count}" for name, count in report["by_type"].items()),
+            f"Depth:            {report['depth']} ({report['recursion_depth']} evaluation frames)",
+            f"SumBlock fan-out: max {fan_out['max']}, mean {fan_out['mean']:.1f} over {fan_out['count']}",
+            f"Fault types:      {len(report['fault_types'])}",
+        ]
+        for entry in report["repeated_subtrees"]:
+            lines.append(f"Repeated:         {entry['type']} '{entry['name']}' ({entry['size']} blocks) x{entry['occurrences']}")
+        for engine, cost in report["cost"].items():
+            lines.append(f"Cost {engine + ':':<12} " + (f"{cost:.1f}" if cost is not None else "n/a"))
+        lines.append(f"Suggested engine: {report['suggested_engine']}")
+        for entry in report["flags"]:
+            lines.append(f"Warning [{entry['issue']}] {entry['block']}: {entry['suggestion']}")
+        return "\n".join(lines)
+
+
+def main(argv: Optional[list[str]] = None):
+    """Command line entry point.
+
+    Example:
+        python -m ecc_analyzer.complexity model.json --json
+    """
+    from .generic_safety_system import GenericSafetySystem
+
+    parser = argparse.ArgumentParser(description="Report the size, shape and estimated evaluation cost of a model.")
+    parser.add_argument("config", help="Model file (.json, .yaml, .yml or .eccb).")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON.")
+    parser.add_argument("--no-compile", action="store_true", help="Skip compiling the layout for the compiled estimate.")
+    args = parser.parse_args(argv)
+
+    system = GenericSafetySystem(Path(args.config).stem, 0.0, args.config)
+    report = ComplexityAnalyzer(system, compile_layout=not args.no_compile).analyze()
+    print(json.dumps(report, indent=4) if args.json else ComplexityAnalyzer.format_report(report))
+
+
+if __name__ == "__main__":
+    main()
@@ -5,10 +5,16 @@
 from .asil_block import AsilBlock
 from .base import Base
 from .basic_event import BasicEvent
+from .binary_model import BinaryModel
 from .block_factory import BlockFactory
+from .compiled_layout import CompiledLayout
 from .coverage_block import CoverageBlock
+from .instance_array import InstanceArray
 from .observable_block import ObservableBlock
+from .parallel_layout import ParallelLayout
+from .parameter_overrides import ParameterOverrides
 from .pipeline_block import PipelineBlock
+from .replicate_block import ReplicateBlock
 from .split_block import SplitBlock
 from .sum_block import SumBlock
 from .transformation_block import TransformationBlock
@@ -17,9 +23,15 @@ __all__ = [
     "AsilBlock",
     "Base",
     "BasicEvent",
+    "BinaryModel",
+    "CompiledLayout",
     "CoverageBlock",
+    "InstanceArray",
     "ObservableBlock",
+    "ParallelLayout",
+    "ParameterOverrides",
     "PipelineBlock",
+    "ReplicateBlock",
     "SplitBlock",
     "SumBlock",
     "TransformationBlock",
@@ -23,6 +23,10 @@ class AsilBlock:
         "A": [0.00, 0.00, 1000.0],
     }
 
+    # All possible results of `_determine_asil`. The position is used as a
+    # compact numeric code when metrics are stored in arrays.
+    ASIL_LABELS = ("ASIL D", "ASIL C", "ASIL B", "ASIL A", "QM (Quality Management)")
+
     def __init__(self, name: str):
         """Initializes the ASIL calculation block.
 
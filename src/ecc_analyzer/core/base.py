@@ -2,6 +2,7 @@
 
 # Copyright (c) 2025 Linus Held. All rights reserved.
 
+import threading
 from abc import ABC, abstractmethod
 from typing import Optional
 
@@ -13,17 +14,86 @@ class Base(BlockInterface, ABC):
 
     Provides a structured way to define internal logic hierarchies by wrapping
     complex logic into a single modular unit.
+
+    By default the internal blocks are configured in the constructor. Components whose
+    class sets ``lazy = True`` (or all components, via ``Base.lazy = True``) defer
+    `configure_blocks` until the root block is first accessed, e.g. by `compute_fit`,
+    `to_dict` or the visualizer, so that sub-trees of large models that are never used
+    are never built. The first access is serialized by a lock of the component, so
+    components shared between threads are built exactly once, while independent
+    components are built concurrently.
     """
 
+    lazy: bool = False
+
     def __init__(self, name: str):
         """Initializes the component and triggers the internal block configuration.
 
+        In lazy mode the configuration is deferred until the root block is needed.
+
         Args:
             name (str): The descriptive name of the hardware component.
         """
         self.name = name
-        self.root_block: Optional[BlockInterface] = None
-        self.configure_blocks()
+        self._root_block: Optional[BlockInterface] = None
+        self._configured = False
+        # Re-entrant, so that `configure_blocks` may itself read the root block.
+        self._build_lock = threading.RLock()
+        if not self.lazy:
+            self.reconfigure()
+
+    @property
+    def root_block(self) -> Optional[BlockInterface]:
+        """The internal root block, configured on first access in lazy mode."""
+        if not self._configured:
+            with self._build_lock:
+                if not self._configured:
+                    self._build()
+        return self._root_block
+
+    @root_block.setter
+    def root_block(self, block: Optional[BlockInterface]):
+        self._root_block = block
+        self._configured = True
+
+    def __getstate__(self) -> dict:
+        # Locks cannot be pickled; copies and unpickled components get their own.
+        state = self.__dict__.copy()
+        state.pop("_build_lock", None)
+        return state
+
+    def __setstate__(self, state: dict):
+        self.__dict__.update(state)
+        self._build_lock = threading.RLock()
+
+    @property
+    def is_configured(self) -> bool:
+        """Whether the internal blocks have been built."""
+        return self._configured
+
+    def reconfigure(self):
+        """Rebuilds the internal blocks from the current attributes.
+
+        In lazy mode the rebuild is deferred until the root block is next accessed.
+        """
+        self._root_block = None
+        self._configured = False
+        if not self.lazy:
+            self._build()
+
+    def _build(self):
+        """Runs `configure_blocks` and marks the component as configured once it succeeded.
+
+        If the configuration fails, the component stays unconfigured, so the next access
+        raises again instead of passing the rates through.
+        """
+        try:
+            self.configure_blocks()
+        except BaseException:
+            self._root_block = None
+            self._configured = False
+            raise
+        self._configured = True
 
     @abstractmethod
     def configure_blocks(self):
@@ -48,11 +118,13 @@ class Base(BlockInterface, ABC):
             tuple[dict[FaultType, float], dict[FaultType, float]]: Updated FIT rates
             processed by the internal root block.
         """
-        if self.root_block is None:
+        root_block = self.root_block
+        if root_block is None:
             return spfm_rates.copy(), lfm_rates.copy()
 
-        return self.root_block.compute_fit(spfm_rates, lfm_rates)
+        return root_block.compute_fit(spfm_rates, lfm_rates)
 
     def to_dict(self) -> dict:
         """Serializes the component by delegating to its internal root block."""
-        return {"type": self.__class__.__name__, "name": self.name, "root_block": self.root_block.to_dict() if self.root_block else None}
+        root_block = self.root_block
+        return {"type": self.__class__.__name__, "name": self.name, "root_block": root_block.to_dict() if root_block else None}
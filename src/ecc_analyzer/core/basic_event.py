@@ -2,27 +2,34 @@
 
 # Copyright (c) 2025 Linus Held. All rights reserved.
 
-from ..interfaces import BlockInterface, FaultType
+from typing import Union
 
+from ..interfaces import FaultType
+from .frozen_block import FrozenBlock
+from .instance_array import InstanceArray
 
-class BasicEvent(BlockInterface):
+
+class BasicEvent(FrozenBlock):
     """Represents a source of a fault (Basic Event) that injects a specific FIT rate.
 
     This class handles the mathematical addition of failure rates to the fault dictionaries.
     """
 
-    def __init__(self, fault_type: FaultType, rate: float, is_spfm: bool = True):
+    __slots__ = ("fault_type", "lambda_BE", "is_spfm")
+
+    _ARGUMENTS = {"lambda_BE": "rate"}
+
+    def __init__(self, fault_type: FaultType, rate: Union[float, InstanceArray], is_spfm: bool = True):
         """Initializes the BasicEvent fault source.
 
         Args:
             fault_type (FaultType): The type of fault (Enum) this event produces.
-            rate (float): The FIT rate of this basic event.
+            rate (Union[float, InstanceArray]): The FIT rate of this basic event, or one
+                rate per instance of an enclosing ReplicateBlock.
             is_spfm (bool, optional): Whether this rate counts towards SPFM (True)
                 or LFM (False). Defaults to True.
         """
-        self.fault_type = fault_type
-        self.lambda_BE = rate
-        self.is_spfm = is_spfm
+        self._init(fault_type=fault_type, lambda_BE=rate, is_spfm=is_spfm)
 
     def compute_fit(self, spfm_rates: dict[FaultType, float], lfm_rates: dict[FaultType, float]) -> tuple[dict[FaultType, float], dict[FaultType, float]]:
         """Transforms the input fault rate dictionaries by injecting the defined FIT rate.
@@ -52,4 +59,4 @@ class BasicEvent(BlockInterface):
                 needed to reconstruct this BasicEvent via the BlockFactory.
         """
 
-        return {"type": "BasicEvent", "fault_type": self.fault_type.name, "rate": self.lambda_BE, "is_spfm": self.is_spfm}
+        return {"type": "BasicEvent", "fault_type": self.fault_type.name, "rate": InstanceArray.serialize(self.lambda_BE), "is_spfm": self.is_spfm}
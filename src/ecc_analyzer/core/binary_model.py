@@ -0,0 +1,360 @@
+"""Compact, versioned binary serialization of block trees."""
+
+# Copyright (c) 2025 Linus Held. All rights reserved.
+
+import mmap
+import struct
+import sys
+from typing import Any, Optional, Union
+
+from ..interfaces import BlockInterface, FaultType
+from .basic_event import BasicEvent
+from .coverage_block import CoverageBlock
+from .pipeline_block import PipelineBlock
+from .replicate_block import ReplicateBlock
+from .split_block import SplitBlock
+from .sum_block import SumBlock
+from .transformation_block import TransformationBlock
+
+# Block type codes of the node records. New types are appended, never renumbered.
+TYPE_CODES = ("SumBlock", "PipelineBlock", "BasicEvent", "CoverageBlock", "SplitBlock", "TransformationBlock", "ReplicateBlock")
+
+# Node flag bits.
+FLAG_SPFM = 1
+FLAG_HAS_NAME = 2
+FLAG_DERIVED_C_L = 4
+
+NO_INDEX = 0xFFFFFFFF
+
+
+class BinaryModel:
+    """Reads and writes block trees in the binary ``.eccb`` format.
+
+    The file starts with a fixed header (magic, format version and section sizes),
+    followed by five sections:
+
+    - a string table holding block and fault type names once each,
+    - fixed-width node records in pre-order: type code, flags, name index, two fault
+      name indices, the offset of the node's parameters, its child count and the index
+      after its sub-tree (so a reader can skip sub-trees without decoding them),
+    - a packed float64 array with all numeric parameters,
+    - a packed uint32 array with the target fault indices of split blocks,
+    - a packed uint32 array with the string indices of the declared fault types.
+
+    A reader only needs the header to start. Nodes and strings are decoded on demand
+    from any buffer, including a read-only memory map of the file. `to_dict` reproduces
+    the `to_dict` output of the original layout exactly, and `build` constructs the
+    blocks directly without going through dictionaries. Fault types are stored by name.
+    The fault types beyond the built-in ones are declared, like in the ``fault_types``
+    list of a configuration: `build` registers only those (see `FaultType.register`) and
+    rejects any other name that is not a built-in fault type.
+    """
+
+    MAGIC = b"ECCB"
+    VERSION = 2
+    SUFFIX = ".eccb"
+
+    _HEADER = struct.Struct("<4sHxxIIIII")
+    _NODE = struct.Struct("<BBxxIIIIII")
+    _LENGTH = struct.Struct("<I")
+
+    def __init__(self, buffer: Union[bytes, memoryview, mmap.mmap]):
+        """Opens a binary model for reading.
+
+        Args:
+            buffer (Union[bytes, memoryview, mmap.mmap]): The serialized model.
+
+        Raises:
+            ValueError: If the buffer is not a binary model of a supported version.
+        """
+        self.buffer = memoryview(buffer)
+        if len(self.buffer) < self._HEADER.size:
+            raise ValueError("Not a binary model: file is too short.")
+        magic, version, string_bytes, node_count, float_count, index_count, declared_count = self._HEADER.unpack_from(self.buffer)
+        if magic != self.MAGIC:
+            raise ValueError("Not a binary model: bad magic number.")
+        if version != self.VERSION:
+            raise ValueError(f"Unsupported binary model version {version} (expected {self.VERSION}).")
+
+        self.node_count = node_count
+        self._strings_offset = self._HEADER.size
+        self._nodes_offset = self._strings_offset + string_bytes
+        floats_offset = self._nodes_offset + node_count * self._NODE.size
+        indices_offset = floats_offset + float_count * 8
+        declared_offset = indices_offset + index_count * 4
+        if len(self.buffer) < declared_offset + declared_count * 4:
+            raise ValueError("Not a binary model: file is truncated.")
+
+        # The arrays are little-endian; native views are only valid on little-endian hosts.
+        if sys.byteorder != "little":
+            raise ValueError("Binary models can only be read on little-endian hosts.")
+        self.floats = self.buffer[floats_offset:indices_offset].cast("d")
+        self.indices = self.buffer[indices_offset:declared_offset].cast("I")
+        self.declared = self.buffer[declared_offset : declared_offset + declared_count * 4].cast("I")
+        self._string_offsets: Optional[list[int]] = None
+        self._strings: dict[int, str] = {}
+
+    def __len__(self) -> int:
+        """Returns the number of nodes in the model."""
+        return self.node_count
+
+    def string(self, index: int) -> str:
+        """Returns an entry of the string table.
+
+        Args:
+            index (int): The string index.
+
+        Returns:
+            str: The decoded string.
+        """
+        if index not in self._strings:
+            if self._string_offsets is None:
+                self._string_offsets = []
+                position = self._strings_offset
+                while position < self._nodes_offset:
+                    self._string_offsets.append(position)
+                    position += self._LENGTH.size + self._LENGTH.unpack_from(self.buffer, position)[0]
+            position = self._string_offsets[index]
+            (length,) = self._LENGTH.unpack_from(self.buffer, position)
+            start = position + self._LENGTH.size
+            self._strings[index] = bytes(self.buffer[start : start + length]).decode()
+        return self._strings[index]
+
+    @property
+    def fault_types(self) -> list[str]:
+        """The declared fault types beyond the built-in ones, in registration order."""
+        return [self.string(index) for index in self.declared]
+
+    def node(self, index: int) -> tuple[int, int, int, int, int, int, int, int]:
+        """Decodes a node record.
+
+        Args:
+            index (int): The pre-order node index (0 is the root).
+
+        Returns:
+            tuple[int, int, int, int, int, int, int, int]: Type code, flags, name index,
+            first and second fault index, parameter offset, child count and sub-tree end.
+        """
+        return self._NODE.unpack_from(self.buffer, self._nodes_offset + index * self._NODE.size)
+
+    def children(self, index: int) -> list[int]:
+        """Returns the node indices of the direct children of a node.
+
+        Args:
+            index (int): The node index.
+
+        Returns:
+            list[int]: The child node indices, in order.
+        """
+        child_count = self.node(index)[6] if self.node(index)[0] in (0, 1, 6) else 0
+        children = []
+        child = index + 1
+        for _ in range(child_count):
+            children.append(child)
+            child = self.node(child)[7]
+        return children
+
+    def to_dict(self, index: int = 0) -> dict[str, Any]:
+        """Decodes a sub-tree into the dictionary form produced by `to_dict`.
+
+        Args:
+            index (int): The root node of the sub-tree.
+
+        Returns:
+            dict[str, Any]: The serialized block.
+        """
+        type_code, flags, name, fault_a, fault_b, params, count, _ = self.node(index)
+        block_type = TYPE_CODES[type_code]
+        is_spfm = bool(flags & FLAG_SPFM)
+        if block_type in ("SumBlock", "PipelineBlock"):
+            return {"type": block_type, "name": self.string(name), "sub_blocks": [self.to_dict(child) for child in self.children(index)]}
+        if block_type == "ReplicateBlock":
+            return {"type": block_type, "name": self.string(name), "child": self.to_dict(index + 1), "count": int(self.floats[params])}
+        if block_type == "BasicEvent":
+            return {"type": block_type, "fault_type": self.string(fault_a), "rate": self.floats[params], "is_spfm": is_spfm}
+        if block_type == "CoverageBlock":
+            return {
+                "type": block_type,
+                "target_fault": self.string(fault_a),
+                "dc_rate_c_or_cR": self.floats[params],
+                "dc_rate_latent_cL": None if flags & FLAG_DERIVED_C_L else self.floats[params + 1],
+                "is_spfm": is_spfm,
+            }
+        if block_type == "SplitBlock":
+            return {
+                "type": block_type,
+                "name": self.string(name),
+                "fault_to_split": self.string(fault_a),
+                "distribution_rates": {self.string(self.indices[fault_b + i]): self.floats[params + i] for i in range(count)},
+                "is_spfm": is_spfm,
+            }
+        return {"type": block_type, "source_fault": self.string(fault_a), "target_fault": self.string(fault_b), "factor": self.floats[params]}
+
+    def build(self, index: int = 0) -> BlockInterface:
+        """Constructs the blocks of a sub-tree.
+
+        Args:
+            index (int): The root node of the sub-tree.
+
+        Returns:
+            BlockInterface: The root block of the sub-tree.
+
+        Raises:
+            ValueError: If the model uses a fault type that is neither built in nor declared.
+        """
+        start = self._nodes_offset + index * self._NODE.size
+        end = self._nodes_offset + self.node(index)[7] * self._NODE.size
+        with self.buffer[start:end] as view:
+            records = iter(list(self._NODE.iter_unpack(view)))
+        string = self.string
+        floats = self.floats
+        faults = {index: FaultType.register(string(index)) for index in self.declared}
+
+        def fault(string_index: int) -> FaultType:
+            if string_index not in faults:
+                name = string(string_index)
+                if name not in FaultType.BUILTIN:
+                    raise ValueError(f"Unknown fault type '{name}': not declared in the binary model.")
+                faults[string_index] = FaultType[name]
+            return faults[string_index]
+
+        def build_next() -> BlockInterface:
+            type_code, flags, name, fault_a, fault_b, params, count, _ = next(records)
+            is_spfm = bool(flags & FLAG_SPFM)
+            if type_code == 0:
+                return SumBlock(string(name), [build_next() for _ in range(count)])
+            if type_code == 1:
+                return PipelineBlock(string(name), [build_next() for _ in range(count)])
+            if type_code == 6:
+                return ReplicateBlock(string(name), build_next(), int(floats[params]))
+            if type_code == 2:
+                return BasicEvent(fault(fault_a), floats[params], is_spfm)
+            if type_code == 3:
+                return CoverageBlock(fault(fault_a), floats[params], None if flags & FLAG_DERIVED_C_L else floats[params + 1], is_spfm)
+            if type_code == 4:
+                rates = {fault(self.indices[fault_b + i]): floats[params + i] for i in range(count)}
+                return SplitBlock(string(name), fault(fault_a), rates, is_spfm)
+            return TransformationBlock(fault(fault_a), fault(fault_b), floats[params])
+
+        return build_next()
+
+    def release(self):
+        """Releases the views on the underlying buffer, e.g. before closing a memory map."""
+        self.floats.release()
+        self.indices.release()
+        self.declared.release()
+        self.buffer.release()
+
+    @staticmethod
+    def load(file_path: str) -> BlockInterface:
+        """Reads a binary model file through a read-only memory map and builds its layout.
+
+        Args:
+            file_path (str): The path to the ``.eccb`` file.
+
+        Returns:
+            BlockInterface: The root block of the layout.
+        """
+        with open(file_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            model = BinaryModel(mapped)
+            try:
+                return model.build()
+            finally:
+                model.release()
+
+    @staticmethod
+    def dumps(data: dict[str, Any]) -> bytes:
+        """Serializes a layout in its `to_dict` form.
+
+        The fault types it uses beyond the built-in ones are declared in the model, in the
+        order of their registration (or of first use, for names not registered here).
+
+        Args:
+            data (dict[str, Any]): The serialized layout.
+
+        Returns:
+            bytes: The binary model.
+
+        Raises:
+            ValueError: If the layout contains a block type or a per-instance parameter
+                without a binary encoding.
+        """
+        strings: dict[str, int] = {}
+        nodes: list[list[int]] = []
+        floats: list[float] = []
+        indices: list[int] = []
+        fault_names: dict[str, int] = {}
+
+        def intern(value: str) -> int:
+            if value not in strings:
+                strings[value] = len(strings)
+            return strings[value]
+
+        def intern_fault(name: str) -> int:
+            if name not in fault_names:
+                fault_names[name] = intern(name)
+            return fault_names[name]
+
+        def encode(block: dict[str, Any]):
+            block_type = block.get("type")
+            if block_type not in TYPE_CODES:
+                raise ValueError(f"Block type '{block_type}' has no binary encoding.")
+            for key in ("rate", "dc_rate_c_or_cR", "dc_rate_latent_cL"):
+                if isinstance(block.get(key), list):
+                    raise ValueError(f"Per-instance parameter '{key}' has no binary encoding.")
+            record = [TYPE_CODES.index(block_type), FLAG_SPFM if block.get("is_spfm", True) else 0, NO_INDEX, NO_INDEX, NO_INDEX, len(floats), 0, 0]
+            if "name" in block:
+                record[1] |= FLAG_HAS_NAME
+                record[2] = intern(block["name"])
+            nodes.append(record)
+
+            if block_type in ("SumBlock", "PipelineBlock"):
+                record[6] = len(block["sub_blocks"])
+                for child in block["sub_blocks"]:
+                    encode(child)
+            elif block_type == "ReplicateBlock":
+                record[6] = 1
+                floats.append(block["count"])
+                encode(block["child"])
+            elif block_type == "BasicEvent":
+                record[3] = intern_fault(block["fault_type"])
+                floats.append(block["rate"])
+            elif block_type == "CoverageBlock":
+                record[3] = intern_fault(block["target_fault"])
+                c_r = block["dc_rate_c_or_cR"]
+                c_l = block.get("dc_rate_latent_cL")
+                if c_l is None:
+                    record[1] |= FLAG_DERIVED_C_L
+                floats.extend((c_r, 1.0 - c_r if c_l is None else c_l))
+            elif block_type == "SplitBlock":
+                record[3] = intern_fault(block["fault_to_split"])
+                record[4] = len(indices)
+                record[6] = len(block["distribution_rates"])
+                for fault_name, rate in block["distribution_rates"].items():
+                    indices.append(intern_fault(fault_name))
+                    floats.append(rate)
+            else:
+                record[3] = intern_fault(block["source_fault"])
+                record[4] = intern_fault(block["target_fault"])
+                floats.append(block["factor"])
+            record[7] = len(nodes)
+
+        encode(data)
+
+        custom = [name for name in fault_names if name not in FaultType.BUILTIN]
+        registered = {name: FaultType.get(name) for name in custom}
+        custom.sort(key=lambda name: registered[name].index if registered[name] is not None else len(FaultType))
+        declared = [fault_names[name] for name in custom]
+
+        string_table = b"".join(BinaryModel._LENGTH.pack(len(encoded)) + encoded for encoded in (value.encode() for value in strings))
+        header = BinaryModel._HEADER.pack(BinaryModel.MAGIC, BinaryModel.VERSION, len(string_table), len(nodes), len(floats), len(indices), len(declared))
+        return b"".join(
+            (
+                header,
+                string_table,
+                b"".join(BinaryModel._NODE.pack(*record) for record in nodes),
+                struct.pack(f"<{len(floats)}d", *floats),
+                struct.pack(f"<{len(indices)}I", *indices),
+                struct.pack(f"<{len(declared)}I", *declared),
+            )
+        )
@@ -2,16 +2,51 @@
 
 # Copyright (c) 2025 Linus Held. All rights reserved.
 
-from typing import Any, Type
+import json
+import math
+from collections import Counter
+from collections.abc import Mapping
+from typing import Any, Optional, Type
 
 from ..interfaces import BlockInterface, FaultType
+from .base import Base
 from .basic_event import BasicEvent
 from .coverage_block import CoverageBlock
+from .frozen_block import FrozenBlock
+from .instance_array import InstanceArray
+from .parameter_overrides import ParameterOverrides
 from .pipeline_block import PipelineBlock
+from .replicate_block import ReplicateBlock
 from .split_block import SplitBlock
 from .sum_block import SumBlock
 from .transformation_block import TransformationBlock
 
+# Expected value kinds of block parameters, checked by `BlockFactory.from_dict`.
+FAULT = "fault"
+NUMBER = "number"
+NON_NEGATIVE = "non-negative number"
+FRACTION = "number in [0, 1]"
+OPTIONAL_FRACTION = "optional number in [0, 1]"
+INSTANCE_NON_NEGATIVE = "non-negative number or list of non-negative numbers"
+INSTANCE_FRACTION = "number in [0, 1] or list of numbers in [0, 1]"
+OPTIONAL_INSTANCE_FRACTION = "optional number in [0, 1] or list of numbers in [0, 1]"
+FLAG = "bool"
+TEXT = "string"
+COUNT = "non-negative integer"
+BLOCK = "block"
+BLOCKS = "list of blocks"
+RATES = "mapping of fault types to numbers"
+
+# Value range of the bounded number kinds.
+BOUNDS = {NON_NEGATIVE: (0.0, math.inf), FRACTION: (0.0, 1.0), OPTIONAL_FRACTION: (0.0, 1.0)}
+
+# Kinds that accept one value per instance: kind -> (kind of a single value, kind of a list item).
+INSTANCE_KINDS = {
+    INSTANCE_NON_NEGATIVE: (NON_NEGATIVE, NON_NEGATIVE),
+    INSTANCE_FRACTION: (FRACTION, FRACTION),
+    OPTIONAL_INSTANCE_FRACTION: (OPTIONAL_FRACTION, FRACTION),
+}
+
 
 class BlockFactory:
     """Factory class to reconstruct BlockInterface objects from dictionaries.
@@ -19,48 +54,510 @@ class BlockFactory:
     This factory handles the recursive instantiation of complex block trees
     and ensures that serialized data types (like strings) are converted
     back into internal types (like FaultType Enums).
+
+    Validation and construction happen in the same single pass over the data. Every
+    error is recorded with the path of the offending value (e.g.
+    ``$.sub_blocks[2].distribution_rates.SBE``) and all errors are reported together.
+
+    A configuration may also be a document with shared component definitions::
+
+        {
+            "definitions": {"channel": {"type": "PipelineBlock", "name": "Channel", "sub_blocks": [...]}},
+            "layout": {"type": "SumBlock", "name": "Root", "sub_blocks": [
+                {"ref": "channel"},
+                {"ref": "channel", "overrides": {"0/lambda_BE": 12.0}},
+            ]},
+        }
+
+    A reference can appear wherever a block is expected, including inside other
+    definitions. Its optional overrides are parameter paths relative to the referenced
+    block (see `ParameterOverrides`). Every definition is built once, and all references
+    with the same overrides share one block object. The shared blocks must therefore be
+    treated as immutable; `ParameterOverrides.apply` copies them on write.
+
+    Fault types beyond the built-in ones are declared in a ``fault_types`` list of the
+    document (e.g. ``{"fault_types": ["SBE_BANK_0", "SBE_BANK_1"], "layout": {...}}``)
+    and registered with `FaultType.register` before the layout is built. Undeclared
+    names are still reported as unknown fault types, so typos do not go unnoticed.
+
+    Per-instance values (lists for ``rate``, ``dc_rate_c_or_cR`` and ``dc_rate_latent_cL``)
+    are only accepted inside a ReplicateBlock and need one value per instance of the
+    innermost enclosing one (see `instance_errors`).
     """
 
+    # Keys of serialized blocks that hold fault type names.
+    _FAULT_KEYS = ("fault_type", "target_fault", "source_fault", "fault_to_split")
+
     _REGISTRY: dict[str, Type[BlockInterface]] = {
         "SumBlock": SumBlock,
         "PipelineBlock": PipelineBlock,
+        "ReplicateBlock": ReplicateBlock,
         "BasicEvent": BasicEvent,
         "CoverageBlock": CoverageBlock,
         "SplitBlock": SplitBlock,
         "TransformationBlock": TransformationBlock,
     }
 
+    # Parameters of each block type: name -> (kind, required).
+    _PARAMETERS: dict[str, dict[str, tuple[str, bool]]] = {
+        "SumBlock": {"name": (TEXT, True), "sub_blocks": (BLOCKS, True)},
+        "PipelineBlock": {"name": (TEXT, True), "sub_blocks": (BLOCKS, True)},
+        "ReplicateBlock": {"name": (TEXT, True), "child": (BLOCK, True), "count": (COUNT, True)},
+        "BasicEvent": {"fault_type": (FAULT, True), "rate": (INSTANCE_NON_NEGATIVE, True), "is_spfm": (FLAG, False)},
+        "CoverageBlock": {
+            "target_fault": (FAULT, True),
+            "dc_rate_c_or_cR": (INSTANCE_FRACTION, True),
+            "dc_rate_latent_cL": (OPTIONAL_INSTANCE_FRACTION, False),
+            "is_spfm": (FLAG, False),
+        },
+        "SplitBlock": {"name": (TEXT, True), "fault_to_split": (FAULT, True), "distribution_rates": (RATES, True), "is_spfm": (FLAG, False)},
+        "TransformationBlock": {"source_fault": (FAULT, True), "target_fault": (FAULT, True), "factor": (NON_NEGATIVE, True)},
+    }
+
     @staticmethod
     def from_dict(data: dict[str, Any]) -> BlockInterface:
         """Creates a block instance from a configuration dictionary.
 
         Args:
             data (dict[str, Any]): A dictionary containing the block
-                configuration. Must include a 'type' key.
+                configuration. Must include a 'type' key, or be a document with a
+                'layout' key and 'definitions' and/or 'fault_types' keys.
 
         Returns:
             BlockInterface: An initialized instance of the specified block.
 
         Raises:
-            ValueError: If the 'type' is unknown or required keys are missing.
+            ValueError: If the configuration is invalid. The message lists every error
+                together with its path.
+        """
+        errors: list[str] = []
+        definitions = None
+        path = "$"
+        if isinstance(data, dict) and ("definitions" in data or "fault_types" in data):
+            BlockFactory._declare(data.get("fault_types", []), errors)
+            if "definitions" in data:
+                definitions = _Definitions(data["definitions"])
+            data = data.get("layout")
+            path = "$.layout"
+        block = BlockFactory._build(data, path, errors, definitions)
+        if not errors:
+            errors = BlockFactory.instance_errors(block, path)
+        if errors:
+            if len(errors) == 1:
+                raise ValueError(f"Invalid configuration: {errors[0]}")
+            raise ValueError("Invalid configuration:\n" + "\n".join(f"  {error}" for error in errors))
+        return block
+
+    @staticmethod
+    def check_parameter(block_type: str, parameter: str, value: Any, path: str) -> Any:
+        """Checks a single parameter value of a block type and converts it, like `from_dict`.
+
+        Used by `ParameterOverrides` so that overridden values pass the same checks as
+        loaded ones. Child blocks and parameters of unregistered block types are not
+        checked.
+
+        Args:
+            block_type (str): The block type name (e.g. "BasicEvent").
+            parameter (str): The constructor parameter name (e.g. "rate").
+            value (Any): The new value.
+            path (str): The path of the value, used in the error message.
+
+        Returns:
+            Any: The converted value.
+
+        Raises:
+            ValueError: If the value is invalid for the parameter.
+        """
+        kind = BlockFactory._PARAMETERS.get(block_type, {}).get(parameter, (BLOCK, False))[0]
+        if kind in (BLOCK, BLOCKS):
+            return value
+        errors: list[str] = []
+        converted = BlockFactory._convert(value, kind, path, errors)
+        if errors:
+            raise ValueError(errors[0])
+        return converted
+
+    @staticmethod
+    def instance_errors(layout: BlockInterface, path: str = "$") -> list[str]:
+        """Checks that every per-instance value belongs to a ReplicateBlock that aggregates it.
+
+        An `InstanceArray` parameter must lie inside a ReplicateBlock and have one value
+        per instance of the innermost enclosing one. A ReplicateBlock whose own instances
+        differ must not contain a nested ReplicateBlock with per-instance values, because
+        the two sets of instances cannot be combined element-wise. Nested ReplicateBlocks
+        without per-instance values are fine: each of their instances contributes the
+        per-instance rates of the outer level in full.
+
+        Args:
+            layout (BlockInterface): The root block of the layout.
+            path (str): The path of the root block, used in the error messages.
+
+        Returns:
+            list[str]: The errors, each with the path of the offending value.
+        """
+        errors: list[str] = []
+        BlockFactory._check_instances(layout, path, None, errors, {})
+        return errors
+
+    @staticmethod
+    def _check_instances(block: BlockInterface, path: str, scope: Optional[list], errors: list[str], seen: dict[Optional[int], dict[int, bool]]) -> bool:
+        """Recursively checks the per-instance values below a block.
+
+        Args:
+            block (BlockInterface): The block to check.
+            path (str): The path of the block.
+            scope (Optional[list]): The innermost enclosing ReplicateBlock, its path, the
+                path of its first own per-instance value and of its first nested
+                ReplicateBlock with per-instance values; None outside any ReplicateBlock.
+            errors (list[str]): Collects the errors found so far.
+            seen (dict[Optional[int], dict[int, bool]]): The results of the blocks already
+                checked, per scope, so that shared blocks are checked once.
+
+        Returns:
+            bool: True if the block or one of its descendants has per-instance values.
+        """
+        checked = seen.setdefault(id(scope[0]) if scope else None, {})
+        if id(block) in checked:
+            return checked[id(block)]
+
+        found = False
+        if isinstance(block, FrozenBlock):
+            parameters = {block.argument(name): value for name, value in block.fields().items()}
+        else:
+            parameters = getattr(block, "__dict__", {})
+        for name, value in parameters.items():
+            if not isinstance(value, InstanceArray):
+                continue
+            found = True
+            if scope is None:
+                errors.append(f"{path}.{name}: per-instance values are only allowed inside a ReplicateBlock")
+                continue
+            replicate, replicate_path = scope[0], scope[1]
+            scope[2] = scope[2] or f"{path}.{name}"
+            if len(value) != replicate.count:
+                errors.append(f"{path}.{name}: expected {replicate.count} values, one per instance of ReplicateBlock '{replicate.name}' ({replicate_path}), got {len(value)}")
+
+        if isinstance(block, ReplicateBlock):
+            inner = [block, path, None, None]
+            if BlockFactory._check_instances(block.child, f"{path}.child", inner, errors, seen):
+                found = True
+                if scope is not None:
+                    scope[3] = scope[3] or path
+            if inner[2] and inner[3]:
+                errors.append(f"{inner[3]}: nested ReplicateBlock with per-instance values inside ReplicateBlock '{block.name}', which has per-instance values itself ({inner[2]})")
+        else:
+            for index, child in enumerate(ParameterOverrides.children(block)):
+                child_path = f"{path}.root_block" if isinstance(block, Base) else f"{path}.sub_blocks[{index}]"
+                found = BlockFactory._check_instances(child, child_path, scope, errors, seen) or found
+
+        checked[id(block)] = found
+        return found
+
+    @staticmethod
+    def _declare(fault_types: Any, errors: list[str]):
+        """Registers the fault types declared by a configuration document."""
+        if not isinstance(fault_types, list):
+            errors.append(f"$.fault_types: expected a list of fault type names, got {type(fault_types).__name__}")
+            return
+        for index, name in enumerate(fault_types):
+            try:
+                FaultType.register(name)
+            except ValueError as error:
+                errors.append(f"$.fault_types[{index}]: {error}")
+
+    @staticmethod
+    def declare_fault_types(data: dict[str, Any]) -> dict[str, Any]:
+        """Adds a ``fault_types`` declaration for the non-built-in fault types a configuration uses.
+
+        Args:
+            data (dict[str, Any]): A serialized layout or document.
+
+        Returns:
+            dict[str, Any]: The configuration unchanged if it only uses built-in fault types,
+            otherwise a document that declares the other ones before its layout.
         """
-        params = data.copy()
-        block_type = params.pop("type", None)
+        names: set[str] = set()
+        BlockFactory._collect_fault_names(data, names)
+        custom = sorted((FaultType[name] for name in names if name in FaultType.__members__), key=lambda fault: fault.index)
+        custom = [fault.name for fault in custom if not FaultType.is_builtin(fault)]
+        if not custom:
+            return data
+        if "layout" in data:
+            return {"fault_types": custom, **data}
+        return {"fault_types": custom, "layout": data}
 
+    @staticmethod
+    def _collect_fault_names(data: Any, names: set[str]):
+        """Recursively collects the fault type names used by a serialized configuration."""
+        if isinstance(data, list):
+            for item in data:
+                BlockFactory._collect_fault_names(item, names)
+        elif isinstance(data, dict):
+            for key, value in data.items():
+                if key in BlockFactory._FAULT_KEYS and isinstance(value, str):
+                    names.add(value)
+                elif key == "distribution_rates" and isinstance(value, dict):
+                    names.update(value)
+                else:
+                    BlockFactory._collect_fault_names(value, names)
+
+    @staticmethod
+    def _build(data: Any, path: str, errors: list[str], definitions: Optional["_Definitions"] = None) -> Optional[BlockInterface]:
+        """Validates one block dictionary and builds the block if it and its children are valid.
+
+        Args:
+            data (Any): The block dictionary.
+            path (str): The path of the dictionary within the configuration.
+            errors (list[str]): Collects the errors found so far.
+            definitions (Optional[_Definitions]): The shared definitions of the document, if any.
+
+        Returns:
+            Optional[BlockInterface]: The block, or None if an error was found.
+        """
+        if not isinstance(data, dict):
+            errors.append(f"{path}: expected a block mapping, got {type(data).__name__}")
+            return None
+
+        if "ref" in data:
+            if definitions is None:
+                errors.append(f"{path}: reference '{data['ref']}' used without a definitions section")
+                return None
+            return definitions.instantiate(data, path, errors)
+
+        block_type = data.get("type")
         if block_type not in BlockFactory._REGISTRY:
-            raise ValueError(f"Unknown block type: {block_type}")
+            errors.append(f"{path}: Unknown block type: {block_type}")
+            return None
+
+        parameters = BlockFactory._PARAMETERS[block_type]
+        error_count = len(errors)
+        kwargs = {}
+        for key, value in data.items():
+            if key == "type":
+                continue
+            if key not in parameters:
+                errors.append(f"{path}.{key}: unknown parameter for {block_type}")
+                continue
+            kwargs[key] = BlockFactory._convert(value, parameters[key][0], f"{path}.{key}", errors, definitions)
+
+        for key, (_, required) in parameters.items():
+            if required and key not in data:
+                errors.append(f"{path}: missing required parameter '{key}' for {block_type}")
+
+        if len(errors) > error_count:
+            return None
+        return BlockFactory._REGISTRY[block_type](**kwargs)
+
+    @staticmethod
+    def _convert(value: Any, kind: str, path: str, errors: list[str], definitions: Optional["_Definitions"] = None) -> Any:
+        """Checks a parameter value against its expected kind and converts it.
+
+        Args:
+            value (Any): The raw value from the configuration.
+            kind (str): The expected kind of value.
+            path (str): The path of the value within the configuration.
+            errors (list[str]): Collects the errors found so far.
+            definitions (Optional[_Definitions]): The shared definitions of the document, if any.
+
+        Returns:
+            Any: The converted value, or None if it is invalid.
+        """
+        if kind == BLOCK:
+            return BlockFactory._build(value, path, errors, definitions)
+
+        if kind == BLOCKS:
+            if not isinstance(value, list):
+                errors.append(f"{path}: expected a {kind}, got {type(value).__name__}")
+                return None
+            return [BlockFactory._build(item, f"{path}[{index}]", errors, definitions) for index, item in enumerate(value)]
+
+        if kind == FAULT:
+            fault = FaultType.__members__.get(value) if isinstance(value, str) else value if isinstance(value, FaultType) else None
+            if fault is None:
+                errors.append(f"{path}: unknown fault type {value!r}")
+            return fault
+
+        if kind == RATES:
+            if not isinstance(value, Mapping):
+                errors.append(f"{path}: expected a {kind}, got {type(value).__name__}")
+                return None
+            rates = {}
+            for fault_name, rate in value.items():
+                label = fault_name.name if isinstance(fault_name, FaultType) else fault_name
+                fault = BlockFactory._convert(fault_name, FAULT, f"{path}.{label}", errors)
+                rates[fault] = BlockFactory._convert(rate, NUMBER, f"{path}.{label}", errors)
+                if isinstance(rates[fault], (int, float)) and not 0.0 <= rates[fault] <= 1.0:
+                    errors.append(f"{path}.{label}: rate {rates[fault]} is outside [0, 1]")
+            if all(isinstance(rate, (int, float)) for rate in rates.values()) and sum(rates.values()) > 1.0 + 1e-9:
+                errors.append(f"{path}: sum of distribution rates ({sum(rates.values()):.4f}) must not exceed 1.0")
+            return rates
 
-        cls = BlockFactory._REGISTRY[block_type]
+        if kind in INSTANCE_KINDS:
+            value_kind, item_kind = INSTANCE_KINDS[kind]
+            if not isinstance(value, (list, InstanceArray)):
+                return BlockFactory._convert(value, value_kind, path, errors)
+            if not len(value):
+                errors.append(f"{path}: expected at least one instance value")
+                return None
+            error_count = len(errors)
+            values = [BlockFactory._convert(item, item_kind, f"{path}[{index}]", errors) for index, item in enumerate(value)]
+            return InstanceArray(values) if len(errors) == error_count else None
+
+        if kind == FLAG:
+            valid = isinstance(value, bool)
+        elif kind == TEXT:
+            valid = isinstance(value, str)
+        elif kind == COUNT:
+            valid = isinstance(value, int) and not isinstance(value, bool) and value >= 0
+        elif value is None:
+            valid = kind == OPTIONAL_FRACTION
+        else:
+            low, high = BOUNDS.get(kind, (-math.inf, math.inf))
+            valid = isinstance(value, (int, float)) and not isinstance(value, bool) and low <= value <= high
+        if not valid:
+            errors.append(f"{path}: expected {kind}, got {value!r}")
+        return value
+
+    @staticmethod
+    def deduplicate(data: dict[str, Any]) -> dict[str, Any]:
+        """Rewrites a serialized layout into a document with shared definitions.
+
+        Every container sub-tree (a block with sub-blocks, a child or a root block) that occurs more
+        than once is moved into the definitions section and replaced by references. The
+        outermost repeated sub-trees are extracted first; repeats nested inside them are
+        extracted from the definitions in turn.
+
+        Args:
+            data (dict[str, Any]): A serialized layout as produced by `to_dict`.
+
+        Returns:
+            dict[str, Any]: A document with 'definitions' and 'layout' keys that
+            `from_dict` turns back into an equivalent layout.
+        """
+        counts: Counter = Counter()
+        BlockFactory._count_subtrees(data, counts)
+
+        definitions: dict[str, dict[str, Any]] = {}
+        names: dict[str, str] = {}
+        layout = BlockFactory._extract(data, counts, definitions, names, is_root=True)
+        return {"definitions": definitions, "layout": layout}
+
+    @staticmethod
+    def _children_key(data: dict[str, Any]) -> Optional[str]:
+        """Returns the key holding the child blocks of a serialized container, if any."""
+        if isinstance(data.get("sub_blocks"), list):
+            return "sub_blocks"
+        for key in ("root_block", "child"):
+            if isinstance(data.get(key), dict):
+                return key
+        return None
+
+    @staticmethod
+    def _count_subtrees(data: dict[str, Any], counts: Counter) -> str:
+        """Counts every serialized container sub-tree by its canonical JSON form."""
+        children_key = BlockFactory._children_key(data)
+        if children_key == "sub_blocks":
+            for child in data["sub_blocks"]:
+                BlockFactory._count_subtrees(child, counts)
+        elif children_key is not None:
+            BlockFactory._count_subtrees(data[children_key], counts)
+
+        canonical = json.dumps(data, sort_keys=True)
+        if children_key is not None:
+            counts[canonical] += 1
+        return canonical
+
+    @staticmethod
+    def _extract(data: dict[str, Any], counts: Counter, definitions: dict, names: dict[str, str], is_root: bool = False) -> dict[str, Any]:
+        """Replaces repeated sub-trees by references and fills the definitions section."""
+        children_key = BlockFactory._children_key(data)
+        if children_key is None:
+            return data
+
+        canonical = json.dumps(data, sort_keys=True)
+        if not is_root and counts[canonical] > 1:
+            if canonical not in names:
+                base_name = str(data.get("name") or data["type"])
+                name = base_name
+                suffix = 2
+                while name in definitions:
+                    name = f"{base_name}_{suffix}"
+                    suffix += 1
+                names[canonical] = name
+                definitions[name] = None
+                definitions[name] = BlockFactory._extract(data, counts, definitions, names, is_root=True)
+            return {"ref": names[canonical]}
+
+        result = dict(data)
+        if children_key == "sub_blocks":
+            result["sub_blocks"] = [BlockFactory._extract(child, counts, definitions, names) for child in data["sub_blocks"]]
+        else:
+            result[children_key] = BlockFactory._extract(data[children_key], counts, definitions, names)
+        return result
+
+
+class _Definitions:
+    """Builds the shared definitions of a configuration document on first reference."""
+
+    def __init__(self, raw: Any):
+        """Initializes the table.
+
+        Args:
+            raw (Any): The 'definitions' section of the document.
+        """
+        self.raw = raw if isinstance(raw, dict) else {}
+        self.valid = isinstance(raw, dict)
+        self.instances: dict[tuple[str, str], Optional[BlockInterface]] = {}
+        self.resolving: set[str] = set()
+
+    def instantiate(self, data: dict[str, Any], path: str, errors: list[str]) -> Optional[BlockInterface]:
+        """Returns the shared block for a reference, building it on first use.
+
+        Args:
+            data (dict[str, Any]): The reference with a 'ref' and optional 'overrides' key.
+            path (str): The path of the reference within the configuration.
+            errors (list[str]): Collects the errors found so far.
+
+        Returns:
+            Optional[BlockInterface]: The shared block, or None if an error was found.
+        """
+        if not self.valid:
+            errors.append("$.definitions: expected a mapping of definition names to blocks")
+            self.valid = True
+            return None
 
-        if "sub_blocks" in params:
-            params["sub_blocks"] = [BlockFactory.from_dict(b) for b in params["sub_blocks"]]
+        name = data["ref"]
+        overrides = data.get("overrides") or {}
+        unknown_keys = set(data) - {"ref", "overrides"}
+        if unknown_keys:
+            errors.append(f"{path}: unknown reference keys {sorted(unknown_keys)}")
+            return None
+        if name not in self.raw:
+            errors.append(f"{path}: unknown definition '{name}'")
+            return None
+        if not isinstance(overrides, dict):
+            errors.append(f"{path}.overrides: expected a mapping of parameter paths to values")
+            return None
 
-        fault_keys = ["fault_type", "target_fault", "source_fault", "fault_to_split"]
-        for key in fault_keys:
-            if key in params and isinstance(params[key], str):
-                params[key] = FaultType[params[key]]
+        instance_key = (name, json.dumps(overrides, sort_keys=True))
+        if instance_key in self.instances:
+            return self.instances[instance_key]
 
-        if "distribution_rates" in params:
-            params["distribution_rates"] = {FaultType[k]: v for k, v in params["distribution_rates"].items()}
+        base_key = (name, "{}")
+        if base_key not in self.instances:
+            if name in self.resolving:
+                errors.append(f"{path}: definition '{name}' references itself")
+                return None
+            self.resolving.add(name)
+            self.instances[base_key] = BlockFactory._build(self.raw[name], f"$.definitions.{name}", errors, self)
+            self.resolving.discard(name)
 
-        return cls(**params)
+        block = self.instances[base_key]
+        if block is not None and overrides:
+            try:
+                block = ParameterOverrides.apply(block, overrides)
+            except ValueError as error:
+                errors.append(f"{path}.overrides: {error}")
+                block = None
+        self.instances[instance_key] = block
+        return block
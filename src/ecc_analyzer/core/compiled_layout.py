@@ -0,0 +1,289 @@
+"""Compiles block trees into sparse or dense affine operators on the fault rate state."""
+
+# Copyright (c) 2025 Linus Held. All rights reserved.
+
+from array import array
+from collections.abc import Iterable
+from typing import Any
+
+from ..interfaces import BlockInterface, FaultType
+from .base import Base
+from .basic_event import BasicEvent
+from .coverage_block import CoverageBlock
+from .instance_array import InstanceArray
+from .pipeline_block import PipelineBlock
+from .replicate_block import ReplicateBlock
+from .split_block import SplitBlock
+from .sum_block import SumBlock
+from .transformation_block import TransformationBlock
+
+# Evaluation modes of `CompiledLayout`.
+AUTO = "auto"
+SPARSE = "sparse"
+DENSE = "dense"
+MODES = (AUTO, SPARSE, DENSE)
+
+Row = dict[int, float]
+
+
+def _key(fault: FaultType, is_spfm: bool) -> int:
+    """Returns the position of a fault type's SPFM or LFM rate in the state vector."""
+    return 2 * fault.index + (0 if is_spfm else 1)
+
+
+class _Operator:
+    """Affine map ``x -> A x + b`` on the state vector, stored sparsely.
+
+    Only the rows of ``A`` that differ from the identity are stored, each as a mapping of
+    column to coefficient, so the size depends on the fault interactions of the blocks
+    and not on the number of fault types.
+    """
+
+    __slots__ = ("rows", "offset")
+
+    def __init__(self, rows: dict[int, Row], offset: Row):
+        self.rows = rows
+        self.offset = offset
+        for key in [key for key, row in rows.items() if row == {key: 1.0}]:
+            del rows[key]
+
+    def row(self, key: int) -> Row:
+        """Returns a row of ``A`` including the implicit identity rows."""
+        row = self.rows.get(key)
+        return {key: 1.0} if row is None else row
+
+    def then(self, other: "_Operator") -> "_Operator":
+        """Extends this operator in place by applying `other` afterwards and returns it."""
+        rows: dict[int, Row] = {}
+        for key, row in other.rows.items():
+            combined: Row = {}
+            for column, weight in row.items():
+                for inner, value in self.row(column).items():
+                    combined[inner] = combined.get(inner, 0.0) + weight * value
+            rows[key] = {column: value for column, value in combined.items() if value != 0.0}
+
+        offset: Row = {}
+        for key, row in other.rows.items():
+            offset[key] = sum(weight * self.offset.get(column, 0.0) for column, weight in row.items())
+        for key, value in other.offset.items():
+            offset[key] = offset.get(key, self.offset.get(key, 0.0)) + value
+
+        for key, row in rows.items():
+            if row == {key: 1.0}:
+                self.rows.pop(key, None)
+            else:
+                self.rows[key] = row
+        for key, value in offset.items():
+            if value != 0.0:
+                self.offset[key] = value
+            else:
+                self.offset.pop(key, None)
+        return self
+
+    @staticmethod
+    def combine(operators: list["_Operator"], weights: list[float]) -> "_Operator":
+        """Returns ``I + Σ w_i (A_i - I)`` with offset ``Σ w_i b_i`` (SumBlock / ReplicateBlock)."""
+        rows: dict[int, Row] = {}
+        for key in {key for operator in operators for key in operator.rows}:
+            row: Row = {key: 1.0}
+            for operator, weight in zip(operators, weights):
+                for column, value in operator.row(key).items():
+                    row[column] = row.get(column, 0.0) + weight * value
+                row[key] -= weight
+            rows[key] = {column: value for column, value in row.items() if value != 0.0}
+
+        offset: Row = {}
+        for operator, weight in zip(operators, weights):
+            for key, value in operator.offset.items():
+                offset[key] = offset.get(key, 0.0) + weight * value
+        return _Operator(rows, offset)
+
+    @staticmethod
+    def identity() -> "_Operator":
+        return _Operator({}, {})
+
+
+def _number(value: Any, block: BlockInterface) -> float:
+    """Returns a scalar parameter, rejecting per-instance arrays."""
+    if isinstance(value, InstanceArray):
+        raise ValueError(f"{type(block).__name__} with per-instance parameters cannot be compiled.")
+    return value
+
+
+def _compile(block: BlockInterface) -> _Operator:
+    """Translates a block tree into its affine operator."""
+    if isinstance(block, BasicEvent):
+        return _Operator({}, {_key(block.fault_type, block.is_spfm): _number(block.lambda_BE, block)})
+
+    if isinstance(block, CoverageBlock):
+        spfm = _key(block.target_fault, True)
+        lfm = _key(block.target_fault, False)
+        c_r = _number(block.c_R, block)
+        if block.is_spfm:
+            c_l = _number(block.c_L, block)
+            return _Operator({spfm: {spfm: 1.0 - c_r}, lfm: {lfm: 1.0, spfm: 1.0 - c_l}}, {})
+        return _Operator({lfm: {lfm: 1.0 - c_r}}, {})
+
+    if isinstance(block, SplitBlock):
+        source = _key(block.fault_to_split, block.is_spfm)
+        rows: dict[int, Row] = {source: {}}
+        for target_fault, probability in block.distribution_rates.items():
+            target = _key(target_fault, block.is_spfm)
+            row = rows.setdefault(target, {target: 1.0}) if target != source else rows[source]
+            row[source] = row.get(source, 0.0) + probability
+        return _Operator(rows, {})
+
+    if isinstance(block, TransformationBlock):
+        source = _key(block.source, True)
+        target = _key(block.target, True)
+        row = {target: 1.0}
+        row[source] = row.get(source, 0.0) + block.factor
+        return _Operator({target: row}, {})
+
+    if isinstance(block, PipelineBlock):
+        operator = _Operator.identity()
+        for sub_block in block.sub_blocks:
+            operator = operator.then(_compile(sub_block))
+        return operator
+
+    if isinstance(block, ReplicateBlock):
+        return _Operator.combine([_compile(block.child)], [block.count])
+
+    if isinstance(block, SumBlock):
+        return _Operator.combine([_compile(sub_block) for sub_block in block.sub_blocks], [1.0] * len(block.sub_blocks))
+
+    if isinstance(block, Base):
+        return _compile(block.root_block) if block.root_block is not None else _Operator.identity()
+
+    raise ValueError(f"Block type '{type(block).__name__}' cannot be compiled.")
+
+
+class CompiledLayout(BlockInterface):
+    """A block tree compiled into one affine operator on the fault rate state.
+
+    Every block of the model is affine in the rates: basic events add constants, and
+    coverages, splits and transformations are linear updates that touch only a few
+    fault types. Pipelines compose these updates and sum blocks add their deltas, so a
+    whole layout reduces to ``x -> A x + b`` on the state vector holding the SPFM and
+    LFM rate of every fault type (indexed by `FaultType.index`).
+
+    The operator is stored either sparsely, as the rows of ``A`` that differ from the
+    identity in CSR form (``row_keys``, ``indptr``, ``indices``, ``data``), or densely as
+    a full matrix. In "auto" mode the dense form is chosen only for small, densely
+    coupled models (see `MAX_DENSE_DIMENSION` and `DENSE_DENSITY`); otherwise memory and
+    evaluation time scale with the number of fault interactions, not with the square of
+    the number of fault types.
+
+    The compiled layout evaluates like the original one, except that fault types whose
+    rate is zero are omitted from the results. It reflects the parameters at compile
+    time; compile again after changing the model.
+
+    Example:
+        compiled = CompiledLayout(system.system_layout)
+        spfm, lfm = compiled.compute_fit({}, {})
+    """
+
+    MAX_DENSE_DIMENSION = 64
+    DENSE_DENSITY = 0.25
+
+    def __init__(self, layout: BlockInterface, mode: str = AUTO):
+        """Compiles a layout.
+
+        Args:
+            layout (BlockInterface): The root block of the layout.
+            mode (str): "sparse", "dense" or "auto" (choose from the model statistics).
+
+        Raises:
+            ValueError: If the mode is unknown or the layout contains a block that cannot
+                be compiled (e.g. one with per-instance parameters).
+        """
+        if mode not in MODES:
+            raise ValueError(f"Unknown mode '{mode}', expected one of {MODES}.")
+        self.layout = layout
+        operator = _compile(layout)
+
+        keys = set(operator.offset) | set(operator.rows)
+        for row in operator.rows.values():
+            keys.update(row)
+        self.dimension = max(keys) + 1 if keys else 0
+        self.nnz = sum(len(row) for row in operator.rows.values())
+        if mode == AUTO:
+            dense = 0 < self.dimension <= self.MAX_DENSE_DIMENSION and self.density >= self.DENSE_DENSITY
+            mode = DENSE if dense else SPARSE
+        self.mode = mode
+
+        self.offset_keys = array("q", sorted(operator.offset))
+        self.offset_values = array("d", (operator.offset[key] for key in self.offset_keys))
+        if mode == SPARSE:
+            self.row_keys = array("q", sorted(operator.rows))
+            self.indptr = array("q", [0])
+            self.indices = array("q")
+            self.data = array("d")
+            for key in self.row_keys:
+                row = operator.rows[key]
+                self.indices.extend(sorted(row))
+                self.data.extend(row[column] for column in sorted(row))
+                self.indptr.append(len(self.indices))
+        else:
+            self.matrix = [array("d", bytes(8 * self.dimension)) for _ in range(self.dimension)]
+            for key in range(self.dimension):
+                for column, value in operator.row(key).items():
+                    self.matrix[key][column] = value
+
+    @property
+    def density(self) -> float:
+        """The share of non-zero coefficients among the ``dimension²`` entries of a dense matrix."""
+        return self.nnz / (self.dimension * self.dimension) if self.dimension else 0.0
+
+    def statistics(self) -> dict[str, Any]:
+        """Returns the model statistics the evaluation mode is chosen from.
+
+        Returns:
+            dict[str, Any]: The mode, the state dimension, the stored coefficients (nnz),
+            the density and the number of constant offsets.
+        """
+        return {"mode": self.mode, "dimension": self.dimension, "nnz": self.nnz, "density": self.density, "offsets": len(self.offset_keys)}
+
+    def compute_fit(self, spfm_rates: dict[FaultType, float], lfm_rates: dict[FaultType, float]) -> tuple[dict[FaultType, float], dict[FaultType, float]]:
+        """Applies the compiled operator to the input rates.
+
+        Args:
+            spfm_rates (dict[FaultType, float]): Current residual failure rates (Input state).
+            lfm_rates (dict[FaultType, float]): Current latent failure rates (Input state).
+
+        Returns:
+            tuple[dict[FaultType, float], dict[FaultType, float]]: A tuple containing:
+                - Final SPFM rates (non-zero entries only).
+                - Final LFM rates (non-zero entries only).
+        """
+        state = {_key(fault, True): rate for fault, rate in spfm_rates.items()}
+        state.update((_key(fault, False), rate) for fault, rate in lfm_rates.items())
+        result = dict(state)
+
+        if self.mode == SPARSE:
+            indptr, indices, data = self.indptr, self.indices, self.data
+            for position, key in enumerate(self.row_keys):
+                result[key] = sum(data[k] * state.get(indices[k], 0.0) for k in range(indptr[position], indptr[position + 1]))
+        else:
+            vector = [state.get(key, 0.0) for key in range(self.dimension)]
+            for key, row in enumerate(self.matrix):
+                result[key] = sum(value * rate for value, rate in zip(row, vector) if value)
+
+        for key, value in zip(self.offset_keys, self.offset_values):
+            result[key] = result.get(key, 0.0) + value
+        return self._split(result.items())
+
+    @staticmethod
+    def _split(state: Iterable[tuple[int, float]]) -> tuple[dict[FaultType, float], dict[FaultType, float]]:
+        """Converts state vector entries back into SPFM and LFM rate dictionaries."""
+        fault = FaultType.by_index
+        spfm: dict[FaultType, float] = {}
+        lfm: dict[FaultType, float] = {}
+        for key, rate in state:
+            if rate != 0.0:
+                (lfm if key & 1 else spfm)[fault(key >> 1)] = rate
+        return spfm, lfm
+
+    def to_dict(self) -> dict:
+        """Serializes the source layout; the compiled form is rebuilt on load."""
+        return self.layout.to_dict()
@@ -2,44 +2,59 @@
 
 # Copyright (c) 2025 Linus Held. All rights reserved.
 
-from typing import Optional
+from typing import Any, Optional, Union
 
-from ..interfaces import BlockInterface, FaultType
+from ..interfaces import FaultType
+from .frozen_block import FrozenBlock
+from .instance_array import InstanceArray
 
 
-class CoverageBlock(BlockInterface):
+class CoverageBlock(FrozenBlock):
     """Applies diagnostic coverage (DC) to a fault type.
 
     Splits FIT rates into residual and latent components based on the defined
-    coverage values (c_R, c_L).
+    coverage values (c_R, c_L). If c_L is not given, it follows c_R (``c_L_derived``),
+    also when c_R is later overridden.
     """
 
+    __slots__ = ("target_fault", "is_spfm", "c_R", "c_L", "c_L_derived")
+
+    _ARGUMENTS = {"c_R": "dc_rate_c_or_cR", "c_L": "dc_rate_latent_cL"}
+
     def __init__(
         self,
         target_fault: FaultType,
-        dc_rate_c_or_cR: float,
-        dc_rate_latent_cL: Optional[float] = None,
+        dc_rate_c_or_cR: Union[float, InstanceArray],
+        dc_rate_latent_cL: Optional[Union[float, InstanceArray]] = None,
         is_spfm: bool = True,
     ):
         """Initializes the CoverageBlock with specific diagnostic coverage parameters.
 
         Args:
             target_fault (FaultType): The fault type (Enum) to which coverage is applied.
-            dc_rate_c_or_cR (float): The diagnostic coverage for residual faults
-                (typically denoted as K_DC or c_R).
-            dc_rate_latent_cL (Optional[float]): Optional specific coverage for latent
-                faults (c_L). If None, standard ISO 26262 logic (1 - c_R) is assumed.
+            dc_rate_c_or_cR (Union[float, InstanceArray]): The diagnostic coverage for residual
+                faults (typically denoted as K_DC or c_R), or one value per instance.
+            dc_rate_latent_cL (Optional[Union[float, InstanceArray]]): Optional specific coverage
+                for latent faults (c_L). If None, standard ISO 26262 logic (1 - c_R) is assumed.
             is_spfm (bool, optional): Indicates if this block processes the SPFM/residual
                 path. Defaults to True.
         """
-        self.target_fault = target_fault
-        self.is_spfm = is_spfm
-        if dc_rate_latent_cL is not None:
-            self.c_R = dc_rate_c_or_cR
-            self.c_L = dc_rate_latent_cL
-        else:
-            self.c_R = dc_rate_c_or_cR
-            self.c_L = 1.0 - dc_rate_c_or_cR
+        c_L_derived = dc_rate_latent_cL is None
+        c_L = 1.0 - dc_rate_c_or_cR if c_L_derived else dc_rate_latent_cL
+        self._init(target_fault=target_fault, is_spfm=is_spfm, c_R=dc_rate_c_or_cR, c_L=c_L, c_L_derived=c_L_derived)
+
+    def arguments(self, **changes: Any) -> dict[str, Any]:
+        """Returns the constructor arguments, leaving a derived c_L to be derived again.
+
+        A derived c_L stays derived unless c_L itself is changed, so that a new c_R
+        also updates c_L.
+        """
+        derived = changes.pop("c_L_derived", self.c_L_derived) and "c_L" not in changes
+        arguments = super().arguments(**changes)
+        del arguments["c_L_derived"]
+        if derived:
+            arguments["dc_rate_latent_cL"] = None
+        return arguments
 
     def compute_fit(self, spfm_rates: dict[FaultType, float], lfm_rates: dict[FaultType, float]) -> tuple[dict[FaultType, float], dict[FaultType, float]]:
         """Transforms the input fault rate dictionaries by applying diagnostic coverage logic.
@@ -60,16 +75,16 @@ class CoverageBlock(BlockInterface):
             if self.target_fault in new_spfm:
                 lambda_in = new_spfm.pop(self.target_fault)
                 lambda_rf = lambda_in * (1.0 - self.c_R)
-                if lambda_rf > 0:
+                if InstanceArray.any_positive(lambda_rf):
                     new_spfm[self.target_fault] = new_spfm.get(self.target_fault, 0.0) + lambda_rf
                 lambda_mpf_l = lambda_in * (1.0 - self.c_L)
-                if lambda_mpf_l > 0:
+                if InstanceArray.any_positive(lambda_mpf_l):
                     new_lfm[self.target_fault] = new_lfm.get(self.target_fault, 0.0) + lambda_mpf_l
         else:
             if self.target_fault in new_lfm:
                 lambda_in = new_lfm.pop(self.target_fault)
                 lambda_rem = lambda_in * (1.0 - self.c_R)
-                if lambda_rem > 0:
+                if InstanceArray.any_positive(lambda_rem):
                     new_lfm[self.target_fault] = lambda_rem
 
         return new_spfm, new_lfm
@@ -82,4 +97,10 @@ class CoverageBlock(BlockInterface):
                 needed to reconstruct this CoverageBlock via the BlockFactory.
         """
 
-        return {"type": "CoverageBlock", "target_fault": self.target_fault.name, "dc_rate_c_or_cR": self.c_R, "dc_rate_latent_cL": self.c_L, "is_spfm": self.is_spfm}
+        return {
+            "type": "CoverageBlock",
+            "target_fault": self.target_fault.name,
+            "dc_rate_c_or_cR": InstanceArray.serialize(self.c_R),
+            "dc_rate_latent_cL": None if self.c_L_derived else InstanceArray.serialize(self.c_L),
+            "is_spfm": self.is_spfm,
+        }
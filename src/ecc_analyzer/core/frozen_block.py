@@ -0,0 +1,172 @@
+"""Immutable, slotted base class for the logic blocks."""
+
+# Copyright (c) 2025 Linus Held. All rights reserved.
+
+import sys
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any
+
+from ..interfaces import BlockInterface, FaultType
+from .instance_array import InstanceArray
+
+# Upper bound for the table of shared distribution maps, so that long-running processes
+# building many differently parameterized models do not grow it without limit.
+MAX_SHARED_RATES = 4096
+
+_SHARED_RATES: dict[tuple, Mapping[FaultType, float]] = {}
+
+
+def share_rates(rates: Mapping[FaultType, float]) -> Mapping[FaultType, float]:
+    """Returns a read-only distribution map shared by all blocks with equal rates.
+
+    Args:
+        rates (Mapping[FaultType, float]): The distribution rates.
+
+    Returns:
+        Mapping[FaultType, float]: A read-only view with the same items, in the same order.
+    """
+    key = tuple(rates.items())
+    shared = _SHARED_RATES.get(key)
+    if shared is None:
+        shared = MappingProxyType(dict(rates))
+        if len(_SHARED_RATES) < MAX_SHARED_RATES:
+            _SHARED_RATES[key] = shared
+    return shared
+
+
+def _hashable(value: Any) -> Any:
+    """Converts a parameter value into a hashable form for value comparisons."""
+    if isinstance(value, InstanceArray):
+        return (InstanceArray, tuple(value))
+    if isinstance(value, Mapping):
+        return tuple(value.items())
+    return value
+
+
+def _rebuild(cls: type, values: tuple) -> "FrozenBlock":
+    """Recreates a block from its field values (used by pickle and copy)."""
+    block = object.__new__(cls)
+    block._init(**dict(zip(cls._FIELDS, values)))
+    return block
+
+
+class FrozenBlock(BlockInterface):
+    """Base class of the immutable logic blocks.
+
+    Subclasses list their parameters in ``__slots__``, so instances carry no per-instance
+    ``__dict__``, and set them once in ``__init__`` through `_init`. Afterwards the
+    attributes cannot be assigned; `replace` (used by `ParameterOverrides`) returns a
+    modified copy instead. Child blocks are stored as tuples, names are interned and
+    equal distribution maps are shared between blocks (see `share_rates`).
+
+    `replace` builds the copy through the constructor of the block, so derived values
+    are recomputed and the constructor checks apply to the new values. Subclasses whose
+    constructor arguments are named differently from their fields list them in
+    ``_ARGUMENTS``.
+
+    Numeric parameters stay in the slots instead of shared typed arrays. A float
+    object costs more than a packed array entry, but an array would add a reference per
+    block and array bookkeeping to `replace`, pickling and every `compute_fit`. The
+    packed form is kept where evaluation is hot: `CompiledLayout` stores all
+    parameters in contiguous arrays.
+
+    Blocks compare and hash by value (type, parameters and children), so equal
+    sub-trees can serve as memoization keys. The hash is computed on first use only.
+    """
+
+    __slots__ = ("_hash",)
+
+    _FIELDS: tuple[str, ...] = ()
+
+    # Constructor argument of each field whose name differs from it.
+    _ARGUMENTS: dict[str, str] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._FIELDS = tuple(slot for klass in reversed(cls.__mro__) for slot in klass.__dict__.get("__slots__", ()) if slot != "_hash")
+
+    def _init(self, **values: Any):
+        """Sets the fields of a new block, normalizing children, names and rate maps."""
+        for name, value in values.items():
+            if name == "sub_blocks":
+                value = tuple(value)
+            elif name == "name" and type(value) is str:
+                value = sys.intern(value)
+            elif name == "distribution_rates":
+                value = share_rates(value)
+            object.__setattr__(self, name, value)
+        object.__setattr__(self, "_hash", None)
+
+    def __setattr__(self, name: str, value: Any):
+        raise AttributeError(f"{type(self).__name__} is immutable; use replace() or ParameterOverrides.apply().")
+
+    def __delattr__(self, name: str):
+        raise AttributeError(f"{type(self).__name__} is immutable.")
+
+    def fields(self) -> dict[str, Any]:
+        """Returns the parameters and children of the block in declaration order.
+
+        Returns:
+            dict[str, Any]: Mapping of field names to their values.
+        """
+        return {name: getattr(self, name) for name in self._FIELDS}
+
+    @classmethod
+    def argument(cls, field: str) -> str:
+        """Returns the name of the constructor argument that sets a field.
+
+        Args:
+            field (str): The field name.
+
+        Returns:
+            str: The constructor argument name.
+        """
+        return cls._ARGUMENTS.get(field, field)
+
+    def arguments(self, **changes: Any) -> dict[str, Any]:
+        """Returns the constructor arguments that build the block with some fields replaced.
+
+        Args:
+            **changes (Any): The new field values.
+
+        Returns:
+            dict[str, Any]: The keyword arguments for the constructor.
+        """
+        return {self.argument(name): value for name, value in {**self.fields(), **changes}.items()}
+
+    def replace(self, **changes: Any) -> "FrozenBlock":
+        """Creates a copy of the block with some fields replaced.
+
+        The copy is built through the constructor, so it is checked like a new block.
+
+        Args:
+            **changes (Any): The new field values.
+
+        Returns:
+            FrozenBlock: The modified copy.
+
+        Raises:
+            ValueError: If a name is not a field of the block or the constructor rejects
+                the new values.
+        """
+        unknown = set(changes) - set(self._FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown parameter '{sorted(unknown)[0]}' on block '{getattr(self, 'name', type(self).__name__)}'.")
+        return type(self)(**self.arguments(**changes))
+
+    def __eq__(self, other: Any) -> bool:
+        if self is other:
+            return True
+        if type(other) is not type(self):
+            return NotImplemented
+        return hash(self) == hash(other) and all(_hashable(getattr(self, name)) == _hashable(getattr(other, name)) for name in self._FIELDS)
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            object.__setattr__(self, "_hash", hash((type(self), *(_hashable(getattr(self, name)) for name in self._FIELDS))))
+        return self._hash
+
+    def __reduce__(self):
+        values = tuple(dict(value) if isinstance(value, MappingProxyType) else value for value in self.fields().values())
+        return (_rebuild, (type(self), values))
@@ -0,0 +1,126 @@
+"""Per-instance parameter and rate values that broadcast through the block math."""
+
+# Copyright (c) 2025 Linus Held. All rights reserved.
+
+from array import array
+from collections.abc import Iterable
+from typing import Any, Callable, Union
+
+Number = Union[int, float]
+
+
+class InstanceArray:
+    """A vector of float values, one per instance of a replicated block.
+
+    Block parameters such as `BasicEvent.lambda_BE`, `CoverageBlock.c_R` and
+    `CoverageBlock.c_L` may hold an InstanceArray instead of a number. The blocks'
+    arithmetic then broadcasts element-wise (arrays with arrays of the same length,
+    arrays with numbers), so heterogeneous instances (e.g. per-bank FIT rates) are
+    evaluated in one pass over a single tree. The rates are reduced to plain numbers
+    at an explicit aggregation point, the enclosing `ReplicateBlock`, which sums the
+    per-instance contributions. `BlockFactory` only accepts arrays inside a
+    ReplicateBlock, with one value per instance of the innermost enclosing one.
+
+    Arrays have no ordering; use `any_positive` where a block checks whether a rate
+    contributes. Equality compares every element.
+    """
+
+    __slots__ = ("values",)
+    __hash__ = None  # type: ignore[assignment]
+
+    def __init__(self, values: Iterable[Number]):
+        """Initializes the array.
+
+        Args:
+            values (Iterable[Number]): The per-instance values.
+
+        Raises:
+            ValueError: If there are no values.
+        """
+        self.values = array("d", values)
+        if not self.values:
+            raise ValueError("An instance array needs at least one value.")
+
+    def __len__(self) -> int:
+        """Returns the number of instances."""
+        return len(self.values)
+
+    def __iter__(self):
+        return iter(self.values)
+
+    def __getitem__(self, index: int) -> float:
+        return self.values[index]
+
+    def __repr__(self) -> str:
+        return f"InstanceArray({self.values.tolist()})"
+
+    def __format__(self, spec: str) -> str:
+        """Formats the range of the values, e.g. ``0.50–2.00`` in diagram labels."""
+        low, high = min(self.values), max(self.values)
+        if low == high:
+            return format(low, spec)
+        return f"{format(low, spec)}–{format(high, spec)}"
+
+    def total(self) -> float:
+        """Returns the sum over all instances."""
+        return sum(self.values)
+
+    def tolist(self) -> list[float]:
+        """Returns the values as a list, e.g. for serialization."""
+        return self.values.tolist()
+
+    def _broadcast(self, other: Any, operation: Callable[[float, float], float]) -> "InstanceArray":
+        """Applies a binary operation element-wise, broadcasting numbers over all instances.
+
+        Raises:
+            ValueError: If two arrays have different lengths.
+        """
+        if isinstance(other, InstanceArray):
+            if len(other) != len(self):
+                raise ValueError(f"Instance arrays of length {len(self)} and {len(other)} cannot be combined.")
+            return InstanceArray(map(operation, self.values, other.values))
+        return InstanceArray([operation(value, other) for value in self.values])
+
+    def __add__(self, other: Any) -> "InstanceArray":
+        return self._broadcast(other, float.__add__)
+
+    def __radd__(self, other: Any) -> "InstanceArray":
+        return self._broadcast(other, float.__add__)
+
+    def __sub__(self, other: Any) -> "InstanceArray":
+        return self._broadcast(other, float.__sub__)
+
+    def __rsub__(self, other: Any) -> "InstanceArray":
+        return self._broadcast(other, float.__rsub__)
+
+    def __mul__(self, other: Any) -> "InstanceArray":
+        return self._broadcast(other, float.__mul__)
+
+    def __rmul__(self, other: Any) -> "InstanceArray":
+        return self._broadcast(other, float.__mul__)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, InstanceArray):
+            return self.values == other.values
+        if isinstance(other, (int, float)):
+            return all(value == other for value in self.values)
+        return NotImplemented
+
+    @staticmethod
+    def any_positive(value: Union[Number, "InstanceArray"]) -> bool:
+        """Returns whether a rate contributes: a positive number, or an array with a positive value.
+
+        Args:
+            value (Union[Number, InstanceArray]): The rate.
+
+        Returns:
+            bool: True if the number or any instance value is greater than zero.
+        """
+        if isinstance(value, InstanceArray):
+            return any(item > 0 for item in value.values)
+        return value > 0
+
+    @staticmethod
+    def serialize(value: Any) -> Any:
+        """Returns the configuration form of a parameter value (a list for arrays)."""
+        return value.tolist() if isinstance(value, InstanceArray) else value
@@ -0,0 +1,190 @@
+"""Evaluates independent heavy SumBlock children of a layout in a worker pool."""
+
+# Copyright (c) 2025 Linus Held. All rights reserved.
+
+import os
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Optional
+
+from ..interfaces import BlockInterface, FaultType
+from .base import Base
+from .parameter_overrides import ParameterOverrides
+from .pipeline_block import PipelineBlock
+from .sum_block import SumBlock
+
+# Worker pool kinds of `ParallelLayout`.
+PROCESS = "process"
+THREAD = "thread"
+EXECUTORS = (PROCESS, THREAD)
+
+Path = tuple[int, ...]
+Rates = tuple[dict[FaultType, float], dict[FaultType, float]]
+
+_WORKER_LAYOUT: Optional[BlockInterface] = None
+
+
+def _init_worker(layout: BlockInterface):
+    """Receives the layout once per worker process."""
+    global _WORKER_LAYOUT
+    _WORKER_LAYOUT = layout
+
+
+def _evaluate_path(path: Path, spfm_rates: dict[FaultType, float], lfm_rates: dict[FaultType, float]) -> Rates:
+    """Evaluates the sub-tree at a child index path of the worker's layout."""
+    block = _WORKER_LAYOUT
+    for index in path:
+        block = ParameterOverrides.children(block)[index]
+    return block.compute_fit(spfm_rates, lfm_rates)
+
+
+def block_cost(block: BlockInterface, memo: Optional[dict[int, int]] = None) -> int:
+    """Estimates the evaluation cost of a sub-tree as the number of block evaluations.
+
+    A ReplicateBlock evaluates its child once, so it counts like a container with one
+    child.
+
+    Args:
+        block (BlockInterface): The root of the sub-tree.
+        memo (Optional[dict[int, int]]): Costs of already visited blocks, by object id.
+
+    Returns:
+        int: The estimated cost.
+    """
+    if memo is None:
+        memo = {}
+    cost = memo.get(id(block))
+    if cost is None:
+        cost = 1 + sum(block_cost(child, memo) for child in ParameterOverrides.children(block))
+        memo[id(block)] = cost
+    return cost
+
+
+class ParallelLayout(BlockInterface):
+    """A layout whose heavy, independent SumBlock children are evaluated in a worker pool.
+
+    The children of a SumBlock all start from the same input state, so they can be
+    evaluated concurrently. A cost model (`block_cost`, the number of block evaluations
+    of a sub-tree) selects the children worth offloading: those costing at least
+    `min_cost`, if a SumBlock has two or more of them. Lighter children are evaluated
+    in the calling thread in the meantime, and sum blocks with a single heavy child are
+    searched further down (through pipelines and components) for parallel work. The
+    results are merged with `SumBlock.merge` in child order, so the rates are identical
+    to a sequential evaluation.
+
+    With the default process pool each worker receives the layout once and tasks only
+    carry the child position and the input rates. A thread pool avoids that start-up
+    cost but only runs in parallel on free-threaded CPython builds.
+
+    The plan reflects the layout at construction; create a new ParallelLayout after
+    changing the model.
+
+    Example:
+        with ParallelLayout(system.system_layout) as layout:
+            spfm, lfm = layout.compute_fit({}, {})
+    """
+
+    DEFAULT_MIN_COST = 1000
+
+    def __init__(self, layout: BlockInterface, workers: Optional[int] = None, executor: str = PROCESS, min_cost: int = DEFAULT_MIN_COST):
+        """Plans the parallel evaluation of a layout.
+
+        Args:
+            layout (BlockInterface): The root block of the layout.
+            workers (Optional[int]): Number of workers (default: all CPU cores).
+            executor (str): The pool kind, "process" or "thread".
+            min_cost (int): Minimum estimated cost of a child to be offloaded.
+
+        Raises:
+            ValueError: If the executor kind is unknown.
+        """
+        if executor not in EXECUTORS:
+            raise ValueError(f"Unknown executor '{executor}', expected one of {EXECUTORS}.")
+        self.layout = layout
+        self.workers = workers or os.cpu_count() or 1
+        self.executor = executor
+        self.min_cost = min_cost
+        self.offloaded: dict[Path, tuple[int, ...]] = {}
+        self._active: set[Path] = set()
+        self._pool: Optional[Executor] = None
+        self._plan(layout, (), {})
+
+    def _plan(self, block: BlockInterface, path: Path, memo: dict[int, int]):
+        """Records the children to offload below a block, and the paths leading to them."""
+        if not isinstance(block, (SumBlock, PipelineBlock, Base)):
+            return
+        children = ParameterOverrides.children(block)
+        heavy: tuple[int, ...] = ()
+        if isinstance(block, SumBlock):
+            heavy = tuple(index for index, child in enumerate(children) if block_cost(child, memo) >= self.min_cost)
+            if len(heavy) < 2:
+                heavy = ()
+        if heavy:
+            self.offloaded[path] = heavy
+        for index, child in enumerate(children):
+            if index not in heavy:
+                self._plan(child, path + (index,), memo)
+        if heavy or any(path + (index,) in self._active for index in range(len(children))):
+            self._active.add(path)
+
+    def _executor(self) -> Executor:
+        """Returns the worker pool, starting it on first use."""
+        if self._pool is None:
+            if self.executor == PROCESS:
+                self._pool = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker, initargs=(self.layout,))
+            else:
+                self._pool = ThreadPoolExecutor(max_workers=self.workers)
+        return self._pool
+
+    def _submit(self, block: BlockInterface, path: Path, spfm_rates: dict[FaultType, float], lfm_rates: dict[FaultType, float]) -> Future:
+        """Starts the evaluation of an offloaded child."""
+        if self.executor == PROCESS:
+            return self._executor().submit(_evaluate_path, path, spfm_rates, lfm_rates)
+        return self._executor().submit(block.compute_fit, spfm_rates, lfm_rates)
+
+    def compute_fit(self, spfm_rates: dict[FaultType, float], lfm_rates: dict[FaultType, float]) -> tuple[dict[FaultType, float], dict[FaultType, float]]:
+        """Evaluates the layout, offloading the planned children to the worker pool.
+
+        Args:
+            spfm_rates (dict[FaultType, float]): Current residual failure rates (Input state).
+            lfm_rates (dict[FaultType, float]): Current latent failure rates (Input state).
+
+        Returns:
+            tuple[dict[FaultType, float], dict[FaultType, float]]: The same rates as the
+            sequential evaluation of the layout.
+        """
+        return self._evaluate(self.layout, (), spfm_rates, lfm_rates)
+
+    def _evaluate(self, block: BlockInterface, path: Path, spfm_rates: dict[FaultType, float], lfm_rates: dict[FaultType, float]) -> Rates:
+        """Evaluates a sub-tree, descending only along paths that lead to offloaded children."""
+        if path not in self._active:
+            return block.compute_fit(spfm_rates, lfm_rates)
+        children = ParameterOverrides.children(block)
+
+        if isinstance(block, SumBlock):
+            pending = {index: self._submit(children[index], path + (index,), spfm_rates, lfm_rates) for index in self.offloaded.get(path, ())}
+            results: list[Optional[Rates]] = [None if index in pending else self._evaluate(child, path + (index,), spfm_rates, lfm_rates) for index, child in enumerate(children)]
+            for index, future in pending.items():
+                results[index] = future.result()
+            return SumBlock.merge(spfm_rates, lfm_rates, results)
+
+        # Pipelines and components: their stages run in order, each possibly in parallel.
+        current_spfm, current_lfm = spfm_rates.copy(), lfm_rates.copy()
+        for index, child in enumerate(children):
+            current_spfm, current_lfm = self._evaluate(child, path + (index,), current_spfm, current_lfm)
+        return current_spfm, current_lfm
+
+    def close(self):
+        """Shuts down the worker pool."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def __enter__(self) -> "ParallelLayout":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def to_dict(self) -> dict:
+        """Serializes the source layout; the evaluation plan is rebuilt on load."""
+        return self.layout.to_dict()
@@ -0,0 +1,283 @@
+"""Resolves parameter paths and applies parameter overrides to block trees."""
+
+# Copyright (c) 2025 Linus Held. All rights reserved.
+
+import copy
+from typing import Any, Optional
+
+from ..interfaces import BlockInterface
+from .base import Base
+from .frozen_block import FrozenBlock
+
+
+def _is_number(value: Any) -> bool:
+    """Returns whether a value is an int or float (but not a bool)."""
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+class ParameterOverrides:
+    """Applies parameter overrides to a block tree without mutating the original model.
+
+    A parameter is addressed by a slash-separated path. All segments but the last select
+    a child block, either by its name or by its integer position, starting below the
+    layout root. The last segment is the attribute to override, for example
+    ``"DRAM_Path/SEC-DED/mbe_dc"`` or ``"DRAM_Path/LINK-ECC/LINK-ECC/1/c_R"``.
+
+    The children of a component (Base) are its root block. Setting an attribute on a
+    component re-runs its ``configure_blocks`` (see `Base.reconfigure`) so that the new
+    value reaches its blocks.
+    Immutable blocks (`FrozenBlock`) are copied with their `replace` method, which
+    rebuilds them through their constructor, so derived parameters (such as a
+    CoverageBlock's default c_L) follow the new values. Override values are checked like
+    configuration values (see `BlockFactory.check_parameter`); numeric component
+    attributes only accept numbers.
+    """
+
+    SEPARATOR = "/"
+
+    @staticmethod
+    def split_path(path: str) -> tuple[tuple[str, ...], str]:
+        """Splits a parameter path into the block segments and the attribute name.
+
+        Args:
+            path (str): The slash-separated parameter path.
+
+        Returns:
+            tuple[tuple[str, ...], str]: The block selector segments and the attribute name.
+
+        Raises:
+            ValueError: If the path is empty or contains empty segments.
+        """
+        segments = path.split(ParameterOverrides.SEPARATOR)
+        if not all(segments):
+            raise ValueError(f"Invalid parameter path: '{path}'")
+        return tuple(segments[:-1]), segments[-1]
+
+    @staticmethod
+    def children(block: BlockInterface) -> list[BlockInterface]:
+        """Returns the direct child blocks of a block.
+
+        Args:
+            block (BlockInterface): The block to inspect.
+
+        Returns:
+            list[BlockInterface]: The sub-blocks of a container or the root block of a component.
+        """
+        if isinstance(block, Base):
+            return [block.root_block] if block.root_block is not None else []
+        return list(getattr(block, "sub_blocks", []))
+
+    @staticmethod
+    def _child_index(block: BlockInterface, segment: str) -> int:
+        """Finds the position of the child addressed by a path segment.
+
+        Names take precedence over positions. If several children share a name, the
+        first one is selected.
+
+        Raises:
+            ValueError: If no child matches the segment.
+        """
+        children = ParameterOverrides.children(block)
+        for index, child in enumerate(children):
+            if getattr(child, "name", None) == segment:
+                return index
+        if segment.isdigit() and int(segment) < len(children):
+            return int(segment)
+        raise ValueError(f"Block '{getattr(block, 'name', type(block).__name__)}' has no child '{segment}'.")
+
+    @staticmethod
+    def resolve(layout: BlockInterface, path: str) -> Any:
+        """Reads the current value of a parameter.
+
+        Args:
+            layout (BlockInterface): The root block of the system layout.
+            path (str): The slash-separated parameter path.
+
+        Returns:
+            Any: The current value of the addressed attribute.
+
+        Raises:
+            ValueError: If the path does not address an existing parameter.
+        """
+        segments, attribute = ParameterOverrides.split_path(path)
+        block = ParameterOverrides._block(layout, segments)
+        if not hasattr(block, attribute):
+            raise ValueError(f"Unknown parameter '{attribute}' on block '{getattr(block, 'name', type(block).__name__)}'.")
+        return getattr(block, attribute)
+
+    @staticmethod
+    def _block(layout: BlockInterface, segments: tuple[str, ...]) -> BlockInterface:
+        """Returns the block addressed by the block segments of a path.
+
+        Raises:
+            ValueError: If a segment matches no child.
+        """
+        block = layout
+        for segment in segments:
+            block = ParameterOverrides.children(block)[ParameterOverrides._child_index(block, segment)]
+        return block
+
+    @staticmethod
+    def check(layout: BlockInterface, overrides: dict[str, Any], blocks: Optional[dict[tuple[str, ...], BlockInterface]] = None):
+        """Checks overrides like `apply` does, without copying any block.
+
+        Args:
+            layout (BlockInterface): The root block of the system layout.
+            overrides (dict[str, Any]): Mapping of parameter paths to their new values.
+            blocks (Optional[dict[tuple[str, ...], BlockInterface]]): Blocks already resolved
+                by earlier calls on the same layout, keyed by their path segments. Passing the
+                same dictionary for many override sets resolves every path only once.
+
+        Raises:
+            ValueError: If a path does not address an existing parameter or a value is
+                invalid for it.
+        """
+        blocks = {} if blocks is None else blocks
+        for path, value in overrides.items():
+            segments, attribute = ParameterOverrides.split_path(path)
+            if segments not in blocks:
+                blocks[segments] = ParameterOverrides._block(layout, segments)
+            ParameterOverrides._check(blocks[segments], attribute, value)
+
+    @staticmethod
+    def parameter_index(layout: BlockInterface) -> dict[str, float]:
+        """Lists every numeric parameter of a block tree with its current value.
+
+        Children are addressed by name where the name is unique among their siblings and
+        by position otherwise, so every returned path can be passed to `apply`.
+
+        Args:
+            layout (BlockInterface): The root block of the system layout.
+
+        Returns:
+            dict[str, float]: Mapping of parameter paths to their values, in tree order.
+        """
+        index: dict[str, float] = {}
+        ParameterOverrides._collect(layout, "", index)
+        return index
+
+    @staticmethod
+    def _collect(block: BlockInterface, prefix: str, index: dict[str, float]):
+        """Recursively adds the numeric attributes of a block and its children to the index."""
+        attributes = block.fields() if isinstance(block, FrozenBlock) else vars(block)
+        for attribute, value in attributes.items():
+            if _is_number(value):
+                index[f"{prefix}{attribute}"] = value
+
+        children = ParameterOverrides.children(block)
+        names = [getattr(child, "name", None) for child in children]
+        for position, child in enumerate(children):
+            name = names[position]
+            segment = name if name and names.count(name) == 1 and not name.isdigit() else str(position)
+            ParameterOverrides._collect(child, f"{prefix}{segment}{ParameterOverrides.SEPARATOR}", index)
+
+    @staticmethod
+    def apply(layout: BlockInterface, overrides: dict[str, Any]) -> BlockInterface:
+        """Creates a copy of the layout with the given parameters replaced.
+
+        Only the blocks along the overridden paths are copied; all untouched sub-trees
+        are shared with the original layout.
+
+        Args:
+            layout (BlockInterface): The root block of the system layout.
+            overrides (dict[str, Any]): Mapping of parameter paths to their new values.
+
+        Returns:
+            BlockInterface: The new root block.
+
+        Raises:
+            ValueError: If a path does not address an existing parameter or a value is
+                invalid for it.
+        """
+        if not overrides:
+            return layout
+        entries = [(*ParameterOverrides.split_path(path), value) for path, value in overrides.items()]
+        return ParameterOverrides._apply(layout, entries)
+
+    @staticmethod
+    def _apply(block: BlockInterface, entries: list[tuple[tuple[str, ...], str, Any]]) -> BlockInterface:
+        """Recursively copies a block and applies the overrides addressed below it."""
+        own_entries = [(attribute, ParameterOverrides._check(block, attribute, value)) for segments, attribute, value in entries if not segments]
+
+        if isinstance(block, FrozenBlock):
+            changes = dict(own_entries)
+            nested_entries: dict[int, list[tuple[tuple[str, ...], str, Any]]] = {}
+            for segments, attribute, value in entries:
+                if segments:
+                    nested_entries.setdefault(ParameterOverrides._child_index(block, segments[0]), []).append((segments[1:], attribute, value))
+            if nested_entries:
+                children = ParameterOverrides.children(block)
+                for index, child_entries in nested_entries.items():
+                    children[index] = ParameterOverrides._apply(children[index], child_entries)
+                changes["sub_blocks"] = children
+            return block.replace(**changes)
+
+        clone = copy.copy(block)
+        for attribute, value in own_entries:
+            setattr(clone, attribute, value)
+        if own_entries and isinstance(clone, Base):
+            clone.reconfigure()
+
+        nested: dict[int, list[tuple[tuple[str, ...], str, Any]]] = {}
+        for segments, attribute, value in entries:
+            if segments:
+                index = ParameterOverrides._child_index(clone, segments[0])
+                nested.setdefault(index, []).append((segments[1:], attribute, value))
+
+        if nested:
+            children = ParameterOverrides.children(clone)
+            for index, child_entries in nested.items():
+                children[index] = ParameterOverrides._apply(children[index], child_entries)
+            if isinstance(clone, Base):
+                clone.root_block = children[0]
+            else:
+                clone.sub_blocks = children
+
+        return clone
+
+    @staticmethod
+    def _check(block: BlockInterface, attribute: str, value: Any) -> Any:
+        """Checks an override value and converts it like a configuration value.
+
+        Raises:
+            ValueError: If the block has no such parameter or the value is invalid for it.
+        """
+        from .block_factory import BlockFactory
+
+        block_name = getattr(block, "name", type(block).__name__)
+        if not hasattr(block, attribute):
+            raise ValueError(f"Unknown parameter '{attribute}' on block '{block_name}'.")
+        try:
+            if isinstance(block, FrozenBlock):
+                return BlockFactory.check_parameter(type(block).__name__, block.argument(attribute), value, attribute)
+            current = getattr(block, attribute)
+            if _is_number(current) and not _is_number(value):
+                raise ValueError(f"{attribute}: expected number, got {value!r}")
+        except ValueError as error:
+            raise ValueError(f"Invalid override on block '{block_name}': {error}") from None
+        return value
+
+    @staticmethod
+    def unshare(layout: BlockInterface) -> BlockInterface:
+        """Creates a copy of the layout in which no block object occurs more than once.
+
+        Layouts loaded from configurations with shared definitions reuse one block object
+        for identical instances. This expands them into distinct objects, e.g. for
+        consumers that identify blocks by object identity.
+
+        Args:
+            layout (BlockInterface): The root block of the system layout.
+
+        Returns:
+            BlockInterface: The expanded root block.
+        """
+        children = [ParameterOverrides.unshare(child) for child in ParameterOverrides.children(layout)]
+        if isinstance(layout, FrozenBlock):
+            return layout.replace(sub_blocks=children) if "sub_blocks" in layout.fields() else layout.replace()
+        clone = copy.copy(layout)
+        if isinstance(clone, Base):
+            if children:
+                clone.root_block = children[0]
+        elif hasattr(clone, "sub_blocks"):
+            clone.sub_blocks = children
+        return clone
@@ -3,15 +3,18 @@
 # Copyright (c) 2025 Linus Held. All rights reserved.
 
 from ..interfaces import BlockInterface, FaultType
+from .frozen_block import FrozenBlock
 
 
-class PipelineBlock(BlockInterface):
+class PipelineBlock(FrozenBlock):
     """Executes a sequence of blocks where the output of one block becomes the input of the next.
 
     This block type is used to model serial hardware paths or sequential processing steps
     (e.g., Source -> ECC -> Trim).
     """
 
+    __slots__ = ("name", "sub_blocks")
+
     def __init__(self, name: str, sub_blocks: list[BlockInterface]):
         """Initializes the PipelineBlock with a sequence of sub-blocks.
 
@@ -20,8 +23,7 @@ class PipelineBlock(BlockInterface):
             sub_blocks (list[BlockInterface]): A list of blocks implementing BlockInterface
                 to be executed in strict sequential order.
         """
-        self.name = name
-        self.sub_blocks = sub_blocks
+        self._init(name=name, sub_blocks=sub_blocks)
 
     def compute_fit(self, spfm_rates: dict[FaultType, float], lfm_rates: dict[FaultType, float]) -> tuple[dict[FaultType, float], dict[FaultType, float]]:
         """Sequentially processes all blocks in the pipeline.
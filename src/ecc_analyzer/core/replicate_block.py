@@ -0,0 +1,106 @@
+"""Block that models N identical parallel instances of a sub-block."""
+
+# Copyright (c) 2025 Linus Held. All rights reserved.
+
+from typing import Any, Union
+
+from ..interfaces import BlockInterface, FaultType
+from .frozen_block import FrozenBlock
+from .instance_array import InstanceArray
+
+
+class ReplicateBlock(FrozenBlock):
+    """Models `count` identical parallel instances of a block with a single evaluation.
+
+    The result equals a SumBlock holding `count` copies of the child: the child is
+    evaluated once and its delta contribution relative to the input state is scaled by
+    the count. Model size and evaluation time therefore do not grow with the number of
+    instances (e.g. channels x ranks x dies).
+
+    Instances do not need to be identical: parameters inside the child may be
+    `InstanceArray`s with one value per instance. The child then yields per-instance
+    deltas, and the ReplicateBlock is the aggregation point that sums them. Inside a
+    ReplicateBlock with per-instance values, a nested ReplicateBlock receives the
+    per-instance rates of the outer instances; it scales their deltas by its count and
+    leaves the summation to the outer block.
+    """
+
+    __slots__ = ("name", "sub_blocks", "count")
+
+    def __init__(self, name: str, child: BlockInterface, count: int):
+        """Initializes the ReplicateBlock.
+
+        Args:
+            name (str): The descriptive name of the replicated group.
+            child (BlockInterface): The block describing one instance.
+            count (int): The number of identical instances.
+
+        Raises:
+            ValueError: If the count is negative.
+        """
+        if count < 0:
+            raise ValueError(f"Replication count must not be negative, got {count}.")
+        self._init(name=name, sub_blocks=(child,), count=count)
+
+    def arguments(self, **changes: Any) -> dict[str, Any]:
+        """Returns the constructor arguments, passing the single child as ``child``."""
+        arguments = super().arguments(**changes)
+        (arguments["child"],) = arguments.pop("sub_blocks")
+        return arguments
+
+    @property
+    def child(self) -> BlockInterface:
+        """The block describing one instance."""
+        return self.sub_blocks[0]
+
+    def compute_fit(self, spfm_rates: dict[FaultType, float], lfm_rates: dict[FaultType, float]) -> tuple[dict[FaultType, float], dict[FaultType, float]]:
+        """Adds the scaled delta contribution of the child to the input state.
+
+        Args:
+            spfm_rates (dict[FaultType, float]): Current residual failure rates (Input state).
+            lfm_rates (dict[FaultType, float]): Current latent failure rates (Input state).
+
+        Returns:
+            tuple[dict[FaultType, float], dict[FaultType, float]]: A tuple containing:
+                - SPFM rates including the contribution of all instances.
+                - LFM rates including the contribution of all instances.
+        """
+        res_spfm, res_lfm = self.child.compute_fit(spfm_rates, lfm_rates)
+        total_spfm = spfm_rates.copy()
+        total_lfm = lfm_rates.copy()
+        for fault in set(res_spfm.keys()) | set(spfm_rates.keys()):
+            delta = res_spfm.get(fault, 0.0) - spfm_rates.get(fault, 0.0)
+            if delta != 0:
+                total_spfm[fault] = total_spfm.get(fault, 0.0) + self._aggregate(delta, spfm_rates, lfm_rates)
+        for fault in set(res_lfm.keys()) | set(lfm_rates.keys()):
+            delta = res_lfm.get(fault, 0.0) - lfm_rates.get(fault, 0.0)
+            if delta != 0:
+                total_lfm[fault] = total_lfm.get(fault, 0.0) + self._aggregate(delta, spfm_rates, lfm_rates)
+        return total_spfm, total_lfm
+
+    def _aggregate(self, delta: Union[float, InstanceArray], spfm_rates: dict, lfm_rates: dict) -> Union[float, InstanceArray]:
+        """Returns the contribution of all instances from the delta of the child.
+
+        A per-instance delta holds one value per instance and is summed, unless the input
+        rates already hold per-instance values. Those belong to an enclosing
+        ReplicateBlock, so the delta is per outer instance and is scaled by the count.
+
+        Raises:
+            ValueError: If a per-instance delta does not have one value per instance.
+        """
+        if isinstance(delta, InstanceArray):
+            if any(isinstance(rate, InstanceArray) for rates in (spfm_rates, lfm_rates) for rate in rates.values()):
+                return self.count * delta
+            if len(delta) != self.count:
+                raise ValueError(f"ReplicateBlock '{self.name}' has {self.count} instances but a parameter has {len(delta)} values.")
+            return delta.total()
+        return self.count * delta
+
+    def to_dict(self) -> dict:
+        """Serializes the ReplicateBlock into a dictionary for configuration export.
+
+        Returns:
+            dict: A dictionary containing the block type and all parameters
+                needed to reconstruct this ReplicateBlock via the BlockFactory.
+        """
+        return {"type": "ReplicateBlock", "name": self.name, "child": self.child.to_dict(), "count": self.count}
@@ -2,17 +2,22 @@
 
 # Copyright (c) 2025 Linus Held. All rights reserved.
 
-from ..interfaces import BlockInterface, FaultType
+from ..interfaces import FaultType
+from .frozen_block import FrozenBlock
 
 
-class SplitBlock(BlockInterface):
+class SplitBlock(FrozenBlock):
     """Distributes the FIT rate of a specific fault type across multiple other fault types.
 
     The distribution is based on a defined percentage mapping. This is typically used
     to model how a generic fault (like "DRAM Error") manifests as specific sub-types
     (e.g., SBE, DBE) based on physical probabilities.
+
+    Blocks with equal distribution rates share one read-only mapping.
     """
 
+    __slots__ = ("name", "fault_to_split", "distribution_rates", "is_spfm")
+
     def __init__(
         self,
         name: str,
@@ -37,10 +42,7 @@ class SplitBlock(BlockInterface):
         if sum_of_rates > 1.0 + 1e-9:
             raise ValueError(f"Sum of distribution rates ({sum_of_rates:.4f}) must not exceed 1.0.")
 
-        self.name = name
-        self.fault_to_split = fault_to_split
-        self.distribution_rates = distribution_rates
-        self.is_spfm = is_spfm
+        self._init(name=name, fault_to_split=fault_to_split, distribution_rates=distribution_rates, is_spfm=is_spfm)
 
     def compute_fit(self, spfm_rates: dict[FaultType, float], lfm_rates: dict[FaultType, float]) -> tuple[dict[FaultType, float], dict[FaultType, float]]:
         """Transforms the input fault rate dictionaries by redistributing the source fault rate.
@@ -2,10 +2,13 @@
 
 # Copyright (c) 2025 Linus Held. All rights reserved.
 
+from collections.abc import Iterable
+
 from ..interfaces import BlockInterface, FaultType
+from .frozen_block import FrozenBlock
 
 
-class SumBlock(BlockInterface):
+class SumBlock(FrozenBlock):
     """Parallel block that aggregates FIT rates from multiple sub-blocks.
 
     Manages path junctions by executing sub-blocks in parallel (starting from the
@@ -13,6 +16,8 @@ class SumBlock(BlockInterface):
     (deltas) to the total system rates.
     """
 
+    __slots__ = ("name", "sub_blocks")
+
     def __init__(self, name: str, sub_blocks: list[BlockInterface]):
         """Initializes the SumBlock with a list of parallel sub-blocks.
 
@@ -20,8 +25,7 @@ class SumBlock(BlockInterface):
             name (str): The descriptive name of the aggregation block.
             sub_blocks (list[BlockInterface]): List of blocks whose results will be summed.
         """
-        self.name = name
-        self.sub_blocks = sub_blocks
+        self._init(name=name, sub_blocks=sub_blocks)
 
     def compute_fit(self, spfm_rates: dict[FaultType, float], lfm_rates: dict[FaultType, float]) -> tuple[dict[FaultType, float], dict[FaultType, float]]:
         """Aggregates the FIT rate transformations from all internal parallel blocks.
@@ -38,10 +42,31 @@ class SumBlock(BlockInterface):
                 - Final aggregated SPFM rates.
                 - Final aggregated LFM rates.
         """
+        return self.merge(spfm_rates, lfm_rates, (block.compute_fit(spfm_rates, lfm_rates) for block in self.sub_blocks))
+
+    @staticmethod
+    def merge(
+        spfm_rates: dict[FaultType, float],
+        lfm_rates: dict[FaultType, float],
+        results: Iterable[tuple[dict[FaultType, float], dict[FaultType, float]]],
+    ) -> tuple[dict[FaultType, float], dict[FaultType, float]]:
+        """Adds the delta contributions of the sub-block results to the input state.
+
+        The deltas are added in the order of the results, so evaluating the sub-blocks
+        elsewhere (e.g. in a worker pool) and merging here gives identical rates.
+
+        Args:
+            spfm_rates (dict[FaultType, float]): The input SPFM rates of all sub-blocks.
+            lfm_rates (dict[FaultType, float]): The input LFM rates of all sub-blocks.
+            results (Iterable[tuple[dict[FaultType, float], dict[FaultType, float]]]): The
+                output rates of the sub-blocks, in sub-block order.
+
+        Returns:
+            tuple[dict[FaultType, float], dict[FaultType, float]]: The aggregated SPFM and LFM rates.
+        """
         total_spfm = spfm_rates.copy()
         total_lfm = lfm_rates.copy()
-        for block in self.sub_blocks:
-            res_spfm, res_lfm = block.compute_fit(spfm_rates, lfm_rates)
+        for res_spfm, res_lfm in results:
             for fault in set(res_spfm.keys()) | set(spfm_rates.keys()):
                 delta = res_spfm.get(fault, 0.0) - spfm_rates.get(fault, 0.0)
                 if delta != 0:
@@ -2,16 +2,21 @@
 
 # Copyright (c) 2025 Linus Held. All rights reserved.
 
-from ..interfaces import BlockInterface, FaultType
+from ..interfaces import FaultType
+from .frozen_block import FrozenBlock
 
 
-class TransformationBlock(BlockInterface):
+class TransformationBlock(FrozenBlock):
     """Transfers a portion of one fault type's rate to another fault type.
 
     This operation adds a calculated rate to the target fault type based on the
     source fault type, without removing the rate from the source (unlike SplitBlock).
     """
 
+    __slots__ = ("source", "target", "factor")
+
+    _ARGUMENTS = {"source": "source_fault", "target": "target_fault"}
+
     def __init__(self, source_fault: FaultType, target_fault: FaultType, factor: float):
         """Initializes the transformation block.
 
@@ -20,9 +25,7 @@ class TransformationBlock(BlockInterface):
             target_fault (FaultType): The fault type to which the calculated rate is added.
             factor (float): The multiplication factor applied to the source rate.
         """
-        self.source = source_fault
-        self.target = target_fault
-        self.factor = factor
+        self._init(source=source_fault, target=target_fault, factor=factor)
 
     def compute_fit(self, spfm_rates: dict[FaultType, float], lfm_rates: dict[FaultType, float]) -> tuple[dict[FaultType, float], dict[FaultType, float]]:
         """Transforms the input fault rate dictionaries by transferring a portion of the source rate.
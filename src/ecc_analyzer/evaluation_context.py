@@ -0,0 +1,79 @@
+"""Immutable per-run state of an analysis, for concurrent evaluation of a shared model."""
+
+# Copyright (c) 2025 Linus Held. All rights reserved.
+
+from typing import Any, Optional
+
+from .core import AsilBlock, BlockFactory, InstanceArray, ParameterOverrides
+from .interfaces import BlockInterface, FaultType
+
+
+class EvaluationContext:
+    """Everything a single analysis run reads, captured once at its start.
+
+    A context holds the layout, the total FIT and the parameter overrides of one run.
+    It is immutable and evaluation never writes to the block tree (blocks are immutable,
+    overrides produce copies), so any number of threads can evaluate contexts of the
+    same model at the same time without locks. `SystemBase` creates a context per call
+    from an atomic snapshot of its model, so a concurrent `load_from_*` or change of
+    `total_fit` affects later runs only and never mixes two models within one run.
+
+    Example:
+        context = system.context({"total_fit": 2000.0})
+        metrics, spfm, lfm = context.evaluate()
+    """
+
+    __slots__ = ("layout", "total_fit", "overrides")
+
+    def __init__(self, layout: BlockInterface, total_fit: float, overrides: Optional[dict[str, Any]] = None):
+        """Initializes the context.
+
+        Args:
+            layout (BlockInterface): The root block of the system layout.
+            total_fit (float): The total FIT of the system.
+            overrides (Optional[dict[str, Any]]): Parameter overrides of the run, keyed by
+                parameter path (see `ParameterOverrides`). The special key "total_fit"
+                replaces the total FIT.
+
+        Raises:
+            ValueError: If the layout is missing.
+        """
+        if not layout:
+            raise ValueError("System layout is not configured.")
+        object.__setattr__(self, "layout", layout)
+        object.__setattr__(self, "total_fit", total_fit)
+        object.__setattr__(self, "overrides", dict(overrides) if overrides else {})
+
+    def __setattr__(self, name: str, value: Any):
+        raise AttributeError("EvaluationContext is immutable.")
+
+    def evaluate(self, asil_block: Optional[AsilBlock] = None) -> tuple[dict[str, Any], dict[FaultType, float], dict[FaultType, float]]:
+        """Runs the FIT calculation of this context.
+
+        Args:
+            asil_block (Optional[AsilBlock]): The block computing the metrics. Defaults to
+                a new `AsilBlock`.
+
+        Returns:
+            tuple[dict[str, Any], dict[FaultType, float], dict[FaultType, float]]: The
+            metrics and the final SPFM and LFM rates.
+
+        Raises:
+            ValueError: If an override is invalid, e.g. per-instance values that do not
+                fit their ReplicateBlock (see `BlockFactory.instance_errors`).
+        """
+        layout = self.layout
+        total_fit = self.total_fit
+        if self.overrides:
+            block_overrides = dict(self.overrides)
+            total_fit = block_overrides.pop("total_fit", total_fit)
+            layout = ParameterOverrides.apply(layout, block_overrides)
+            if any(isinstance(value, (list, InstanceArray)) for value in block_overrides.values()):
+                errors = BlockFactory.instance_errors(layout)
+                if errors:
+                    raise ValueError(f"Invalid overrides: {'; '.join(errors)}")
+
+        if asil_block is None:
+            asil_block = AsilBlock("Final_Evaluation")
+        final_spfm, final_lfm = layout.compute_fit({}, {})
+        return asil_block.compute_metrics(total_fit, final_spfm, final_lfm), final_spfm, final_lfm
@@ -1,30 +1,52 @@
 """File to define a model via an external config file"""
 
 from pathlib import Path
+from typing import Optional
 
+from .core import BinaryModel
+from .model_cache import ModelCache
 from .system_base import SystemBase
 
 
 class GenericSafetySystem(SystemBase):
     """A system that defines its hardware structure via an external config file."""
 
-    def __init__(self, name: str, total_fit: float, config_path: str):
+    def __init__(self, name: str, total_fit: float, config_path: str, model_cache: Optional[ModelCache] = None):
         """Initializes a new safety system from an external configuration file.
 
         Args:
             name (str): The descriptive name of the hardware system.
             total_fit (float): The total failure rate (FIT) of the system used
                 to calculate relative metrics.
-            config_path (str): The path to the JSON or YAML file containing
+            config_path (str): The path to the JSON, YAML or binary (.eccb) file containing
                 the system's hardware block layout.
+            model_cache (Optional[ModelCache]): Optional cache of built layouts. If given,
+                an unchanged config file is loaded from the cache instead of being parsed.
         """
         self.config_path = config_path
+        self.model_cache = model_cache
+        self.parameter_index = None
         super().__init__(name, total_fit)
 
     def configure_system(self):
         """Reconstructs the layout from the provided configuration file.
 
-        Determines the file format (JSON or YAML) based on the extension of
+        Uses the model cache if one was given, otherwise parses the file.
+        """
+        if self.model_cache is None:
+            self.load_config()
+        else:
+            self.system_layout, self.parameter_index = self.model_cache.load(self.config_path, self._build_layout)
+
+    def _build_layout(self):
+        """Parses the configuration file and returns the resulting layout (cache miss)."""
+        self.load_config()
+        return self.system_layout
+
+    def load_config(self):
+        """Parses the configuration file into the system layout.
+
+        Determines the file format (JSON, YAML or binary) based on the extension of
         the config_path and executes the corresponding loading logic.
 
         Raises:
@@ -36,5 +58,7 @@ class GenericSafetySystem(SystemBase):
             self.load_from_json(self.config_path)
         elif extension in [".yaml", ".yml"]:
             self.load_from_yaml(self.config_path)
+        elif extension == BinaryModel.SUFFIX:
+            self.load_from_binary(self.config_path)
         else:
-            raise ValueError(f"Unsupported file format: '{extension}'. Please provide a .json, .yaml, or .yml file.")
+            raise ValueError(f"Unsupported file format: '{extension}'. Please provide a .json, .yaml, .yml, or .eccb file.")
@@ -14,6 +14,8 @@ class BlockInterface(ABC):
     and nesting capabilities within the safety analysis.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def compute_fit(self, spfm_rates: dict[FaultType, float], lfm_rates: dict[FaultType, float]) -> tuple[dict[FaultType, float], dict[FaultType, float]]:
         """Transforms the input fault rate dictionaries according to the block's specific logic.
@@ -2,22 +2,191 @@
 
 # Copyright (c) 2025 Linus Held. All rights reserved.
 
-from enum import Enum, auto
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from types import MappingProxyType
+from typing import Optional
 
 
-class FaultType(Enum):
+class _FaultTypeRegistry(type):
+    """Metaclass giving `FaultType` the class-level interface of an Enum.
+
+    Supports ``FaultType.SBE``, ``FaultType["SBE"]``, iteration in id order, ``len`` and
+    ``FaultType.__members__`` for built-in and registered fault types alike.
+    """
+
+    def __getattr__(cls, name: str) -> "FaultType":
+        try:
+            return cls._by_name[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __getitem__(cls, name: str) -> "FaultType":
+        return cls._by_name[name]
+
+    def __iter__(cls) -> Iterator["FaultType"]:
+        return iter(tuple(cls._members))
+
+    def __len__(cls) -> int:
+        return len(cls._members)
+
+    def __contains__(cls, item: object) -> bool:
+        return isinstance(item, cls)
+
+    @property
+    def __members__(cls) -> MappingProxyType:
+        return MappingProxyType(cls._by_name)
+
+
+class FaultType(metaclass=_FaultTypeRegistry):
     """
-    Enumeration of supported fault types within the safety model.
+    Registry of the fault types within the safety model.
     Each member represents a specific failure mode used for FIT rate calculations and visualization.
+
+    The built-in members (SBE, DBE, ...) behave like the members of an Enum. Further
+    fault types (e.g. per-region or per-bit variants) can be declared at run time with
+    `register`, for example from the ``fault_types`` section of a configuration. Every
+    fault type is interned: there is exactly one object per name, and it carries a dense
+    integer ``index`` (0, 1, 2, ... in registration order) so that rate vectors can be
+    stored in arrays indexed by fault type.
+
+    Registered fault types live as long as the process (see `scope` for temporary ones),
+    so their number is capped at `LIMIT`. This bounds the registry of long-running
+    processes such as the analysis service, which registers the fault types declared by
+    inline models of its clients.
     """
 
-    SBE = auto()
-    DBE = auto()
-    TBE = auto()
-    MBE = auto()
-    WD = auto()
-    AZ = auto()
-    SB = auto()
-    SDB = auto()
-    OTH = auto()
-    SBE_IF = auto()
+    __slots__ = ("name", "index")
+
+    _members: list["FaultType"] = []
+    _by_name: dict[str, "FaultType"] = {}
+    _lock = threading.Lock()
+
+    # Built-in fault types, in the order of their former Enum values.
+    BUILTIN = ("SBE", "DBE", "TBE", "MBE", "WD", "AZ", "SB", "SDB", "OTH", "SBE_IF")
+
+    # Maximum number of fault types, built-in ones included.
+    LIMIT = 4096
+
+    def __init__(self, name: str, index: int):
+        """Creates a fault type. Use `register` instead, which interns the instance."""
+        self.name = name
+        self.index = index
+
+    @property
+    def value(self) -> int:
+        """The Enum-compatible value (1-based registration position)."""
+        return self.index + 1
+
+    def __repr__(self) -> str:
+        return f"<FaultType.{self.name}: {self.value}>"
+
+    def __str__(self) -> str:
+        return f"FaultType.{self.name}"
+
+    def __reduce__(self):
+        # Re-intern by name, so that pickled rates and blocks work in other processes.
+        return (FaultType.register, (self.name,))
+
+    def __copy__(self) -> "FaultType":
+        return self
+
+    def __deepcopy__(self, memo: dict) -> "FaultType":
+        return self
+
+    @classmethod
+    def register(cls, name: str) -> "FaultType":
+        """Returns the fault type with the given name, declaring it if it is new.
+
+        Args:
+            name (str): The fault type name. Must be a valid identifier, e.g. "SBE_BANK_12".
+
+        Returns:
+            FaultType: The interned fault type.
+
+        Raises:
+            ValueError: If the name is not a valid identifier, clashes with an attribute
+                of FaultType (e.g. "register") or would exceed `LIMIT` fault types.
+        """
+        if not isinstance(name, str):
+            raise ValueError(f"Invalid fault type name {name!r}: must be a valid identifier.")
+        fault = cls._by_name.get(name)
+        if fault is not None:
+            return fault
+        if not name.isidentifier():
+            raise ValueError(f"Invalid fault type name {name!r}: must be a valid identifier.")
+        if hasattr(cls, name):
+            raise ValueError(f"Invalid fault type name {name!r}: reserved by FaultType.")
+        with cls._lock:
+            fault = cls._by_name.get(name)
+            if fault is None:
+                if len(cls._members) >= cls.LIMIT:
+                    raise ValueError(f"Cannot register fault type {name!r}: the limit of {cls.LIMIT} fault types is reached.")
+                fault = cls(name, len(cls._members))
+                cls._members.append(fault)
+                cls._by_name[name] = fault
+        return fault
+
+    @classmethod
+    def get(cls, name: str) -> Optional["FaultType"]:
+        """Returns a registered fault type, or None if the name is unknown.
+
+        Args:
+            name (str): The fault type name.
+
+        Returns:
+            Optional[FaultType]: The fault type, if registered.
+        """
+        return cls._by_name.get(name)
+
+    @classmethod
+    def by_index(cls, index: int) -> "FaultType":
+        """Returns the fault type with the given index.
+
+        Args:
+            index (int): The dense fault type index.
+
+        Returns:
+            FaultType: The fault type.
+        """
+        return cls._members[index]
+
+    @classmethod
+    @contextmanager
+    def scope(cls) -> Iterator[None]:
+        """Removes the fault types registered within the ``with`` block again on exit.
+
+        Meant for tests and tools that declare many temporary fault types. The removed
+        fault types and anything indexed by them (e.g. a `CompiledLayout`) must not be
+        used after the block; their indices are handed out again.
+
+        Yields:
+            None
+        """
+        with cls._lock:
+            count = len(cls._members)
+        try:
+            yield
+        finally:
+            with cls._lock:
+                for fault in cls._members[count:]:
+                    del cls._by_name[fault.name]
+                del cls._members[count:]
+
+    @classmethod
+    def is_builtin(cls, fault: "FaultType") -> bool:
+        """Checks whether a fault type is one of the built-in members.
+
+        Args:
+            fault (FaultType): The fault type.
+
+        Returns:
+            bool: True for SBE, DBE, ..., False for fault types registered at run time.
+        """
+        return fault.index < len(cls.BUILTIN)
+
+
+for _name in FaultType.BUILTIN:
+    setattr(FaultType, _name, FaultType.register(_name))
+del _name
@@ -0,0 +1,119 @@
+"""On-disk cache of built block trees, keyed by configuration content."""
+
+# Copyright (c) 2025 Linus Held. All rights reserved.
+
+import hashlib
+import os
+import pickle
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from .core import ParameterOverrides
+from .interfaces import BlockInterface
+
+# Bumped whenever the layout of the cached artifact changes.
+CACHE_FORMAT_VERSION = 3
+
+
+class ModelCache:
+    """Caches the block tree built from a configuration file, plus its parameter index.
+
+    The key is a hash of the raw configuration bytes, the library version and the cache
+    format version, so edited files or library upgrades never hit stale entries. An entry
+    is a pickle of the built layout and its parameter index, loaded instead of re-parsing
+    the file and rebuilding the tree via `BlockFactory`.
+
+    Unpickling an entry can execute arbitrary code, so the cache directory must only be
+    writable by users trusted to run code as the current user. Do not point
+    `ECC_ANALYZER_CACHE_DIR` at a shared location. As a safeguard on POSIX systems,
+    entries that are not owned by the current user or are writable by group or others
+    are never loaded; they are rebuilt and overwritten instead.
+    """
+
+    def __init__(self, directory: Optional[str] = None):
+        """Initializes the cache.
+
+        Args:
+            directory (Optional[str]): The cache directory. Defaults to the
+                `ECC_ANALYZER_CACHE_DIR` environment variable or `~/.cache/ecc_analyzer`.
+        """
+        if directory is None:
+            directory = os.environ.get("ECC_ANALYZER_CACHE_DIR") or str(Path.home() / ".cache" / "ecc_analyzer")
+        self.directory = Path(directory) / "models"
+
+    @staticmethod
+    def key(config_path: str) -> str:
+        """Computes the cache key of a configuration file.
+
+        Args:
+            config_path (str): The path to the JSON or YAML file.
+
+        Returns:
+            str: The hex SHA-256 digest of the content and the version information.
+        """
+        from . import __version__
+
+        digest = hashlib.sha256(f"{__version__}:{CACHE_FORMAT_VERSION}:".encode())
+        with open(config_path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def load(self, config_path: str, build: Callable[[], BlockInterface]) -> tuple[BlockInterface, dict[str, Any]]:
+        """Returns the cached layout of a configuration file, building it on a miss.
+
+        Args:
+            config_path (str): The path to the JSON or YAML file.
+            build (Callable[[], BlockInterface]): Parses the file and builds the layout on a miss.
+
+        Returns:
+            tuple[BlockInterface, dict[str, Any]]: The layout and its parameter index
+            (see `ParameterOverrides.parameter_index`).
+        """
+        entry_path = self.directory / f"{self.key(config_path)}.pkl"
+
+        if entry_path.exists() and self._trusted(entry_path):
+            try:
+                with open(entry_path, "rb") as f:
+                    entry = pickle.load(f)
+                if not isinstance(entry, dict) or entry.keys() != {"layout", "parameters"}:
+                    raise ValueError(f"Cache entry '{entry_path}' has an unexpected layout.")
+                return entry["layout"], entry["parameters"]
+            except (OSError, EOFError, pickle.UnpicklingError, ValueError):
+                # An unreadable entry (truncated or corrupt) is a miss and gets rebuilt
+                # and overwritten.
+                pass
+
+        layout = build()
+        parameters = ParameterOverrides.parameter_index(layout)
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp_path = entry_path.with_name(f".{entry_path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "wb") as f:
+            pickle.dump({"layout": layout, "parameters": parameters}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, entry_path)
+
+        return layout, parameters
+
+    @staticmethod
+    def _trusted(entry_path: Path) -> bool:
+        """Checks that an entry is owned by the current user and not writable by others.
+
+        Args:
+            entry_path (Path): The path of the cache entry.
+
+        Returns:
+            bool: True if the entry may be unpickled. Always True where POSIX ownership
+            is not available.
+        """
+        if not hasattr(os, "getuid"):
+            return True
+        status = entry_path.stat()
+        return status.st_uid == os.getuid() and not status.st_mode & 0o022
+
+    def clear(self):
+        """Removes all cached entries."""
+        if self.directory.exists():
+            for entry_path in self.directory.glob("*.pkl"):
+                entry_path.unlink()
@@ -0,0 +1,233 @@
+"""Persistent, content-addressed cache of analysis results."""
+
+# Copyright (c) 2025 Linus Held. All rights reserved.
+
+import hashlib
+import json
+import os
+import threading
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from .core import InstanceArray
+from .interfaces import BlockInterface, FaultType
+
+# Bumped whenever the layout of a cache entry or of the key description changes.
+CACHE_FORMAT_VERSION = 2
+
+
+def _canonical(value: Any) -> Any:
+    """Converts override values into JSON form: fault types by name, arrays and mappings as lists and objects."""
+    if isinstance(value, FaultType):
+        return value.name
+    if isinstance(value, Mapping):
+        return {key.name if isinstance(key, FaultType) else key: _canonical(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple, InstanceArray)):
+        return [_canonical(item) for item in value]
+    return value
+
+
+class ResultCache:
+    """Stores analysis results under a hash of everything that determines them.
+
+    The key covers the serialized layout (`to_dict`), the total FIT, the parameter
+    overrides of the run and the library version. Hashing the layout costs a full
+    serialization, so callers that evaluate one layout many times compute its
+    `layout_digest` once and pass that instead of the layout. Runs whose overrides have
+    no canonical JSON form are not cached. Entries are small JSON files holding
+    the metrics and the final per-fault-type rates. Binary artifacts such as rendered
+    PDFs can be stored next to an entry.
+
+    Several processes may share one cache directory. Every file is written to a
+    temporary name and atomically renamed into place, so readers see either a complete
+    entry or none. Eviction only unlinks files, and a vanished file is treated as a miss.
+    Recency is tracked through the file modification time, which is refreshed on every
+    hit. When the cache grows beyond `max_bytes`, the least recently used files are
+    removed until it is back below 90% of the limit. Threads of one process may share
+    a cache instance as well.
+    """
+
+    LOW_WATERMARK = 0.9
+
+    # Guards the size estimate against concurrent writers within one process.
+    _lock = threading.Lock()
+
+    def __init__(self, directory: Optional[str] = None, max_bytes: int = 256 * 1024 * 1024):
+        """Initializes the cache.
+
+        Args:
+            directory (Optional[str]): The cache directory. Defaults to the
+                `ECC_ANALYZER_CACHE_DIR` environment variable or `~/.cache/ecc_analyzer`.
+            max_bytes (int): Size limit of all entries and artifacts together.
+        """
+        if directory is None:
+            directory = os.environ.get("ECC_ANALYZER_CACHE_DIR") or str(Path.home() / ".cache" / "ecc_analyzer")
+        self.directory = Path(directory) / "results"
+        self.max_bytes = max_bytes
+        self._estimated_bytes: Optional[int] = None
+
+    @staticmethod
+    def layout_digest(layout: BlockInterface) -> str:
+        """Hashes the serialized form of a layout.
+
+        Args:
+            layout (BlockInterface): The root block of the system layout.
+
+        Returns:
+            str: The hex SHA-256 digest of the canonical JSON form of the layout.
+        """
+        canonical = json.dumps(layout.to_dict(), sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    @staticmethod
+    def key(layout: Union[BlockInterface, str], total_fit: float, overrides: Optional[dict[str, Any]] = None) -> Optional[str]:
+        """Computes the canonical cache key of an analysis.
+
+        Args:
+            layout (Union[BlockInterface, str]): The root block of the system layout, or its
+                `layout_digest`.
+            total_fit (float): The total FIT of the system.
+            overrides (Optional[dict[str, Any]]): The parameter overrides of the run.
+
+        Returns:
+            Optional[str]: The hex SHA-256 digest of the canonical JSON description, or None
+            if the overrides cannot be described canonically (the run is then not cached).
+        """
+        from . import __version__
+
+        description = {
+            "layout": layout if isinstance(layout, str) else ResultCache.layout_digest(layout),
+            "total_fit": total_fit,
+            "overrides": _canonical(overrides or {}),
+            "version": __version__,
+            "format": CACHE_FORMAT_VERSION,
+        }
+        try:
+            canonical = json.dumps(description, sort_keys=True, separators=(",", ":"), allow_nan=False)
+        except (TypeError, ValueError):
+            return None
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    def _path(self, key: str, suffix: str) -> Path:
+        """Returns the file path of an entry or artifact."""
+        return self.directory / key[:2] / f"{key}{suffix}"
+
+    def _read(self, path: Path) -> Optional[bytes]:
+        """Reads a file and marks it as recently used, or returns None if it is missing."""
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return data
+
+    def _write(self, path: Path, data: bytes):
+        """Atomically writes a file and evicts old files if the cache is too large."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            if self._estimated_bytes is None:
+                self._estimated_bytes = self.size()
+            else:
+                self._estimated_bytes += len(data)
+            if self._estimated_bytes > self.max_bytes:
+                self.evict()
+
+    def get(self, key: str) -> Optional[dict[str, Any]]:
+        """Looks up an entry.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            Optional[dict[str, Any]]: The stored entry, or None on a miss. A corrupt entry
+            (e.g. truncated by a full disk) is a miss as well and gets overwritten by the
+            next `put`.
+        """
+        data = self._read(self._path(key, ".json"))
+        if data is None:
+            return None
+        try:
+            entry = json.loads(data)
+        except ValueError:
+            return None
+        return entry if isinstance(entry, dict) else None
+
+    def put(self, key: str, entry: dict[str, Any]):
+        """Stores an entry.
+
+        Args:
+            key (str): The cache key.
+            entry (dict[str, Any]): JSON-compatible entry, typically metrics and final rates.
+        """
+        self._write(self._path(key, ".json"), json.dumps(entry).encode())
+
+    def get_artifact(self, key: str, name: str) -> Optional[bytes]:
+        """Looks up a binary artifact stored for an entry.
+
+        Args:
+            key (str): The cache key.
+            name (str): The artifact name (e.g. "pdf").
+
+        Returns:
+            Optional[bytes]: The artifact content, or None on a miss.
+        """
+        return self._read(self._path(key, f".{name}"))
+
+    def put_artifact(self, key: str, name: str, data: bytes):
+        """Stores a binary artifact for an entry.
+
+        Args:
+            key (str): The cache key.
+            name (str): The artifact name (e.g. "pdf").
+            data (bytes): The artifact content.
+        """
+        self._write(self._path(key, f".{name}"), data)
+
+    def _files(self) -> list[os.DirEntry]:
+        """Lists all cache files, skipping temporary files of concurrent writers."""
+        files = []
+        if self.directory.exists():
+            for bucket in os.scandir(self.directory):
+                if bucket.is_dir():
+                    files.extend(entry for entry in os.scandir(bucket.path) if not entry.name.startswith("."))
+        return files
+
+    def size(self) -> int:
+        """Returns the total size of all cache files in bytes."""
+        total = 0
+        for entry in self._files():
+            try:
+                total += entry.stat().st_size
+            except FileNotFoundError:
+                pass
+        return total
+
+    def evict(self):
+        """Removes the least recently used files until the cache is below the low watermark."""
+        files = []
+        for entry in self._files():
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, entry.path))
+        files.sort()
+
+        total = sum(size for _, size, _ in files)
+        target = self.max_bytes * self.LOW_WATERMARK
+        for _, size, path in files:
+            if total <= target:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+        self._estimated_bytes = total
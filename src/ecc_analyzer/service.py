@@ -0,0 +1,524 @@
+"""Long-running asyncio analysis service with a JSON API over HTTP or a Unix socket."""
+
+# Copyright (c) 2025 Linus Held. All rights reserved.
+
+import argparse
+import asyncio
+import hashlib
+import json
+import multiprocessing
+import os
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Optional
+
+from .core import AsilBlock, BinaryModel, BlockFactory, CompiledLayout
+from .evaluation_context import EvaluationContext
+from .interfaces import BlockInterface
+
+# HTTP status lines of the responses the service sends.
+STATUS_TEXT = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 413: "Payload Too Large", 500: "Internal Server Error"}
+
+MAX_BODY_BYTES = 64 * 1024 * 1024
+
+_WORKER_SERVICE: Optional["AnalysisService"] = None
+
+
+class ServedModel:
+    """A parsed model kept warm by the service, with its compiled form if it has one."""
+
+    __slots__ = ("key", "layout", "compiled")
+
+    def __init__(self, key: str, layout: BlockInterface):
+        """Compiles the layout, falling back to tree evaluation if it cannot be compiled.
+
+        Args:
+            key (str): The content hash of the configuration.
+            layout (BlockInterface): The root block of the layout.
+        """
+        self.key = key
+        self.layout = layout
+        try:
+            self.compiled: Optional[CompiledLayout] = CompiledLayout(layout)
+        except ValueError:
+            self.compiled = None
+
+    def evaluate(self, total_fit: float, overrides: dict[str, Any], asil_block: AsilBlock) -> tuple[dict[str, Any], dict, dict]:
+        """Evaluates the model, using the compiled operator when no block parameter is overridden.
+
+        Returns:
+            tuple[dict[str, Any], dict, dict]: The metrics and the final SPFM and LFM rates.
+        """
+        block_overrides = {path: value for path, value in overrides.items() if path != "total_fit"}
+        total_fit = overrides.get("total_fit", total_fit)
+        if self.compiled is not None and not block_overrides:
+            final_spfm, final_lfm = self.compiled.compute_fit({}, {})
+            return asil_block.compute_metrics(total_fit, final_spfm, final_lfm), final_spfm, final_lfm
+        return EvaluationContext(self.layout, total_fit, block_overrides).evaluate(asil_block)
+
+
+class AnalysisService:
+    """Serves analyses of model files and inline models from warm, compiled models.
+
+    Models are parsed and compiled once (see `CompiledLayout`) and kept in an LRU cache
+    keyed by the SHA-256 of the configuration content, so an edited file is reloaded on
+    its next request. Reading, hashing, parsing and compiling run in a thread, so a cold
+    model does not block the event loop. A single analysis runs directly on the event
+    loop only if it is one evaluation of the compiled operator; analyses with block
+    overrides or of models that cannot be compiled evaluate the tree in a thread as well.
+    Sweeps with at least `offload_rows` rows are split into chunks that are evaluated in
+    a process pool, and their result rows are streamed back in request order as JSON
+    Lines.
+
+    Requests are JSON objects naming the model either by ``"config"`` (a .json, .yaml,
+    .yml or .eccb file) or inline as ``"model"`` (the `to_dict` form), plus
+    ``"total_fit"`` and optional ``"overrides"`` (see `ParameterOverrides`):
+
+    * ``POST /analyze``: ``{"config": ..., "total_fit": 2000, "overrides": {...}}``
+      returns the metrics, or with ``"detailed": true`` also the final rates.
+    * ``POST /sweep``: ``{"config": ..., "total_fit": 2000, "rows": [{...}, ...]}``
+      streams one line per row with its overrides followed by its metrics.
+    * ``GET /health`` and ``GET /stats``.
+
+    Fault types declared by inline models are registered for the lifetime of the
+    process and count towards `FaultType.LIMIT`; beyond it, such models are rejected.
+
+    Example:
+        python -m ecc_analyzer.service --port 8765
+        curl -d '{"config": "model.json", "total_fit": 2000}' localhost:8765/analyze
+    """
+
+    def __init__(self, cache_size: int = 32, workers: Optional[int] = None, offload_rows: int = 256, chunk_size: int = 256, config_root: Optional[str] = None):
+        """Initializes the service.
+
+        Args:
+            cache_size (int): Maximum number of warm models.
+            workers (Optional[int]): Size of the process pool for sweeps (default: all CPU
+                cores). 0 evaluates every sweep on the event loop.
+            offload_rows (int): Minimum number of sweep rows for the process pool.
+            chunk_size (int): Number of rows per process pool task.
+            config_root (Optional[str]): If given, "config" paths are resolved relative to
+                this directory and must not leave it.
+        """
+        self.cache_size = cache_size
+        self.workers = (os.cpu_count() or 1) if workers is None else workers
+        self.offload_rows = offload_rows
+        self.chunk_size = chunk_size
+        self.config_root = Path(config_root).resolve() if config_root is not None else None
+        self.asil_block = AsilBlock("Final_Evaluation")
+        self._models: OrderedDict[str, ServedModel] = OrderedDict()
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self.hits = 0
+        self.misses = 0
+
+    def _config_path(self, config: str) -> Path:
+        """Resolves a "config" path, confined to `config_root` if one is set.
+
+        Raises:
+            ValueError: If the path leaves the configuration root or does not exist.
+        """
+        path = Path(config)
+        if self.config_root is not None:
+            path = (self.config_root / path).resolve()
+            if self.config_root not in path.parents:
+                raise ValueError(f"Config '{config}' is outside the configuration root.")
+        if not path.is_file():
+            raise ValueError(f"Config '{config}' does not exist.")
+        return path
+
+    def model(self, request: dict[str, Any]) -> ServedModel:
+        """Returns the warm model of a request, parsing and compiling it on a miss.
+
+        Args:
+            request (dict[str, Any]): The request naming the model by "config" or "model".
+
+        Returns:
+            ServedModel: The cached model.
+
+        Raises:
+            ValueError: If the request names no model or the configuration is invalid.
+        """
+        key, data, suffix = self._source(request)
+        served = self._cached(key)
+        if served is None:
+            served = self._store(self._build(key, data, suffix))
+        return served
+
+    async def model_async(self, request: dict[str, Any]) -> ServedModel:
+        """Returns the warm model of a request like `model`, without blocking the event loop.
+
+        The configuration is read and hashed, and on a miss parsed and compiled, in the
+        default executor of the running loop. The cache itself is only touched on the loop.
+
+        Args:
+            request (dict[str, Any]): The request naming the model by "config" or "model".
+
+        Returns:
+            ServedModel: The cached model.
+
+        Raises:
+            ValueError: If the request names no model or the configuration is invalid.
+        """
+        loop = asyncio.get_running_loop()
+        key, data, suffix = await loop.run_in_executor(None, self._source, request)
+        served = self._cached(key)
+        if served is None:
+            served = self._store(await loop.run_in_executor(None, self._build, key, data, suffix))
+        return served
+
+    def _source(self, request: dict[str, Any]) -> tuple[str, bytes, str]:
+        """Reads the configuration of a request.
+
+        Returns:
+            tuple[str, bytes, str]: The cache key, the configuration bytes and their format suffix.
+
+        Raises:
+            ValueError: If the request names no model or the file cannot be served.
+        """
+        if "config" in request:
+            path = self._config_path(request["config"])
+            data = path.read_bytes()
+            suffix = path.suffix.lower()
+            key = hashlib.sha256(suffix.encode() + b"\0" + data).hexdigest()
+        elif "model" in request:
+            data = json.dumps(request["model"], sort_keys=True, separators=(",", ":")).encode()
+            suffix = ".json"
+            key = hashlib.sha256(b"inline\0" + data).hexdigest()
+        else:
+            raise ValueError("Request names no model; expected 'config' or 'model'.")
+        return key, data, suffix
+
+    def _cached(self, key: str) -> Optional[ServedModel]:
+        """Returns a warm model and marks it as recently used, counting hits and misses."""
+        served = self._models.get(key)
+        if served is None:
+            self.misses += 1
+            return None
+        self._models.move_to_end(key)
+        self.hits += 1
+        return served
+
+    def _store(self, served: ServedModel) -> ServedModel:
+        """Adds a model to the cache, evicting the least recently used ones beyond its size."""
+        self._models[served.key] = served
+        while len(self._models) > self.cache_size:
+            self._models.popitem(last=False)
+        return served
+
+    @staticmethod
+    def _build(key: str, data: bytes, suffix: str) -> ServedModel:
+        """Parses and compiles a configuration."""
+        return ServedModel(key, AnalysisService._parse(data, suffix))
+
+    @staticmethod
+    def _parse(data: bytes, suffix: str) -> BlockInterface:
+        """Builds a layout from configuration bytes in the format given by the file suffix.
+
+        Raises:
+            ValueError: If the format is not supported or the configuration is invalid.
+        """
+        if suffix == ".json":
+            return BlockFactory.from_dict(json.loads(data))
+        if suffix in (".yaml", ".yml"):
+            import yaml
+
+            return BlockFactory.from_dict(yaml.load(data, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader)))
+        if suffix == BinaryModel.SUFFIX:
+            model = BinaryModel(data)
+            try:
+                return model.build()
+            finally:
+                model.release()
+        raise ValueError(f"Unsupported file format: '{suffix}'. Please provide a .json, .yaml, .yml, or .eccb file.")
+
+    def analyze(self, request: dict[str, Any]) -> dict[str, Any]:
+        """Runs a single analysis.
+
+        Args:
+            request (dict[str, Any]): The model, "total_fit", optional "overrides" and
+                optional "detailed" flag.
+
+        Returns:
+            dict[str, Any]: The metrics, or with "detailed" the metrics and final rates
+            (fault types with a zero rate are omitted).
+
+        Raises:
+            ValueError: If the request or an override is invalid.
+        """
+        return self._analyze(self.model(request), request)
+
+    def _analyze(self, served: ServedModel, request: dict[str, Any]) -> dict[str, Any]:
+        """Runs a single analysis of a warm model (see `analyze`)."""
+        metrics, final_spfm, final_lfm = served.evaluate(self._total_fit(request), request.get("overrides") or {}, self.asil_block)
+        if not request.get("detailed"):
+            return metrics
+        return {
+            "metrics": metrics,
+            "rates": {
+                "spfm": {fault.name: rate for fault, rate in final_spfm.items()},
+                "lfm": {fault.name: rate for fault, rate in final_lfm.items()},
+            },
+        }
+
+    async def _analyze_async(self, served: ServedModel, request: dict[str, Any]) -> dict[str, Any]:
+        """Runs `_analyze` without blocking the event loop on a tree evaluation."""
+        overrides = request.get("overrides") or {}
+        if served.compiled is not None and not any(path != "total_fit" for path in overrides):
+            return self._analyze(served, request)
+        return await asyncio.get_running_loop().run_in_executor(None, self._analyze, served, request)
+
+    @staticmethod
+    def _total_fit(request: dict[str, Any]) -> float:
+        """Returns the total FIT of a request.
+
+        Raises:
+            ValueError: If it is missing or not a number.
+        """
+        total_fit = request.get("total_fit")
+        if isinstance(total_fit, bool) or not isinstance(total_fit, (int, float)):
+            raise ValueError("Request needs a numeric 'total_fit'.")
+        return total_fit
+
+    def evaluate_rows(self, request: dict[str, Any], rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Evaluates sweep rows in this process.
+
+        A row that cannot be evaluated, for whatever reason, yields its overrides and an
+        "error" instead of the metrics, so one invalid row does not end the sweep.
+
+        Args:
+            request (dict[str, Any]): The sweep request naming the model and "total_fit".
+            rows (list[dict[str, Any]]): Override sets, one per result row.
+
+        Returns:
+            list[dict[str, Any]]: One result row per input row.
+        """
+        return self._evaluate_rows(self.model(request), self._total_fit(request), rows)
+
+    def _evaluate_rows(self, served: ServedModel, total_fit: float, rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Evaluates sweep rows of a warm model (see `evaluate_rows`)."""
+        results = []
+        for row in rows:
+            try:
+                metrics = served.evaluate(total_fit, row, self.asil_block)[0]
+            except Exception as error:
+                results.append({**row, "error": f"{type(error).__name__}: {error}"})
+            else:
+                results.append({**row, **metrics})
+        return results
+
+    def sweep(self, request: dict[str, Any]) -> AsyncIterator[dict[str, Any]]:
+        """Validates a sweep request and returns the stream of its results.
+
+        Args:
+            request (dict[str, Any]): The model, "total_fit" and the override "rows".
+
+        Returns:
+            AsyncIterator[dict[str, Any]]: One result row per input row, in order
+            (see `evaluate_rows`).
+
+        Raises:
+            ValueError: If the request is invalid.
+        """
+        return self._sweep(self.model(request), request)
+
+    def _sweep(self, served: ServedModel, request: dict[str, Any]) -> AsyncIterator[dict[str, Any]]:
+        """Validates a sweep request of a warm model and returns the stream of its results (see `sweep`)."""
+        rows = request.get("rows")
+        if not isinstance(rows, list) or not all(isinstance(row, dict) for row in rows):
+            raise ValueError("Sweep request needs 'rows', a list of override objects.")
+        total_fit = self._total_fit(request)
+        if self.workers == 0 or len(rows) < self.offload_rows:
+            return self._sweep_here(served, total_fit, rows)
+        return self._sweep_offloaded(request, rows)
+
+    async def _sweep_here(self, served: ServedModel, total_fit: float, rows: list[dict[str, Any]]) -> AsyncIterator[dict[str, Any]]:
+        """Evaluates a small sweep on the event loop, yielding to other requests between chunks."""
+        for start in range(0, len(rows), self.chunk_size):
+            for result in self._evaluate_rows(served, total_fit, rows[start : start + self.chunk_size]):
+                yield result
+            await asyncio.sleep(0)
+
+    async def _sweep_offloaded(self, request: dict[str, Any], rows: list[dict[str, Any]]) -> AsyncIterator[dict[str, Any]]:
+        """Evaluates a large sweep in chunks in the process pool, yielding the chunks in order."""
+        if self._executor is None:
+            # Forked workers would inherit the open client sockets and keep connections
+            # from closing, so the workers start from a clean process.
+            method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+            self._executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=multiprocessing.get_context(method))
+        source = {key: request[key] for key in ("config", "model", "total_fit") if key in request}
+        if "config" in source:
+            source["config"] = str(self._config_path(source["config"]))
+        loop = asyncio.get_running_loop()
+        futures = [loop.run_in_executor(self._executor, _evaluate_rows, source, rows[start : start + self.chunk_size]) for start in range(0, len(rows), self.chunk_size)]
+        try:
+            for future in futures:
+                for result in await future:
+                    yield result
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def stats(self) -> dict[str, Any]:
+        """Returns the cache statistics.
+
+        Returns:
+            dict[str, Any]: The number of warm models, the cache size limit, hits and misses.
+        """
+        return {"models": len(self._models), "cache_size": self.cache_size, "hits": self.hits, "misses": self.misses}
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Serves the HTTP/1.1 requests of one connection, keeping it open between requests."""
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                method, target, _ = request_line.decode("latin-1").split(" ", 2)
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                length = int(headers.get("content-length", 0))
+                if length > MAX_BODY_BYTES:
+                    await self._respond(writer, 413, {"error": "Request body too large."}, keep_alive=False)
+                    break
+                body = await reader.readexactly(length) if length else b""
+                keep_alive = headers.get("connection", "").lower() != "close"
+                await self._dispatch(writer, method, target.split("?", 1)[0], body, keep_alive)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def _dispatch(self, writer: asyncio.StreamWriter, method: str, path: str, body: bytes, keep_alive: bool):
+        """Routes one request and writes its response."""
+        routes = {"/analyze": "POST", "/sweep": "POST", "/health": "GET", "/stats": "GET"}
+        if path not in routes:
+            await self._respond(writer, 404, {"error": f"Unknown path '{path}'."}, keep_alive)
+            return
+        if method != routes[path]:
+            await self._respond(writer, 405, {"error": f"Use {routes[path]} for '{path}'."}, keep_alive)
+            return
+        if path == "/health":
+            await self._respond(writer, 200, {"status": "ok"}, keep_alive)
+            return
+        if path == "/stats":
+            await self._respond(writer, 200, self.stats(), keep_alive)
+            return
+
+        try:
+            request = json.loads(body)
+            if not isinstance(request, dict):
+                raise ValueError("Request body must be a JSON object.")
+            served = await self.model_async(request)
+            if path == "/analyze":
+                result = await self._analyze_async(served, request)
+            else:
+                results = self._sweep(served, request)
+        except ValueError as error:
+            await self._respond(writer, 400, {"error": str(error)}, keep_alive)
+            return
+        except Exception as error:
+            await self._respond(writer, 500, {"error": f"{type(error).__name__}: {error}"}, keep_alive)
+            return
+
+        if path == "/analyze":
+            await self._respond(writer, 200, result, keep_alive)
+            return
+
+        writer.write(self._head(200, "application/x-ndjson", keep_alive, {"Transfer-Encoding": "chunked"}))
+        async for row in results:
+            await self._write_chunk(writer, row)
+        writer.write(b"0\r\n\r\n")
+        await writer.drain()
+
+    @staticmethod
+    def _head(status: int, content_type: str, keep_alive: bool, headers: dict[str, str]) -> bytes:
+        """Encodes the status line and headers of a response."""
+        lines = [f"HTTP/1.1 {status} {STATUS_TEXT[status]}", f"Content-Type: {content_type}", f"Connection: {'keep-alive' if keep_alive else 'close'}"]
+        lines.extend(f"{name}: {value}" for name, value in headers.items())
+        return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+
+    async def _respond(self, writer: asyncio.StreamWriter, status: int, payload: Any, keep_alive: bool):
+        """Writes a complete JSON response."""
+        body = json.dumps(payload).encode()
+        writer.write(self._head(status, "application/json", keep_alive, {"Content-Length": str(len(body))}) + body)
+        await writer.drain()
+
+    @staticmethod
+    async def _write_chunk(writer: asyncio.StreamWriter, row: dict[str, Any]):
+        """Writes one JSON Lines row as an HTTP chunk."""
+        line = (json.dumps(row) + "\n").encode()
+        writer.write(f"{len(line):x}\r\n".encode() + line + b"\r\n")
+        await writer.drain()
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8765, unix_path: Optional[str] = None) -> asyncio.AbstractServer:
+        """Starts listening on a TCP port or a Unix socket.
+
+        Args:
+            host (str): The TCP host to bind.
+            port (int): The TCP port (0 picks a free port).
+            unix_path (Optional[str]): If given, listen on this Unix socket instead of TCP.
+
+        Returns:
+            asyncio.AbstractServer: The running server.
+        """
+        if unix_path is not None:
+            return await asyncio.start_unix_server(self.handle, path=unix_path)
+        return await asyncio.start_server(self.handle, host, port)
+
+    def close(self):
+        """Shuts down the process pool."""
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+
+
+def _evaluate_rows(source: dict[str, Any], rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Evaluates a chunk of sweep rows in a worker process, keeping its models warm."""
+    global _WORKER_SERVICE
+    if _WORKER_SERVICE is None:
+        _WORKER_SERVICE = AnalysisService(cache_size=4, workers=0)
+    return _WORKER_SERVICE.evaluate_rows(source, rows)
+
+
+def main(argv: Optional[list[str]] = None):
+    """Command line entry point.
+
+    Example:
+        python -m ecc_analyzer.service --port 8765 --config-root models
+    """
+    parser = argparse.ArgumentParser(description="Serve safety analyses over a JSON API.")
+    parser.add_argument("--host", default="127.0.0.1", help="TCP host (default: 127.0.0.1).")
+    parser.add_argument("--port", type=int, default=8765, help="TCP port (default: 8765).")
+    parser.add_argument("--unix", default=None, metavar="PATH", help="Listen on a Unix socket instead of TCP.")
+    parser.add_argument("--cache-size", type=int, default=32, help="Maximum number of warm models (default: 32).")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes for sweeps (default: all CPU cores).")
+    parser.add_argument("--config-root", default=None, help="Only serve model files below this directory.")
+    args = parser.parse_args(argv)
+
+    service = AnalysisService(cache_size=args.cache_size, workers=args.workers, config_root=args.config_root)
+
+    async def serve():
+        server = await service.start(args.host, args.port, args.unix)
+        async with server:
+            await server.serve_forever()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        service.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""Streaming evaluation of parameter-set files as a Unix pipeline stage."""
+
+# Copyright (c) 2025 Linus Held. All rights reserved.
+
+import argparse
+import csv
+import json
+import sys
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any, Optional, TextIO
+
+FORMATS = ("csv", "jsonl")
+
+
+def read_rows(stream: TextIO, fmt: str) -> Iterator[dict[str, Any]]:
+    """Lazily reads parameter rows from a CSV or JSON Lines stream.
+
+    Args:
+        stream (TextIO): The input stream.
+        fmt (str): The input format, "csv" or "jsonl".
+
+    Yields:
+        dict[str, Any]: One row per CSV record or non-empty JSON line.
+    """
+    if fmt == "csv":
+        yield from csv.DictReader(stream)
+        return
+    for line in stream:
+        if line.strip():
+            yield json.loads(line)
+
+
+def write_rows(rows: Iterable[dict[str, Any]], stream: TextIO, fmt: str, flush_every: int = 1024) -> int:
+    """Writes result rows to a CSV or JSON Lines stream as they arrive.
+
+    The CSV header is taken from the first row.
+
+    Args:
+        rows (Iterable[dict[str, Any]]): The result rows.
+        stream (TextIO): The output stream.
+        fmt (str): The output format, "csv" or "jsonl".
+        flush_every (int): Number of rows after which the stream is flushed, so that
+            downstream pipeline stages receive results while the input is still read.
+
+    Returns:
+        int: The number of written rows.
+    """
+    writer = None
+    count = 0
+    for row in rows:
+        if fmt == "csv":
+            if writer is None:
+                writer = csv.DictWriter(stream, fieldnames=list(row), lineterminator="\n")
+                writer.writeheader()
+            writer.writerow(row)
+        else:
+            stream.write(json.dumps(row) + "\n")
+        count += 1
+        if count % flush_every == 0:
+            stream.flush()
+    stream.flush()
+    return count
+
+
+def _detect_format(path: str, fmt: Optional[str]) -> str:
+    """Returns the explicit format or derives it from the file extension (default: csv)."""
+    if fmt is not None:
+        return fmt
+    return "jsonl" if Path(path).suffix.lower() in (".jsonl", ".ndjson") else "csv"
+
+
+def main(argv: Optional[list[str]] = None):
+    """Command line entry point.
+
+    Example:
+        python -m ecc_analyzer.streaming model.json --total-fit 4200 --map fit=0/lambda_BE < variants.csv > metrics.csv
+    """
+    from .generic_safety_system import GenericSafetySystem
+
+    parser = argparse.ArgumentParser(description="Evaluate a stream of parameter rows and write one metrics row per input row.")
+    parser.add_argument("config", help="Model file (.json, .yaml, .yml or .eccb).")
+    parser.add_argument("--total-fit", type=float, required=True, help="Total FIT of the system.")
+    parser.add_argument("--map", action="append", default=[], metavar="COLUMN=PATH", help="Map an input column to a parameter path (repeatable).")
+    parser.add_argument("--input", default="-", help="Input file (default: stdin).")
+    parser.add_argument("--output", default="-", help="Output file (default: stdout).")
+    parser.add_argument("--input-format", choices=FORMATS, default=None, help="Input format (default: from extension, else csv).")
+    parser.add_argument("--output-format", choices=FORMATS, default=None, help="Output format (default: from extension, else csv).")
+    args = parser.parse_args(argv)
+
+    columns = None
+    if args.map:
+        columns = {}
+        for mapping in args.map:
+            column, separator, path = mapping.partition("=")
+            if not separator:
+                parser.error(f"Invalid --map '{mapping}', expected COLUMN=PATH.")
+            columns[column] = path
+
+    system = GenericSafetySystem(Path(args.config).stem, args.total_fit, args.config)
+    input_format = _detect_format(args.input, args.input_format)
+    output_format = _detect_format(args.output, args.output_format)
+
+    source = sys.stdin if args.input == "-" else open(args.input, newline="")
+    target = sys.stdout if args.output == "-" else open(args.output, "w", newline="")
+    try:
+        write_rows(system.evaluate_stream(read_rows(source, input_format), columns), target, output_format)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if target is not sys.stdout:
+            target.close()
+
+
+if __name__ == "__main__":
+    main()
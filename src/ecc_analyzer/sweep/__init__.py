@@ -0,0 +1,11 @@
+"""Exposes the parameter sweep and batch execution tools."""
+
+# Copyright (c) 2025 Linus Held. All rights reserved.
+
+from .monte_carlo import MonteCarloSampler
+from .parameter_sweep import ParameterSweep
+from .result_store import ResultStore
+from .results_database import ResultsDatabase
+from .work_queue import FileWorkQueue
+
+__all__ = ["FileWorkQueue", "MonteCarloSampler", "ParameterSweep", "ResultStore", "ResultsDatabase"]
@@ -0,0 +1,205 @@
+"""Checkpointing of completed work for resumable sweeps and sampling runs."""
+
+# Copyright (c) 2025 Linus Held. All rights reserved.
+
+import hashlib
+import json
+import os
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any, Optional
+
+from ..system_base import SystemBase
+
+METRIC_KEYS = ("SPFM", "LFM", "Lambda_RF_Sum")
+
+
+def job_hash(job_spec: dict[str, Any]) -> str:
+    """Computes a stable hash of a job specification.
+
+    Args:
+        job_spec (dict[str, Any]): JSON-compatible description of the job.
+
+    Returns:
+        str: The hex SHA-256 digest of the canonical JSON form.
+    """
+    canonical = json.dumps(job_spec, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def model_spec(system: SystemBase) -> dict[str, Any]:
+    """Describes a model for inclusion in a job specification.
+
+    Args:
+        system (SystemBase): The model of the job.
+
+    Returns:
+        dict[str, Any]: The system name, total FIT and serialized layout.
+    """
+    return {"name": system.name, "total_fit": system.total_fit, "layout": system.system_layout.to_dict()}
+
+
+class OnlineStatistics:
+    """Running count, mean, variance and extremes of the metrics (Welford's algorithm).
+
+    Allows monitoring a long run from its checkpoint without loading all results.
+    """
+
+    def __init__(self, state: Optional[dict[str, Any]] = None):
+        """Initializes empty statistics or restores them from `to_dict` output.
+
+        Args:
+            state (Optional[dict[str, Any]]): Previously saved statistics.
+        """
+        state = state or {}
+        self.count = state.get("count", 0)
+        self.invalid = state.get("invalid", 0)
+        self.mean = state.get("mean", {key: 0.0 for key in METRIC_KEYS})
+        self.m2 = state.get("m2", {key: 0.0 for key in METRIC_KEYS})
+        self.minimum = state.get("min", {})
+        self.maximum = state.get("max", {})
+        self.asil_counts = Counter(state.get("asil_counts", {}))
+
+    def update(self, metrics: dict[str, Any]):
+        """Adds one metrics dictionary to the statistics.
+
+        Args:
+            metrics (dict[str, Any]): The result of one analysis. Error results of rejected
+                parameter sets are only counted as invalid.
+        """
+        if "error" in metrics:
+            self.invalid += 1
+            return
+        self.count += 1
+        for key in METRIC_KEYS:
+            value = metrics[key]
+            delta = value - self.mean[key]
+            self.mean[key] += delta / self.count
+            self.m2[key] += delta * (value - self.mean[key])
+            self.minimum[key] = min(value, self.minimum.get(key, value))
+            self.maximum[key] = max(value, self.maximum.get(key, value))
+        self.asil_counts[metrics["ASIL_Achieved"]] += 1
+
+    def variance(self, key: str) -> float:
+        """Returns the sample variance of a metric (0.0 for fewer than two results)."""
+        return self.m2[key] / (self.count - 1) if self.count > 1 else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serializes the statistics for a checkpoint shard."""
+        return {
+            "count": self.count,
+            "invalid": self.invalid,
+            "mean": self.mean,
+            "m2": self.m2,
+            "min": self.minimum,
+            "max": self.maximum,
+            "asil_counts": dict(self.asil_counts),
+        }
+
+
+class SweepCheckpoint:
+    """Persists completed work ranges so that an interrupted run can resume.
+
+    Work is identified by half-open index ranges (parameter set indices for sweeps,
+    stream indices for sampling). Completed ranges are buffered in memory and written
+    as one shard file per flush, at most every `flush_interval` seconds, so the
+    checkpoint cost stays small compared to the evaluation time. Each shard also carries
+    the online statistics up to that point. Shards are written atomically; a crash loses
+    at most the work since the last flush.
+
+    A checkpoint directory is bound to one job: reopening it with a different job
+    specification raises an error instead of mixing results.
+    """
+
+    def __init__(self, directory: str, job_spec: dict[str, Any], flush_interval: float = 10.0):
+        """Opens or creates a checkpoint directory.
+
+        Args:
+            directory (str): The checkpoint directory.
+            job_spec (dict[str, Any]): JSON-compatible description of the job (model, parameters,
+                seed material). Resuming requires an identical specification.
+            flush_interval (float): Minimum number of seconds between two writes.
+
+        Raises:
+            ValueError: If the directory holds the checkpoint of a different job.
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.flush_interval = flush_interval
+        self.job_hash = job_hash(job_spec)
+
+        job_path = self.directory / "job.json"
+        if job_path.exists():
+            with open(job_path, "r") as f:
+                saved_hash = json.load(f)["job_hash"]
+            if saved_hash != self.job_hash:
+                raise ValueError(f"Checkpoint in '{directory}' belongs to a different job.")
+        else:
+            self._write_atomic(job_path, {"job_hash": self.job_hash, "job": job_spec})
+
+        self.completed: dict[int, tuple[int, list[dict[str, Any]]]] = {}
+        statistics = None
+        shard_paths = sorted(self.directory.glob("shard-*.json"))
+        for shard_path in shard_paths:
+            with open(shard_path, "r") as f:
+                shard = json.load(f)
+            for entry in shard["ranges"]:
+                self.completed[entry["start"]] = (entry["stop"], entry["results"])
+            statistics = shard["statistics"]
+
+        self.statistics = OnlineStatistics(statistics)
+        self._shard_index = len(shard_paths)
+        self._buffer: list[dict[str, Any]] = []
+        self._last_flush = time.monotonic()
+
+    @staticmethod
+    def _write_atomic(path: Path, content: Any):
+        """Writes JSON content so that readers never observe a partial file."""
+        tmp_path = path.with_name(f".{path.name}.tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(content, f)
+        os.replace(tmp_path, path)
+
+    def missing_ranges(self, total: int) -> list[tuple[int, int]]:
+        """Returns the ranges of [0, total) that have not been completed yet.
+
+        Args:
+            total (int): The size of the index space.
+
+        Returns:
+            list[tuple[int, int]]: Sorted, non-overlapping (start, stop) pairs.
+        """
+        missing = []
+        position = 0
+        for start in sorted(self.completed):
+            if start > position:
+                missing.append((position, start))
+            position = max(position, self.completed[start][0])
+        if position < total:
+            missing.append((position, total))
+        return missing
+
+    def add(self, start: int, stop: int, results: list[dict[str, Any]]):
+        """Records a completed range and flushes if the flush interval has passed.
+
+        Args:
+            start (int): First index of the range.
+            stop (int): Index after the last index of the range.
+            results (list[dict[str, Any]]): The metrics of the range.
+        """
+        self.completed[start] = (stop, results)
+        for metrics in results:
+            self.statistics.update(metrics)
+        self._buffer.append({"start": start, "stop": stop, "results": results})
+        if time.monotonic() - self._last_flush >= self.flush_interval:
+            self.flush()
+
+    def flush(self):
+        """Writes all buffered ranges, together with the current statistics, as a new shard."""
+        if self._buffer:
+            shard = {"ranges": self._buffer, "statistics": self.statistics.to_dict()}
+            self._write_atomic(self.directory / f"shard-{self._shard_index:06d}.json", shard)
+            self._shard_index += 1
+            self._buffer = []
+        self._last_flush = time.monotonic()
@@ -0,0 +1,239 @@
+"""Reproducible Monte Carlo uncertainty sampling on top of the parameter sweep."""
+
+# Copyright (c) 2025 Linus Held. All rights reserved.
+
+import hashlib
+import math
+import random
+from collections import Counter
+from collections.abc import Iterator
+from typing import Any, Callable, Optional
+
+from ..core import ParameterOverrides
+from ..system_base import SystemBase
+from .checkpoint import METRIC_KEYS, SweepCheckpoint, model_spec
+from .parameter_sweep import ParameterSweep, worker_system
+
+# Supported distribution names mapped to the `random.Random` method drawing from them.
+DISTRIBUTIONS = {
+    "uniform": "uniform",
+    "normal": "gauss",
+    "lognormal": "lognormvariate",
+    "triangular": "triangular",
+    "beta": "betavariate",
+}
+
+
+def derive_stream_seed(seed: int, stream_index: int) -> int:
+    """Derives the seed of an independent random stream from the master seed.
+
+    The derivation only depends on the master seed and the stream index, never on the
+    worker that happens to evaluate the stream.
+
+    Args:
+        seed (int): The master seed of the run.
+        stream_index (int): The index of the stream.
+
+    Returns:
+        int: A 256-bit seed for the stream's generator.
+    """
+    digest = hashlib.sha256(f"{seed}:{stream_index}".encode()).digest()
+    return int.from_bytes(digest, "big")
+
+
+def draw_sample(rng: random.Random, distributions: dict[str, tuple]) -> dict[str, float]:
+    """Draws one parameter set from the given distributions.
+
+    Args:
+        rng (random.Random): The generator of the current stream.
+        distributions (dict[str, tuple]): Mapping of parameter paths to distribution specs.
+
+    Returns:
+        dict[str, float]: The drawn parameter overrides.
+    """
+    return {path: getattr(rng, DISTRIBUTIONS[spec[0]])(*spec[1:]) for path, spec in distributions.items()}
+
+
+def _sample_streams(distributions: dict[str, tuple], seed: int, stream_size: int, first_stream: int, last_stream: int, n_samples: int) -> list[dict[str, Any]]:
+    """Evaluates consecutive random streams on the worker-local model.
+
+    Args:
+        distributions (dict[str, tuple]): Mapping of parameter paths to distribution specs.
+        seed (int): The master seed of the run.
+        stream_size (int): Number of samples drawn from each stream.
+        first_stream (int): Index of the first stream to evaluate.
+        last_stream (int): Index after the last stream to evaluate.
+        n_samples (int): Total number of samples of the run (caps the last stream).
+
+    Returns:
+        list[dict[str, Any]]: The metrics of every sample, in sample order, or
+        ``{"error": <message>}`` for a draw the model rejects (e.g. a negative rate).
+    """
+    system = worker_system()
+    results = []
+    for stream_index in range(first_stream, last_stream):
+        rng = random.Random(derive_stream_seed(seed, stream_index))
+        start = stream_index * stream_size
+        for _ in range(start, min(n_samples, start + stream_size)):
+            try:
+                results.append(system.run_analysis(draw_sample(rng, distributions)))
+            except ValueError as error:
+                results.append({"error": str(error)})
+    return results
+
+
+def percentile(sorted_values: list[float], q: float) -> float:
+    """Computes a percentile with linear interpolation between closest ranks.
+
+    Args:
+        sorted_values (list[float]): Values in ascending order.
+        q (float): The percentile in the range 0 to 100.
+
+    Returns:
+        float: The interpolated percentile value.
+    """
+    position = (len(sorted_values) - 1) * q / 100.0
+    lower = math.floor(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+
+class MonteCarloSampler:
+    """Propagates parameter uncertainty through a system model by random sampling.
+
+    Samples are grouped into fixed-size random streams. Each stream owns a generator
+    seeded from the master seed and its stream index, and the scheduler only ever hands
+    whole streams to workers. Every sample therefore sees the same random numbers
+    regardless of the number of workers or the order in which chunks complete, and the
+    results are bit-for-bit reproducible.
+
+    Distributions are given as tuples of a name from `DISTRIBUTIONS` followed by the
+    arguments of the corresponding `random.Random` method, e.g. ``("uniform", 0.4, 0.6)``
+    or ``("normal", 0.5, 0.05)``.
+
+    Unbounded distributions can draw values outside the range of their parameter (e.g. a
+    negative failure rate). Such a draw is not evaluated: it is recorded as an error result
+    and counted as an invalid sample, and the summary statistics cover the valid samples.
+    """
+
+    def __init__(
+        self,
+        system_factory: Callable[[], SystemBase],
+        distributions: dict[str, tuple],
+        seed: int,
+        stream_size: int = 256,
+        max_workers: Optional[int] = None,
+    ):
+        """Initializes the sampler.
+
+        Args:
+            system_factory (Callable[[], SystemBase]): Picklable callable that builds the model.
+            distributions (dict[str, tuple]): Mapping of parameter paths to distribution specs.
+            seed (int): The master seed from which all streams are derived.
+            stream_size (int): Number of samples per random stream. Part of the seed material:
+                changing it changes the drawn samples.
+            max_workers (Optional[int]): Number of worker processes. Defaults to all CPU cores.
+
+        Raises:
+            ValueError: If a distribution name is not supported.
+        """
+        for path, spec in distributions.items():
+            if spec[0] not in DISTRIBUTIONS:
+                raise ValueError(f"Unsupported distribution '{spec[0]}' for parameter '{path}'.")
+
+        self.system_factory = system_factory
+        self.distributions = distributions
+        self.seed = seed
+        self.stream_size = stream_size
+        self.sweep = ParameterSweep(system_factory, max_workers=max_workers)
+
+    def seed_material(self, n_samples: int) -> dict[str, Any]:
+        """Describes everything needed to reproduce the random numbers of a run.
+
+        Args:
+            n_samples (int): The number of samples of the run.
+
+        Returns:
+            dict[str, Any]: The seed material recorded in the result metadata.
+        """
+        return {
+            "master_seed": self.seed,
+            "stream_size": self.stream_size,
+            "streams": math.ceil(n_samples / self.stream_size),
+            "stream_seed_derivation": "sha256(f'{master_seed}:{stream_index}')",
+            "generator": "random.Random (MT19937)",
+        }
+
+    def sample(self, n_samples: int, checkpoint_dir: Optional[str] = None) -> list[dict[str, Any]]:
+        """Evaluates the model for `n_samples` random parameter sets.
+
+        Args:
+            n_samples (int): The number of samples to draw.
+            checkpoint_dir (Optional[str]): If given, completed streams and the running statistics
+                are persisted there, and a restarted run with the same model, distributions and
+                seed material resumes without repeating or skipping a stream.
+
+        Returns:
+            list[dict[str, Any]]: The metrics of each sample, in sample order, or
+            ``{"error": <message>}`` for an invalid draw.
+
+        Raises:
+            ValueError: If a distribution targets an unknown parameter.
+        """
+        system = self.system_factory()
+        for path in self.distributions:
+            if path != "total_fit":
+                ParameterOverrides.resolve(system.system_layout, path)
+
+        checkpoint = None
+        if checkpoint_dir is not None:
+            job_spec = {
+                "kind": "monte_carlo",
+                "model": model_spec(system),
+                "distributions": self.distributions,
+                "seed_material": self.seed_material(n_samples),
+            }
+            checkpoint = SweepCheckpoint(checkpoint_dir, job_spec)
+
+        def evaluate_streams(bounds: list[tuple[int, int]]) -> Iterator[list[dict[str, Any]]]:
+            tasks = [(self.distributions, self.seed, self.stream_size, first, last, n_samples) for first, last in bounds]
+            return self.sweep.map_tasks(_sample_streams, tasks)
+
+        results = []
+        for chunk_results in self.sweep.resumable(math.ceil(n_samples / self.stream_size), evaluate_streams, checkpoint):
+            results.extend(chunk_results)
+        return results
+
+    def run(self, n_samples: int, percentiles: tuple[float, ...] = (5.0, 50.0, 95.0), checkpoint_dir: Optional[str] = None) -> dict[str, Any]:
+        """Runs the sampling and summarizes the metric distributions.
+
+        Args:
+            n_samples (int): The number of samples to draw.
+            percentiles (tuple[float, ...]): The percentiles to report for each metric.
+            checkpoint_dir (Optional[str]): Optional directory for checkpoint and resume.
+
+        Returns:
+            dict[str, Any]: A dictionary containing:
+                - "samples" (int): The number of drawn samples.
+                - "invalid_samples" (int): The number of draws the model rejected; they are
+                  left out of the statistics below.
+                - "mean" (dict[str, float]): Mean of SPFM, LFM and Lambda_RF_Sum.
+                - "percentiles" (dict[str, dict[float, float]]): Requested percentiles per metric.
+                - "asil_distribution" (dict[str, int]): Number of samples per achieved ASIL.
+                - "metadata" (dict[str, Any]): The seed material and distributions of the run.
+        """
+        samples = self.sample(n_samples, checkpoint_dir)
+        results = [result for result in samples if "error" not in result]
+
+        summary = {"samples": len(samples), "invalid_samples": len(samples) - len(results), "mean": {}, "percentiles": {}}
+        for key in METRIC_KEYS:
+            values = sorted(r[key] for r in results)
+            summary["mean"][key] = math.fsum(values) / len(values) if values else 0.0
+            summary["percentiles"][key] = {q: percentile(values, q) for q in percentiles} if values else {}
+
+        summary["asil_distribution"] = dict(Counter(r["ASIL_Achieved"] for r in results))
+        summary["metadata"] = {
+            "seed_material": self.seed_material(n_samples),
+            "distributions": {path: list(spec) for path, spec in self.distributions.items()},
+        }
+        return summary
@@ -0,0 +1,341 @@
+"""Multi-process parameter sweep executor with guided chunk scheduling."""
+
+# Copyright (c) 2025 Linus Held. All rights reserved.
+
+import functools
+import itertools
+import math
+import os
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Optional
+
+from ..core import ParameterOverrides
+from ..result_cache import ResultCache
+from ..system_base import SystemBase
+from .checkpoint import SweepCheckpoint, model_spec
+from .result_store import ResultStore
+from .shared_buffers import SharedSweepBuffers, _evaluate_shared_rows, _init_shared_worker
+
+# The model owned by the current worker process. It is built once per worker by
+# `_init_worker` and reused for every chunk the worker evaluates.
+_WORKER_SYSTEM: Optional[SystemBase] = None
+
+
+def _init_worker(system_factory: Callable[[], SystemBase], result_cache: Optional[ResultCache] = None):
+    """Builds the worker-local model once when a worker process starts.
+
+    Args:
+        system_factory (Callable[[], SystemBase]): Picklable callable returning the model.
+        result_cache (Optional[ResultCache]): Result cache to attach to the model, if any.
+    """
+    global _WORKER_SYSTEM
+    _WORKER_SYSTEM = system_factory()
+    _WORKER_SYSTEM.result_cache = result_cache
+
+
+def worker_system() -> SystemBase:
+    """Returns the model built by the initializer of the current worker process.
+
+    Returns:
+        SystemBase: The worker-local model.
+    """
+    return _WORKER_SYSTEM
+
+
+def _evaluate_chunk(parameter_sets: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Evaluates a chunk of parameter sets on the worker-local model.
+
+    Args:
+        parameter_sets (list[dict[str, Any]]): The parameter overrides to evaluate.
+
+    Returns:
+        list[dict[str, Any]]: The metrics for each parameter set, in input order.
+    """
+    system = worker_system()
+    return [system.run_analysis(overrides) for overrides in parameter_sets]
+
+
+def _evaluate_chunk_detailed(parameter_sets: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Evaluates a chunk of parameter sets including the final rates per fault type.
+
+    Args:
+        parameter_sets (list[dict[str, Any]]): The parameter overrides to evaluate.
+
+    Returns:
+        list[dict[str, Any]]: The `run_detailed_analysis` result for each parameter set.
+    """
+    system = worker_system()
+    return [system.run_detailed_analysis(overrides) for overrides in parameter_sets]
+
+
+class ParameterSweep:
+    """Evaluates a system model for many parameter sets across a pool of worker processes.
+
+    Every worker builds the model once from `system_factory` and then evaluates chunks of
+    parameter overrides via `SystemBase.run_analysis`. Chunk sizes follow guided
+    self-scheduling: large chunks first to keep the IPC overhead low, shrinking towards
+    the end so that all workers finish at roughly the same time. Results are always
+    returned in the order of the input parameter sets.
+
+    All parameter sets are checked against the model before any work is dispatched (see
+    `validate`), so an invalid one fails the sweep at once instead of discarding the
+    chunks that were already evaluated.
+    """
+
+    def __init__(
+        self,
+        system_factory: Callable[[], SystemBase],
+        max_workers: Optional[int] = None,
+        min_chunk_size: int = 1,
+        chunks_per_worker: int = 4,
+        shared_memory: bool = False,
+        result_cache: Optional[ResultCache] = None,
+    ):
+        """Initializes the sweep executor.
+
+        Args:
+            system_factory (Callable[[], SystemBase]): Picklable callable that builds the model,
+                e.g. `functools.partial(Lpddr5System, "LPDDR5", 4200.0)`.
+            max_workers (Optional[int]): Number of worker processes. Defaults to all CPU cores.
+                A value of 1 evaluates in the calling process without a pool.
+            min_chunk_size (int): Lower bound for the number of parameter sets per task.
+            chunks_per_worker (int): Controls the chunk shrink rate; each chunk holds at most
+                1 / (chunks_per_worker * max_workers) of the remaining work.
+            shared_memory (bool): If True, the model is built once in the calling process and
+                published together with the input and output sample matrices in shared memory
+                (see `SharedSweepBuffers`). Each worker unpickles the model from shared memory
+                once and reads the inputs through a read-only view; only row offsets travel
+                through the task queue. Requires numeric parameter values.
+            result_cache (Optional[ResultCache]): If given, every worker consults and fills this
+                cache, so parameter sets evaluated by earlier runs are not recomputed.
+        """
+        self.system_factory = system_factory
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.min_chunk_size = max(1, min_chunk_size)
+        self.chunks_per_worker = max(1, chunks_per_worker)
+        self.shared_memory = shared_memory
+        self.result_cache = result_cache
+
+    @staticmethod
+    def grid(axes: dict[str, Sequence[Any]]) -> list[dict[str, Any]]:
+        """Builds the cartesian product of parameter values.
+
+        Args:
+            axes (dict[str, Sequence[Any]]): Mapping of parameter paths to the values to sweep.
+
+        Returns:
+            list[dict[str, Any]]: One parameter set per grid point; the last axis varies fastest.
+        """
+        paths = list(axes.keys())
+        return [dict(zip(paths, values)) for values in itertools.product(*axes.values())]
+
+    def validate(self, parameter_sets: list[dict[str, Any]], system: Optional[SystemBase] = None):
+        """Checks every parameter set against the model, like `SystemBase.run_analysis` would.
+
+        Args:
+            parameter_sets (list[dict[str, Any]]): Parameter overrides keyed by parameter path.
+            system (Optional[SystemBase]): The model to check against. Defaults to a new one
+                from `system_factory`.
+
+        Raises:
+            ValueError: If a parameter set addresses an unknown parameter or holds an invalid
+                value. The message names the index of the first such parameter set.
+        """
+        layout = (system or self.system_factory()).system_layout
+        blocks: dict[tuple[str, ...], Any] = {}
+        for index, parameter_set in enumerate(parameter_sets):
+            try:
+                total_fit = parameter_set.get("total_fit", 0.0)
+                if isinstance(total_fit, bool) or not isinstance(total_fit, (int, float)):
+                    raise ValueError(f"total_fit: expected number, got {total_fit!r}")
+                ParameterOverrides.check(layout, {path: value for path, value in parameter_set.items() if path != "total_fit"}, blocks)
+            except ValueError as error:
+                raise ValueError(f"Invalid parameter set {index}: {error}") from None
+
+    def chunk_bounds(self, total: int, offset: int = 0) -> list[tuple[int, int]]:
+        """Splits the index range [offset, offset + total) into guided self-scheduling chunks.
+
+        Args:
+            total (int): The number of indices to split.
+            offset (int): The first index of the range.
+
+        Returns:
+            list[tuple[int, int]]: Consecutive (start, stop) index pairs covering the range.
+        """
+        bounds = []
+        start = 0
+        divisor = self.chunks_per_worker * self.max_workers
+        while start < total:
+            size = max(self.min_chunk_size, math.ceil((total - start) / divisor))
+            stop = min(total, start + size)
+            bounds.append((offset + start, offset + stop))
+            start = stop
+        return bounds
+
+    def resumable(
+        self,
+        total: int,
+        evaluate_ranges: Callable[[list[tuple[int, int]]], Iterator[list[Any]]],
+        checkpoint: Optional[SweepCheckpoint] = None,
+    ) -> Iterator[list[Any]]:
+        """Evaluates the index range [0, total) chunk-wise, skipping work recorded in a checkpoint.
+
+        Args:
+            total (int): The size of the index space.
+            evaluate_ranges (Callable[[list[tuple[int, int]]], Iterator[list[Any]]]): Evaluates the
+                given (start, stop) ranges and yields the results of each range in order.
+            checkpoint (Optional[SweepCheckpoint]): Records completed ranges, if given.
+
+        Yields:
+            list[Any]: The results of consecutive ranges, in index order.
+        """
+        if checkpoint is None:
+            yield from evaluate_ranges(self.chunk_bounds(total))
+            return
+
+        bounds = [chunk for start, stop in checkpoint.missing_ranges(total) for chunk in self.chunk_bounds(stop - start, start)]
+        fresh = zip(bounds, evaluate_ranges(bounds))
+        try:
+            position = 0
+            while position < total:
+                if position in checkpoint.completed:
+                    position, results = checkpoint.completed[position]
+                else:
+                    (start, position), results = next(fresh)
+                    checkpoint.add(start, position, results)
+                yield results
+        finally:
+            checkpoint.flush()
+
+    def map_tasks(
+        self,
+        function: Callable[..., Any],
+        tasks: list[tuple],
+        initializer: Optional[Callable[..., None]] = None,
+        initargs: tuple = (),
+    ) -> Iterator[Any]:
+        """Runs worker functions on the worker-local model and yields their results in task order.
+
+        This is the scheduling primitive shared by the sweep and the samplers. The function
+        must be a picklable module-level callable that reads the model built by the worker
+        initializer via `worker_system()`.
+
+        Args:
+            function (Callable[..., Any]): The function to run for each task.
+            tasks (list[tuple]): The positional arguments of each task.
+            initializer (Optional[Callable[..., None]]): Replaces the default worker initializer,
+                which builds the model from `system_factory`.
+            initargs (tuple): The arguments of a custom initializer.
+
+        Yields:
+            Any: The return value of each task, in task order.
+        """
+        global _WORKER_SYSTEM
+        if initializer is None:
+            initializer, initargs = _init_worker, (self.system_factory, self.result_cache)
+
+        if self.max_workers == 1:
+            # The calling process acts as the worker; its previous worker-local model is
+            # restored afterwards, so the sweep leaves no model behind.
+            previous = _WORKER_SYSTEM
+            try:
+                initializer(*initargs)
+                for args in tasks:
+                    yield function(*args)
+            finally:
+                _WORKER_SYSTEM = previous
+            return
+
+        with ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            initializer=initializer,
+            initargs=initargs,
+        ) as executor:
+            futures = [executor.submit(function, *args) for args in tasks]
+            for future in futures:
+                yield future.result()
+
+    def _evaluate_ranges(self, parameter_sets: list[dict[str, Any]], bounds: list[tuple[int, int]]) -> Iterator[list[dict[str, Any]]]:
+        """Evaluates the given index ranges of the parameter sets and yields each range's metrics."""
+        if self.shared_memory and self.max_workers > 1 and bounds:
+            rows = [index for start, stop in bounds for index in range(start, stop)]
+            system = self.system_factory()
+            system.result_cache = self.result_cache
+            with SharedSweepBuffers(system, [parameter_sets[index] for index in rows]) as buffers:
+                local_bounds = []
+                row = 0
+                for start, stop in bounds:
+                    local_bounds.append((row, row + stop - start))
+                    row += stop - start
+                chunks = self.map_tasks(_evaluate_shared_rows, local_bounds, initializer=_init_shared_worker, initargs=(buffers.names,))
+                for (start, stop), _ in zip(local_bounds, chunks):
+                    yield buffers.read_outputs(start, stop)
+            return
+
+        tasks = [(parameter_sets[start:stop],) for start, stop in bounds]
+        yield from self.map_tasks(_evaluate_chunk, tasks)
+
+    def imap(self, parameter_sets: Iterable[dict[str, Any]], checkpoint_dir: Optional[str] = None) -> Iterator[dict[str, Any]]:
+        """Evaluates parameter sets and yields their metrics in input order.
+
+        Args:
+            parameter_sets (Iterable[dict[str, Any]]): Parameter overrides keyed by parameter path.
+            checkpoint_dir (Optional[str]): If given, completed chunks are persisted there and a
+                restarted run with the same model and parameter sets resumes from them.
+
+        Yields:
+            dict[str, Any]: The metrics dictionary of each parameter set.
+
+        Raises:
+            ValueError: If a parameter set is invalid (see `validate`).
+        """
+        parameter_sets = list(parameter_sets)
+        system = self.system_factory()
+        self.validate(parameter_sets, system)
+
+        checkpoint = None
+        if checkpoint_dir is not None:
+            job_spec = {"kind": "sweep", "model": model_spec(system), "parameter_sets": parameter_sets}
+            checkpoint = SweepCheckpoint(checkpoint_dir, job_spec)
+
+        evaluate_ranges = functools.partial(self._evaluate_ranges, parameter_sets)
+        for chunk_results in self.resumable(len(parameter_sets), evaluate_ranges, checkpoint):
+            yield from chunk_results
+
+    def run(self, parameter_sets: Iterable[dict[str, Any]], checkpoint_dir: Optional[str] = None) -> list[dict[str, Any]]:
+        """Evaluates all parameter sets.
+
+        Args:
+            parameter_sets (Iterable[dict[str, Any]]): Parameter overrides keyed by parameter path.
+            checkpoint_dir (Optional[str]): Optional directory for checkpoint and resume.
+
+        Returns:
+            list[dict[str, Any]]: The metrics of each parameter set, in input order.
+        """
+        return list(self.imap(parameter_sets, checkpoint_dir))
+
+    def run_to_store(self, parameter_sets: Iterable[dict[str, Any]], store: ResultStore) -> int:
+        """Evaluates all parameter sets and appends metrics and final rates to a result store.
+
+        Results are appended chunk by chunk in input order instead of being collected in
+        memory.
+
+        Args:
+            parameter_sets (Iterable[dict[str, Any]]): Parameter overrides keyed by parameter path.
+            store (ResultStore): The store receiving one row per parameter set.
+
+        Returns:
+            int: The number of appended rows.
+
+        Raises:
+            ValueError: If a parameter set is invalid (see `validate`).
+        """
+        parameter_sets = list(parameter_sets)
+        self.validate(parameter_sets)
+        tasks = [(parameter_sets[start:stop],) for start, stop in self.chunk_bounds(len(parameter_sets))]
+        for chunk_results in self.map_tasks(_evaluate_chunk_detailed, tasks):
+            for result in chunk_results:
+                store.append(result)
+        store.flush()
+        return len(parameter_sets)
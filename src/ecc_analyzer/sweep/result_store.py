@@ -0,0 +1,191 @@
+"""Append-only, memory-mapped columnar store for large numbers of analysis results."""
+
+# Copyright (c) 2025 Linus Held. All rights reserved.
+
+import json
+import mmap
+import os
+from array import array
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+from typing import Any, Optional
+
+from ..core import AsilBlock
+from ..interfaces import FaultType
+
+METRIC_COLUMNS = ("SPFM", "LFM", "Lambda_RF_Sum")
+
+
+class ResultStore:
+    """Stores analysis results as fixed-width columns in one file per column.
+
+    Each row holds SPFM, LFM and Lambda_RF_Sum (float64), the achieved ASIL encoded as
+    its position in `AsilBlock.ASIL_LABELS` (uint8), and the final SPFM and LFM rate of
+    every fault type (float64, columns ``spfm.<FAULT>`` and ``lfm.<FAULT>``). A small
+    JSON header (``header.json``) records the format version, the column types, the ASIL
+    labels and the number of committed rows.
+
+    Rows are buffered and appended to the column files on `flush`. The header is
+    replaced atomically afterwards, so readers and re-opened stores only ever see
+    complete rows; bytes of an interrupted flush are truncated on the next open.
+    Columns are read as zero-copy `memoryview`s of read-only memory maps, so the
+    results never need to fit into RAM.
+
+    Example:
+        with ResultStore("results") as store:
+            store.extend(system.run_detailed_analysis(p) for p in parameter_sets)
+            spfm = store.column("SPFM")
+            worst = min(spfm)
+            spfm.release()
+    """
+
+    VERSION = 1
+    HEADER_FILE = "header.json"
+
+    def __init__(self, directory: str, fault_types: Optional[Sequence[str]] = None, buffer_rows: int = 65536):
+        """Opens an existing store or creates a new one.
+
+        Args:
+            directory (str): The store directory.
+            fault_types (Optional[Sequence[str]]): Fault type names that get rate columns
+                in a new store. Defaults to all members of `FaultType`. Ignored when an
+                existing store is opened.
+            buffer_rows (int): Number of appended rows after which the buffer is flushed.
+
+        Raises:
+            ValueError: If the directory holds a store of an unsupported version.
+        """
+        self.directory = Path(directory)
+        self.buffer_rows = buffer_rows
+        header_path = self.directory / self.HEADER_FILE
+
+        if header_path.exists():
+            header = json.loads(header_path.read_text())
+            if header["version"] != self.VERSION:
+                raise ValueError(f"Unsupported result store version {header['version']} (expected {self.VERSION}).")
+            self.fault_types = list(header["fault_types"])
+            self.columns = dict(header["columns"])
+            self.rows = header["rows"]
+            for name, typecode in self.columns.items():
+                path = self._column_path(name)
+                if path.stat().st_size > self.rows * array(typecode).itemsize:
+                    os.truncate(path, self.rows * array(typecode).itemsize)
+        else:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self.fault_types = list(fault_types) if fault_types is not None else [fault.name for fault in FaultType]
+            self.columns = {name: "d" for name in METRIC_COLUMNS}
+            self.columns["ASIL_Code"] = "B"
+            for fault_name in self.fault_types:
+                self.columns[f"spfm.{fault_name}"] = "d"
+                self.columns[f"lfm.{fault_name}"] = "d"
+            self.rows = 0
+            for name in self.columns:
+                self._column_path(name).touch()
+            self._write_header()
+
+        self._buffers = {name: array(typecode) for name, typecode in self.columns.items()}
+        self._maps: list[mmap.mmap] = []
+
+    def __len__(self) -> int:
+        """Returns the number of committed rows."""
+        return self.rows
+
+    def _column_path(self, name: str) -> Path:
+        """Returns the file holding a column."""
+        return self.directory / f"{name}.col"
+
+    def _write_header(self):
+        """Atomically replaces the header with the current row count."""
+        header = {
+            "version": self.VERSION,
+            "rows": self.rows,
+            "columns": self.columns,
+            "fault_types": self.fault_types,
+            "asil_labels": list(AsilBlock.ASIL_LABELS),
+        }
+        tmp_path = self.directory / f".{self.HEADER_FILE}.{os.getpid()}.tmp"
+        tmp_path.write_text(json.dumps(header, indent=2))
+        os.replace(tmp_path, self.directory / self.HEADER_FILE)
+
+    def append(self, result: dict[str, Any]):
+        """Appends one result.
+
+        Args:
+            result (dict[str, Any]): The result of `SystemBase.run_detailed_analysis`. A plain
+                metrics dictionary is accepted as well; its rate columns are stored as 0.0.
+        """
+        metrics = result.get("metrics", result)
+        rates = result.get("rates", {})
+        spfm_rates = rates.get("spfm", {})
+        lfm_rates = rates.get("lfm", {})
+
+        buffers = self._buffers
+        for name in METRIC_COLUMNS:
+            buffers[name].append(metrics[name])
+        buffers["ASIL_Code"].append(AsilBlock.ASIL_LABELS.index(metrics["ASIL_Achieved"]))
+        for fault_name in self.fault_types:
+            buffers[f"spfm.{fault_name}"].append(spfm_rates.get(fault_name, 0.0))
+            buffers[f"lfm.{fault_name}"].append(lfm_rates.get(fault_name, 0.0))
+
+        if len(buffers["ASIL_Code"]) >= self.buffer_rows:
+            self.flush()
+
+    def extend(self, results: Iterable[dict[str, Any]]):
+        """Appends many results and commits them.
+
+        Args:
+            results (Iterable[dict[str, Any]]): The results to append, consumed lazily.
+        """
+        for result in results:
+            self.append(result)
+        self.flush()
+
+    def flush(self):
+        """Writes the buffered rows to the column files and commits them in the header."""
+        pending = len(self._buffers["ASIL_Code"])
+        if not pending:
+            return
+        for name, buffer in self._buffers.items():
+            with open(self._column_path(name), "ab") as f:
+                buffer.tofile(f)
+            del buffer[:]
+        self.rows += pending
+        self._write_header()
+
+    def column(self, name: str) -> memoryview:
+        """Returns a zero-copy view of the committed values of a column.
+
+        The view is backed by a read-only memory map. Release it (or use it as a context
+        manager) before closing the store.
+
+        Args:
+            name (str): The column name, e.g. "SPFM", "ASIL_Code" or "spfm.SBE".
+
+        Returns:
+            memoryview: A typed view ("d" or "B") with one element per committed row.
+
+        Raises:
+            ValueError: If the column does not exist.
+        """
+        if name not in self.columns:
+            raise ValueError(f"Unknown column '{name}'.")
+        typecode = self.columns[name]
+        if self.rows == 0:
+            return memoryview(array(typecode))
+        with open(self._column_path(name), "rb") as f:
+            mapped = mmap.mmap(f.fileno(), self.rows * array(typecode).itemsize, access=mmap.ACCESS_READ)
+        self._maps.append(mapped)
+        return memoryview(mapped).cast(typecode)
+
+    def close(self):
+        """Commits buffered rows and unmaps all column files."""
+        self.flush()
+        for mapped in self._maps:
+            mapped.close()
+        self._maps.clear()
+
+    def __enter__(self) -> "ResultStore":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,239 @@
+"""Indexed SQLite database for querying sweep outcomes."""
+
+# Copyright (c) 2025 Linus Held. All rights reserved.
+
+import itertools
+import sqlite3
+from collections.abc import Iterable
+from typing import Any, Optional
+
+from ..core import AsilBlock
+from .checkpoint import METRIC_KEYS
+
+# Comparison operators accepted by `ResultsDatabase.query`.
+OPERATORS = ("<", "<=", ">", ">=", "=", "!=")
+
+# Columns of the results table that are not parameter paths.
+RESERVED_COLUMNS = ("id", *METRIC_KEYS, "ASIL_Code")
+
+
+def _quote(identifier: str) -> str:
+    """Quotes a column name for use in SQL."""
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+def _asil_code(label: str) -> int:
+    """Returns the numeric code of an ASIL label."""
+    if label not in AsilBlock.ASIL_LABELS:
+        raise ValueError(f"Unknown ASIL level '{label}', expected one of {AsilBlock.ASIL_LABELS}.")
+    return AsilBlock.ASIL_LABELS.index(label)
+
+
+class ResultsDatabase:
+    """Stores sweep parameters and metrics in a local SQLite database.
+
+    Every result is one row of the ``results`` table. The row holds the metric columns
+    SPFM, LFM and Lambda_RF_Sum, the achieved ASIL as ``ASIL_Code`` (its position in
+    `AsilBlock.ASIL_LABELS`, so lower codes are stricter levels), and one column per
+    parameter path. Parameter columns are added the first time a path appears. The
+    metric columns and the ASIL code are indexed. Parameter columns can be indexed on
+    demand with `create_index`.
+
+    The database runs in WAL mode and inserts in batched transactions, so readers can
+    query while a sweep is still being written.
+
+    Example:
+        db = ResultsDatabase("sweep.sqlite")
+        db.extend(zip(grid, sweep.imap(grid)))
+        db.query(asil="ASIL D", filters={"Lambda_RF_Sum": ("<", 5.0), "DRAM_Path/SEC-DED/mbe_dc": ("<=", 0.6)})
+    """
+
+    def __init__(self, path: str, batch_size: int = 10000):
+        """Opens or creates the database.
+
+        Args:
+            path (str): The database file.
+            batch_size (int): Number of rows inserted per transaction.
+        """
+        self.batch_size = batch_size
+        self.connection = sqlite3.connect(path)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        with self.connection:
+            self.connection.execute("CREATE TABLE IF NOT EXISTS results (id INTEGER PRIMARY KEY, SPFM REAL NOT NULL, LFM REAL NOT NULL, Lambda_RF_Sum REAL NOT NULL, ASIL_Code INTEGER NOT NULL)")
+            for column in (*METRIC_KEYS, "ASIL_Code"):
+                self.connection.execute(f"CREATE INDEX IF NOT EXISTS {_quote('idx_' + column)} ON results ({_quote(column)})")
+        self.columns = [row[1] for row in self.connection.execute("PRAGMA table_info(results)")]
+
+    @property
+    def parameters(self) -> list[str]:
+        """The parameter paths that have a column in the database."""
+        return [column for column in self.columns if column not in RESERVED_COLUMNS]
+
+    def _check_parameter_paths(self, paths: Iterable[str]):
+        """Checks that new parameter paths can become columns.
+
+        SQLite compares column names case-insensitively, so a path must neither match a
+        result column nor differ only by case from another column or path.
+
+        Raises:
+            ValueError: If a path collides with a result column or another column.
+        """
+        reserved = {column.casefold() for column in RESERVED_COLUMNS}
+        collisions = sorted(path for path in paths if path.casefold() in reserved)
+        if collisions:
+            raise ValueError(f"Parameter paths {collisions} collide with result columns.")
+        known = {column.casefold(): column for column in self.columns}
+        for path in paths:
+            column = known.setdefault(path.casefold(), path)
+            if column != path:
+                raise ValueError(f"Parameter path '{path}' differs only by case from column '{column}'.")
+
+    def _add_parameter_columns(self, paths: Iterable[str]):
+        """Adds columns for parameter paths that are not stored yet."""
+        for path in paths:
+            if path not in self.columns:
+                self.connection.execute(f"ALTER TABLE results ADD COLUMN {_quote(path)} REAL")
+                self.columns.append(path)
+
+    def extend(self, results: Iterable[tuple[dict[str, Any], dict[str, Any]]]) -> int:
+        """Inserts results in batched transactions.
+
+        Args:
+            results (Iterable[tuple[dict[str, Any], dict[str, Any]]]): Pairs of parameter
+                overrides and the metrics computed for them, consumed lazily, e.g.
+                ``zip(parameter_sets, sweep.imap(parameter_sets))``.
+
+        Returns:
+            int: The number of inserted rows.
+
+        Raises:
+            ValueError: If a parameter path collides with a result column or differs only
+                by case from another parameter column.
+        """
+        count = 0
+        iterator = iter(results)
+        while True:
+            batch = list(itertools.islice(iterator, self.batch_size))
+            if not batch:
+                return count
+            paths = sorted({path for parameters, _ in batch for path in parameters})
+            self._check_parameter_paths(paths)
+
+            with self.connection:
+                self._add_parameter_columns(paths)
+                columns = [*METRIC_KEYS, "ASIL_Code", *paths]
+                statement = f"INSERT INTO results ({', '.join(_quote(c) for c in columns)}) VALUES ({', '.join('?' * len(columns))})"
+                self.connection.executemany(
+                    statement,
+                    (
+                        (
+                            *(metrics[key] for key in METRIC_KEYS),
+                            AsilBlock.ASIL_LABELS.index(metrics["ASIL_Achieved"]),
+                            *(parameters.get(path) for path in paths),
+                        )
+                        for parameters, metrics in batch
+                    ),
+                )
+            count += len(batch)
+
+    def create_index(self, path: str):
+        """Indexes a parameter column to speed up filters on it.
+
+        Args:
+            path (str): The parameter path.
+
+        Raises:
+            ValueError: If the column does not exist.
+        """
+        if path not in self.columns:
+            raise ValueError(f"Unknown column '{path}'.")
+        with self.connection:
+            self.connection.execute(f"CREATE INDEX IF NOT EXISTS {_quote('idx_' + path)} ON results ({_quote(path)})")
+
+    def _where(self, asil: Optional[str], min_asil: Optional[str], filters: Optional[dict[str, tuple[str, float]]]) -> tuple[str, list[Any]]:
+        """Builds the WHERE clause and its bound values from the query arguments."""
+        clauses = []
+        values: list[Any] = []
+        if asil is not None:
+            clauses.append("ASIL_Code = ?")
+            values.append(_asil_code(asil))
+        if min_asil is not None:
+            clauses.append("ASIL_Code <= ?")
+            values.append(_asil_code(min_asil))
+        for column, (operator, value) in (filters or {}).items():
+            if column not in self.columns:
+                raise ValueError(f"Unknown column '{column}'.")
+            if operator not in OPERATORS:
+                raise ValueError(f"Unsupported operator '{operator}', expected one of {OPERATORS}.")
+            clauses.append(f"{_quote(column)} {operator} ?")
+            values.append(value)
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", values
+
+    def query(
+        self,
+        asil: Optional[str] = None,
+        min_asil: Optional[str] = None,
+        filters: Optional[dict[str, tuple[str, float]]] = None,
+        order_by: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> list[dict[str, Any]]:
+        """Selects the results matching all given conditions.
+
+        Args:
+            asil (Optional[str]): Only results achieving exactly this level, e.g. "ASIL D".
+            min_asil (Optional[str]): Only results achieving this level or a stricter one.
+            filters (Optional[dict[str, tuple[str, float]]]): Conditions on metric or parameter
+                columns as (operator, value) pairs, e.g. ``{"Lambda_RF_Sum": ("<", 5.0)}``.
+            order_by (Optional[str]): Column to sort by (ascending).
+            limit (Optional[int]): Maximum number of returned rows.
+
+        Returns:
+            list[dict[str, Any]]: The matching rows with their metrics ("ASIL_Achieved" as a
+            label) and their parameters (None where a parameter was not overridden).
+
+        Raises:
+            ValueError: If a column, operator or ASIL label is unknown.
+        """
+        where, values = self._where(asil, min_asil, filters)
+        statement = f"SELECT * FROM results{where}"
+        if order_by is not None:
+            if order_by not in self.columns:
+                raise ValueError(f"Unknown column '{order_by}'.")
+            statement += f" ORDER BY {_quote(order_by)}"
+        if limit is not None:
+            statement += " LIMIT ?"
+            values.append(limit)
+
+        cursor = self.connection.execute(statement, values)
+        names = [description[0] for description in cursor.description]
+        rows = []
+        for record in cursor:
+            row = dict(zip(names, record))
+            row["ASIL_Achieved"] = AsilBlock.ASIL_LABELS[row.pop("ASIL_Code")]
+            rows.append(row)
+        return rows
+
+    def count(self, asil: Optional[str] = None, min_asil: Optional[str] = None, filters: Optional[dict[str, tuple[str, float]]] = None) -> int:
+        """Counts the results matching all given conditions.
+
+        Args:
+            asil (Optional[str]): Only results achieving exactly this level.
+            min_asil (Optional[str]): Only results achieving this level or a stricter one.
+            filters (Optional[dict[str, tuple[str, float]]]): Conditions as in `query`.
+
+        Returns:
+            int: The number of matching rows.
+        """
+        where, values = self._where(asil, min_asil, filters)
+        return self.connection.execute(f"SELECT COUNT(*) FROM results{where}", values).fetchone()[0]
+
+    def close(self):
+        """Closes the database connection."""
+        self.connection.close()
+
+    def __enter__(self) -> "ResultsDatabase":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
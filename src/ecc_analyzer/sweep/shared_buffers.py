@@ -0,0 +1,169 @@
+"""Shared-memory publication of a model and its sample buffers for sweep workers."""
+
+# Copyright (c) 2025 Linus Held. All rights reserved.
+
+import math
+import pickle
+import struct
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any
+
+from ..core import AsilBlock
+from ..system_base import SystemBase
+
+OUTPUT_COLUMNS = ("SPFM", "LFM", "Lambda_RF_Sum", "ASIL_Code")
+
+_FLOAT_SIZE = struct.calcsize("d")
+_HEADER = struct.Struct("<Q")
+
+# Attached segments and the unpickled model of the current worker process.
+_WORKER_STATE: dict[str, Any] = {}
+
+
+def _attach(name: str) -> SharedMemory:
+    """Attaches to an existing segment without taking over its lifetime.
+
+    Only the publishing process unlinks the segments. Where supported (Python 3.13+),
+    tracking is disabled for the attachment. On older versions, pool workers share the
+    resource tracker of the publishing process, so the duplicate registration is a no-op.
+
+    Args:
+        name (str): The name of the shared memory segment.
+
+    Returns:
+        SharedMemory: The attached segment.
+    """
+    try:
+        return SharedMemory(name=name, track=False)
+    except TypeError:
+        return SharedMemory(name=name)
+
+
+class SharedSweepBuffers:
+    """Publishes a pickled model plus input and output sample matrices in shared memory.
+
+    The publishing process owns three segments: the model (length-prefixed pickle), the
+    input matrix holding one row of parameter values per sample, and the output matrix
+    holding one row of `OUTPUT_COLUMNS` per sample. Both matrices are row-major float64.
+    A NaN input value means that the parameter keeps its model value for that sample.
+
+    Workers attach by name and then only receive row offsets. The model is not shared
+    zero-copy: each worker unpickles its own copy from the model segment once, at start-up,
+    which saves pickling it into every task but not the per-worker memory. The sample
+    matrices are shared: workers read their inputs through a read-only view and write
+    their outputs in place, each to its own rows.
+    """
+
+    def __init__(self, system: SystemBase, parameter_sets: list[dict[str, float]]):
+        """Creates the segments and fills the model and input buffers.
+
+        Args:
+            system (SystemBase): The model to publish.
+            parameter_sets (list[dict[str, float]]): Numeric parameter overrides per sample.
+        """
+        self.columns = list(dict.fromkeys(path for parameter_set in parameter_sets for path in parameter_set))
+        self.rows = len(parameter_sets)
+
+        model_bytes = pickle.dumps(system, protocol=pickle.HIGHEST_PROTOCOL)
+        self.model = SharedMemory(create=True, size=_HEADER.size + len(model_bytes))
+        _HEADER.pack_into(self.model.buf, 0, len(model_bytes))
+        self.model.buf[_HEADER.size : _HEADER.size + len(model_bytes)] = model_bytes
+
+        self.inputs = SharedMemory(create=True, size=max(1, self.rows * len(self.columns)) * _FLOAT_SIZE)
+        self.outputs = SharedMemory(create=True, size=max(1, self.rows * len(OUTPUT_COLUMNS)) * _FLOAT_SIZE)
+
+        input_view = self.inputs.buf.cast("d")
+        for row, parameter_set in enumerate(parameter_sets):
+            offset = row * len(self.columns)
+            for col, path in enumerate(self.columns):
+                input_view[offset + col] = float(parameter_set.get(path, math.nan))
+        input_view.release()
+
+    @property
+    def names(self) -> tuple[str, str, str, list[str]]:
+        """Returns everything a worker needs to attach: segment names and input columns."""
+        return self.model.name, self.inputs.name, self.outputs.name, self.columns
+
+    def read_outputs(self, start: int, stop: int) -> list[dict[str, Any]]:
+        """Decodes output rows into metrics dictionaries.
+
+        Args:
+            start (int): The first row.
+            stop (int): The row after the last row.
+
+        Returns:
+            list[dict[str, Any]]: One metrics dictionary per row.
+        """
+        width = len(OUTPUT_COLUMNS)
+        view = self.outputs.buf.cast("d")
+        try:
+            return [
+                {
+                    "SPFM": view[row * width],
+                    "LFM": view[row * width + 1],
+                    "Lambda_RF_Sum": view[row * width + 2],
+                    "ASIL_Achieved": AsilBlock.ASIL_LABELS[int(view[row * width + 3])],
+                }
+                for row in range(start, stop)
+            ]
+        finally:
+            view.release()
+
+    def close(self):
+        """Releases and destroys all segments."""
+        for segment in (self.model, self.inputs, self.outputs):
+            segment.close()
+            segment.unlink()
+
+    def __enter__(self) -> "SharedSweepBuffers":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def _init_shared_worker(names: tuple[str, str, str, list[str]]):
+    """Attaches a worker process to the published segments and unpickles its copy of the model.
+
+    Args:
+        names (tuple[str, str, str, list[str]]): The value of `SharedSweepBuffers.names`.
+    """
+    model_name, inputs_name, outputs_name, columns = names
+    model = _attach(model_name)
+    (length,) = _HEADER.unpack_from(model.buf, 0)
+    _WORKER_STATE["system"] = pickle.loads(model.buf[_HEADER.size : _HEADER.size + length])
+    model.close()
+
+    _WORKER_STATE["inputs"] = _attach(inputs_name)
+    _WORKER_STATE["outputs"] = _attach(outputs_name)
+    _WORKER_STATE["columns"] = columns
+
+
+def _evaluate_shared_rows(start: int, stop: int) -> int:
+    """Evaluates a row range in place: reads its inputs and writes its outputs.
+
+    Args:
+        start (int): The first row.
+        stop (int): The row after the last row.
+
+    Returns:
+        int: The number of evaluated rows.
+    """
+    system: SystemBase = _WORKER_STATE["system"]
+    columns: list[str] = _WORKER_STATE["columns"]
+    width = len(OUTPUT_COLUMNS)
+    inputs = _WORKER_STATE["inputs"].buf.toreadonly().cast("d")
+    outputs = _WORKER_STATE["outputs"].buf.cast("d")
+    try:
+        for row in range(start, stop):
+            offset = row * len(columns)
+            overrides = {path: inputs[offset + col] for col, path in enumerate(columns) if not math.isnan(inputs[offset + col])}
+            metrics = system.run_analysis(overrides)
+            outputs[row * width] = metrics["SPFM"]
+            outputs[row * width + 1] = metrics["LFM"]
+            outputs[row * width + 2] = metrics["Lambda_RF_Sum"]
+            outputs[row * width + 3] = AsilBlock.ASIL_LABELS.index(metrics["ASIL_Achieved"])
+    finally:
+        inputs.release()
+        outputs.release()
+    return stop - start
@@ -0,0 +1,272 @@
+"""Broker-less, file-based work queue for distributing sweeps across several hosts."""
+
+# Copyright (c) 2025 Linus Held. All rights reserved.
+
+import argparse
+import json
+import os
+import pickle
+import socket
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Optional
+
+from ..system_base import SystemBase
+
+
+class FileWorkQueue:
+    """Coordinates a sweep through a directory on a filesystem shared by all hosts.
+
+    The coordinator publishes the pickled model and shards the parameter sets into work
+    units below ``pending/``. Workers on any host claim a unit by atomically renaming it
+    into ``claimed/`` (the new name records the worker and the claim time), evaluate it
+    with `SystemBase.run_analysis` and write a result shard into ``results/``. The
+    coordinator merges the shards in unit order and moves units whose lease has expired
+    back to ``pending/``. Evaluating a unit twice is harmless: both shards are identical.
+    A parameter set that the model rejects (e.g. an unknown parameter path) gets
+    ``{"error": <message>}`` as its result, so it cannot make every worker fail on the
+    same unit.
+
+    Every `publish` starts a new job: it clears the state of the previous job and names
+    the units with a new job id, so a directory can be reused and late shards of an
+    earlier job are never merged. Workers reload the model when they claim a unit of a
+    newer job.
+
+    Layout::
+
+        <directory>/job.json
+        <directory>/model.pkl
+        <directory>/pending/unit-000000-<job>.json
+        <directory>/claimed/unit-000001-<job>.json@<worker_id>@<claim_time_ms>
+        <directory>/results/unit-000002-<job>.json
+        <directory>/done
+    """
+
+    CLAIM_SEPARATOR = "@"
+
+    def __init__(self, directory: str):
+        """Initializes the queue on an existing or new directory, creating its folders.
+
+        Workers may therefore start before the coordinator has published a job.
+
+        Args:
+            directory (str): The shared queue directory.
+        """
+        self.directory = Path(directory)
+        self.pending = self.directory / "pending"
+        self.claimed = self.directory / "claimed"
+        self.results = self.directory / "results"
+        self.model_path = self.directory / "model.pkl"
+        self.done_path = self.directory / "done"
+        for folder in (self.pending, self.claimed, self.results):
+            folder.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def _write_atomic(path: Path, data: bytes):
+        """Writes a file so that readers never observe partial content."""
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def _clear(self):
+        """Removes the job description, model, work units, results and done marker of a previous job."""
+        for path in (self.done_path, self.directory / "job.json", self.model_path):
+            path.unlink(missing_ok=True)
+        for folder in (self.pending, self.claimed, self.results):
+            for entry in os.listdir(folder):
+                (folder / entry).unlink(missing_ok=True)
+
+    @staticmethod
+    def _unit_name(unit: int, job: str) -> str:
+        """Returns the file name of a work unit and its result shard."""
+        return f"unit-{unit:06d}-{job}.json"
+
+    @staticmethod
+    def _job_of(unit_name: str) -> str:
+        """Returns the job id contained in a work unit file name."""
+        return unit_name.split(FileWorkQueue.CLAIM_SEPARATOR)[0].rsplit("-", 1)[1].removesuffix(".json")
+
+    def publish(self, system: SystemBase, parameter_sets: list[dict[str, Any]], unit_size: int = 64) -> int:
+        """Publishes the model and shards the parameter sets into work units.
+
+        Any previous job in the directory is discarded first.
+
+        Args:
+            system (SystemBase): The model to evaluate.
+            parameter_sets (list[dict[str, Any]]): Parameter overrides keyed by parameter path.
+            unit_size (int): Number of parameter sets per work unit.
+
+        Returns:
+            int: The number of published work units.
+        """
+        self._clear()
+        job = uuid.uuid4().hex[:16]
+        self._write_atomic(self.model_path, pickle.dumps(system, protocol=pickle.HIGHEST_PROTOCOL))
+
+        units = 0
+        for start in range(0, len(parameter_sets), unit_size):
+            unit = {"unit": units, "start": start, "parameter_sets": parameter_sets[start : start + unit_size]}
+            self._write_atomic(self.pending / self._unit_name(units, job), json.dumps(unit).encode())
+            units += 1
+
+        self._write_atomic(self.directory / "job.json", json.dumps({"job": job, "units": units, "parameter_sets": len(parameter_sets)}).encode())
+        return units
+
+    def claim(self, worker_id: str) -> Optional[Path]:
+        """Atomically claims one pending work unit.
+
+        Args:
+            worker_id (str): Identifier of the claiming worker (must not contain '@').
+
+        Returns:
+            Optional[Path]: The path of the claimed unit, or None if nothing is pending.
+        """
+        for entry in sorted(os.listdir(self.pending)):
+            if not entry.endswith(".json"):
+                continue
+            target = self.claimed / self.CLAIM_SEPARATOR.join((entry, worker_id, str(int(time.time() * 1000))))
+            try:
+                os.rename(self.pending / entry, target)
+            except FileNotFoundError:
+                continue
+            return target
+        return None
+
+    def run_worker(self, worker_id: Optional[str] = None, poll_interval: float = 0.5, idle_timeout: Optional[float] = None) -> int:
+        """Claims and evaluates work units until the coordinator marks the job as done.
+
+        Args:
+            worker_id (Optional[str]): Identifier of this worker. Defaults to "<hostname>-<pid>".
+            poll_interval (float): Seconds to wait before polling an empty queue again.
+            idle_timeout (Optional[float]): Stop after this many seconds without work.
+
+        Returns:
+            int: The number of evaluated work units.
+        """
+        worker_id = (worker_id or f"{socket.gethostname()}-{os.getpid()}").replace(self.CLAIM_SEPARATOR, "_")
+        system: Optional[SystemBase] = None
+        job = None
+
+        processed = 0
+        idle_since = time.monotonic()
+        while not self.done_path.exists():
+            claimed_path = self.claim(worker_id)
+            if claimed_path is None:
+                if idle_timeout is not None and time.monotonic() - idle_since > idle_timeout:
+                    break
+                time.sleep(poll_interval)
+                continue
+
+            try:
+                with open(claimed_path, "r") as f:
+                    unit = json.load(f)
+            except FileNotFoundError:
+                continue
+            if self._job_of(claimed_path.name) != job:
+                # The model is written before the units of its job, so it is current.
+                with open(self.model_path, "rb") as f:
+                    system = pickle.load(f)
+                job = self._job_of(claimed_path.name)
+
+            result_path = self.results / claimed_path.name.split(self.CLAIM_SEPARATOR)[0]
+            if not result_path.exists():
+                shard = {"unit": unit["unit"], "start": unit["start"], "results": [self._evaluate(system, p) for p in unit["parameter_sets"]]}
+                self._write_atomic(result_path, json.dumps(shard).encode())
+
+            try:
+                os.remove(claimed_path)
+            except FileNotFoundError:
+                pass
+            processed += 1
+            idle_since = time.monotonic()
+
+        return processed
+
+    @staticmethod
+    def _evaluate(system: SystemBase, parameter_set: dict[str, Any]) -> dict[str, Any]:
+        """Returns the metrics of a parameter set, or ``{"error": <message>}`` if the model rejects it."""
+        try:
+            return system.run_analysis(parameter_set)
+        except ValueError as error:
+            return {"error": str(error)}
+
+    def requeue_stragglers(self, lease_seconds: float) -> int:
+        """Moves units claimed longer than the lease without a result back to pending.
+
+        Args:
+            lease_seconds (float): Maximum time a worker may hold a unit.
+
+        Returns:
+            int: The number of re-issued units.
+        """
+        now_ms = time.time() * 1000
+        requeued = 0
+        for entry in os.listdir(self.claimed):
+            unit_name, _, claim_time = entry.split(self.CLAIM_SEPARATOR)
+            if (self.results / unit_name).exists() or now_ms - int(claim_time) < lease_seconds * 1000:
+                continue
+            try:
+                os.rename(self.claimed / entry, self.pending / unit_name)
+            except FileNotFoundError:
+                continue
+            requeued += 1
+        return requeued
+
+    def collect(self, lease_seconds: float = 600.0, poll_interval: float = 0.5, timeout: Optional[float] = None) -> list[dict[str, Any]]:
+        """Waits for all result shards, re-issuing stragglers, and merges them in order.
+
+        Args:
+            lease_seconds (float): Maximum time a worker may hold a unit before it is re-issued.
+            poll_interval (float): Seconds between two checks of the result directory.
+            timeout (Optional[float]): Give up after this many seconds.
+
+        Returns:
+            list[dict[str, Any]]: The metrics of every parameter set, in input order, or
+            ``{"error": <message>}`` for a parameter set the model rejected.
+
+        Raises:
+            TimeoutError: If the results are not complete within `timeout`.
+        """
+        with open(self.directory / "job.json", "r") as f:
+            description = json.load(f)
+        job, units = description["job"], description["units"]
+
+        started = time.monotonic()
+        while True:
+            finished = {entry for entry in os.listdir(self.results) if entry.endswith(f"-{job}.json")}
+            if len(finished) >= units:
+                break
+            if timeout is not None and time.monotonic() - started > timeout:
+                raise TimeoutError(f"Only {len(finished)} of {units} work units finished.")
+            self.requeue_stragglers(lease_seconds)
+            time.sleep(poll_interval)
+
+        merged = []
+        for unit in range(units):
+            with open(self.results / self._unit_name(unit, job), "r") as f:
+                merged.extend(json.load(f)["results"])
+
+        self._write_atomic(self.done_path, b"")
+        return merged
+
+
+def main(argv: Optional[list[str]] = None):
+    """Command line entry point for worker hosts.
+
+    Example:
+        python -m ecc_analyzer.sweep.work_queue /shared/sweeps/job-42
+    """
+    parser = argparse.ArgumentParser(description="Evaluate work units of a distributed ECC analyzer sweep.")
+    parser.add_argument("directory", help="Shared queue directory created by the coordinator.")
+    parser.add_argument("--worker-id", default=None, help="Worker identifier (default: <hostname>-<pid>).")
+    parser.add_argument("--poll-interval", type=float, default=0.5, help="Seconds between polls of an empty queue.")
+    parser.add_argument("--idle-timeout", type=float, default=None, help="Exit after this many idle seconds.")
+    args = parser.parse_args(argv)
+
+    FileWorkQueue(args.directory).run_worker(args.worker_id, args.poll_interval, args.idle_timeout)
+
+
+if __name__ == "__main__":
+    main()
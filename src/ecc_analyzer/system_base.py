@@ -3,13 +3,21 @@
 # Copyright (c) 2025 Linus Held. All rights reserved.
 
 import json
+import threading
 from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator
 from typing import Any, Optional
 
-import yaml
+from .core import AsilBlock, BinaryModel, BlockFactory, ObservableBlock, ParameterOverrides
+from .evaluation_context import EvaluationContext
+from .interfaces import BlockInterface
+from .result_cache import ResultCache
 
-from .core import AsilBlock, BlockFactory, ObservableBlock
-from .visualization import SafetyVisualizer
+# PyYAML and the Graphviz-based visualizer are imported on first use only, so that
+# headless workers which merely call `run_analysis` never pay for loading them.
+
+# Result columns of `run_analysis`, which pass-through columns must not shadow.
+METRIC_COLUMNS = ("SPFM", "LFM", "Lambda_RF_Sum", "ASIL_Achieved")
 
 
 class SystemBase(ABC):
@@ -17,6 +25,11 @@ class SystemBase(ABC):
 
     It manages the system layout, triggers FIT rate calculations, and
     handles the generation of architectural visualizations.
+
+    The layout and the total FIT are kept together in one snapshot that is replaced as a
+    whole, and every analysis evaluates an `EvaluationContext` taken from a single read
+    of it. One system instance can therefore serve `run_analysis` calls from many
+    threads, also while the model is reloaded.
     """
 
     def __init__(self, name: str, total_fit: float):
@@ -27,11 +40,24 @@ class SystemBase(ABC):
             total_fit (float): The total FIT rate used as the baseline for metric calculations.
         """
         self.name = name
-        self.total_fit = total_fit
-        self.system_layout = None
+        # Serializes writers of the model snapshot; readers never take it.
+        self._model_lock = threading.Lock()
+        self._model: tuple[Optional[BlockInterface], float] = (None, total_fit)
+        self._digest: tuple[Optional[BlockInterface], str] = (None, "")
         self.asil_block = AsilBlock("Final_Evaluation")
+        self.result_cache: Optional[ResultCache] = None
         self.configure_system()
 
+    def __getstate__(self) -> dict:
+        # Locks cannot be pickled; unpickled systems (e.g. in sweep workers) get their own.
+        state = self.__dict__.copy()
+        state.pop("_model_lock", None)
+        return state
+
+    def __setstate__(self, state: dict):
+        self.__dict__.update(state)
+        self._model_lock = threading.Lock()
+
     @abstractmethod
     def configure_system(self):
         """Abstract method to define the internal hardware structure.
@@ -40,42 +66,203 @@ class SystemBase(ABC):
         """
         pass
 
-    def run_analysis(self) -> dict[str, Any]:
+    @property
+    def system_layout(self) -> Optional[BlockInterface]:
+        """The root block of the system layout."""
+        return self._model[0]
+
+    @system_layout.setter
+    def system_layout(self, layout: Optional[BlockInterface]):
+        with self._model_lock:
+            self._model = (layout, self._model[1])
+
+    @property
+    def total_fit(self) -> float:
+        """The total FIT rate used as the baseline for metric calculations."""
+        return self._model[1]
+
+    @total_fit.setter
+    def total_fit(self, total_fit: float):
+        with self._model_lock:
+            self._model = (self._model[0], total_fit)
+
+    def context(self, overrides: Optional[dict[str, Any]] = None) -> EvaluationContext:
+        """Captures the current model and the overrides of a run in an immutable context.
+
+        Args:
+            overrides (Optional[dict[str, Any]]): Optional parameter overrides for the run
+                (see `run_analysis`).
+
+        Returns:
+            EvaluationContext: The per-run state.
+
+        Raises:
+            ValueError: If `configure_system` has not set a valid system layout.
+        """
+        layout, total_fit = self._model
+        return EvaluationContext(layout, total_fit, overrides)
+
+    def _layout_digest(self, layout: BlockInterface) -> str:
+        """Returns the result cache digest of a layout, hashing each layout object only once.
+
+        Layouts are replaced, not modified, so the digest is recomputed exactly when the
+        snapshot gets a new layout. The memo is read and replaced as one tuple without a
+        lock: concurrent callers may both hash a new layout, but each returns the digest
+        of the layout it was given.
+        """
+        digest = self._digest
+        if digest[0] is not layout:
+            digest = (layout, ResultCache.layout_digest(layout))
+            self._digest = digest
+        return digest[1]
+
+    def run_analysis(self, overrides: Optional[dict[str, Any]] = None) -> dict[str, Any]:
         """Performs a pure mathematical FIT calculation across the system.
 
         No visualization is triggered during this call.
 
+        Args:
+            overrides (Optional[dict[str, Any]]): Optional parameter overrides for this run,
+                keyed by parameter path (see `ParameterOverrides`). The special key
+                "total_fit" replaces the system's total FIT. The model itself is not modified.
+
         Returns:
             dict[str, Any]: A dictionary containing calculated metrics (SPFM, LFM, ASIL level).
 
         Raises:
             ValueError: If `configure_system` has not set a valid system layout.
         """
-        if not self.system_layout:
-            raise ValueError("System layout is not configured.")
+        return self.run_detailed_analysis(overrides)["metrics"]
+
+    def run_detailed_analysis(self, overrides: Optional[dict[str, Any]] = None) -> dict[str, Any]:
+        """Performs the FIT calculation and additionally reports the final rate of every fault type.
 
-        final_spfm, final_lfm = self.system_layout.compute_fit({}, {})
+        Args:
+            overrides (Optional[dict[str, Any]]): Optional parameter overrides for this run
+                (see `run_analysis`).
 
-        return self.asil_block.compute_metrics(self.total_fit, final_spfm, final_lfm)
+        Returns:
+            dict[str, Any]: A dictionary containing:
+                - "metrics" (dict[str, Any]): The metrics returned by `run_analysis`.
+                - "rates" (dict[str, dict[str, float]]): The final "spfm" and "lfm" rates,
+                  keyed by fault type name.
 
-    def generate_pdf(self, filename: Optional[str] = None) -> dict[str, Any]:
+        Raises:
+            ValueError: If `configure_system` has not set a valid system layout.
+        """
+        context = self.context(overrides)
+        result_cache = self.result_cache
+
+        cache_key = None
+        if result_cache is not None:
+            cache_key = result_cache.key(self._layout_digest(context.layout), context.total_fit, overrides)
+            entry = result_cache.get(cache_key) if cache_key is not None else None
+            if entry is not None:
+                return entry
+
+        result = self._detailed_result(*context.evaluate(self.asil_block))
+
+        if cache_key is not None:
+            result_cache.put(cache_key, result)
+        return result
+
+    def evaluate_stream(self, rows: Iterable[dict[str, Any]], columns: Optional[dict[str, str]] = None) -> Iterator[dict[str, Any]]:
+        """Lazily evaluates a stream of parameter rows, one result row per input row.
+
+        Rows are consumed one at a time, so memory use does not depend on the length of
+        the stream. Values given as strings (e.g. read from CSV) are converted to floats.
+
+        Args:
+            rows (Iterable[dict[str, Any]]): The parameter rows, e.g. from `csv.DictReader`.
+            columns (Optional[dict[str, str]]): Mapping of column names to parameter paths
+                (or "total_fit"). Defaults to all columns named "total_fit" or after a valid
+                parameter path. All other columns are passed through unchanged, e.g. to keep
+                part numbers next to their results.
+
+        Yields:
+            dict[str, Any]: The pass-through columns followed by the metrics of the row.
+
+        Raises:
+            ValueError: If a mapped column holds a value that is not a number, or a
+                pass-through column has the name of a metric (see `METRIC_COLUMNS`).
+        """
+        for row in rows:
+            if columns is None:
+                columns = {column: column for column in row if self._is_parameter(column)}
+            overrides = {}
+            result = {}
+            for column, value in row.items():
+                if column not in columns:
+                    if column in METRIC_COLUMNS:
+                        raise ValueError(f"Column '{column}' would be overwritten by the metric of the same name; rename or map it.")
+                    result[column] = value
+                    continue
+                try:
+                    overrides[columns[column]] = float(value) if isinstance(value, str) else value
+                except ValueError:
+                    raise ValueError(f"Column '{column}' holds a non-numeric value: {value!r}") from None
+            result.update(self.run_analysis(overrides))
+            yield result
+
+    def _is_parameter(self, path: str) -> bool:
+        """Checks whether a name is "total_fit" or a valid parameter path of the layout."""
+        if path == "total_fit":
+            return True
+        try:
+            ParameterOverrides.resolve(self.system_layout, path)
+        except ValueError:
+            return False
+        return True
+
+    @staticmethod
+    def _detailed_result(metrics: dict[str, Any], final_spfm: dict, final_lfm: dict) -> dict[str, Any]:
+        """Builds the result of `run_detailed_analysis`, which is also the result cache entry."""
+        return {
+            "metrics": metrics,
+            "rates": {
+                "spfm": {fault.name: rate for fault, rate in final_spfm.items()},
+                "lfm": {fault.name: rate for fault, rate in final_lfm.items()},
+            },
+        }
+
+    def generate_pdf(self, filename: Optional[str] = None, view: bool = True) -> dict[str, Any]:
         """Executes the analysis while simultaneously generating a PDF visualization.
 
-        Uses the Observer Pattern to decouple logic from Graphviz commands.
+        Uses the Observer Pattern to decouple logic from Graphviz commands. If a result
+        cache is attached and holds a rendering of the identical analysis, the cached PDF
+        is written and opened instead of recomputing and re-rendering.
 
         Args:
             filename (Optional[str]): Optional name for the output file.
                 Defaults to "output_<system_name>".
+            view (bool): Whether to open the PDF in the system viewer afterwards.
 
         Returns:
             dict[str, Any]: The final system metrics dictionary.
         """
+        from .visualization import SafetyVisualizer
+
         if filename is None:
             filename = f"output_{self.name}"
 
+        context = self.context()
+        cache_key = None
+        if self.result_cache is not None:
+            cache_key = self.result_cache.key(self._layout_digest(context.layout), context.total_fit)
+            entry = self.result_cache.get(cache_key)
+            pdf = self.result_cache.get_artifact(cache_key, "pdf")
+            if entry is not None and pdf is not None:
+                pdf_path = f"{filename}.pdf"
+                with open(pdf_path, "wb") as f:
+                    f.write(pdf)
+                if view:
+                    SafetyVisualizer.view(pdf_path)
+                return entry["metrics"]
+
         visualizer = SafetyVisualizer(self.name)
 
-        observable_layout = ObservableBlock(self.system_layout)
+        # The visualizer identifies nodes by object, so shared definitions are expanded.
+        observable_layout = ObservableBlock(ParameterOverrides.unshare(context.layout))
         observable_layout.attach(visualizer)
 
         final_spfm, final_lfm, last_ports = observable_layout.compute_fit({}, {}, {})
@@ -89,37 +276,63 @@ class SystemBase(ABC):
             final_lfm,
         )
 
-        visualizer.render(filename)
+        pdf_path = visualizer.render(filename, view=view)
+        metrics = self.asil_block.compute_metrics(context.total_fit, final_spfm, final_lfm)
 
-        return self.asil_block.compute_metrics(self.total_fit, final_spfm, final_lfm)
+        if cache_key is not None:
+            self.result_cache.put(cache_key, self._detailed_result(metrics, final_spfm, final_lfm))
+            with open(pdf_path, "rb") as f:
+                self.result_cache.put_artifact(cache_key, "pdf", f.read())
+        return metrics
 
-    def save_to_yaml(self, file_path: str):
+    def save_to_yaml(self, file_path: str, deduplicate: bool = False):
         """Exports the current system layout to a YAML file.
 
         Args:
             file_path (str): The destination path for the YAML file.
+            deduplicate (bool): If True, repeated components are written once into a
+                definitions section and referenced (see `BlockFactory.deduplicate`).
         """
+        import yaml
+
         config = self.system_layout.to_dict()
+        if deduplicate:
+            config = BlockFactory.deduplicate(config)
+        config = BlockFactory.declare_fault_types(config)
         with open(file_path, "w") as f:
             yaml.dump(config, f, default_flow_style=False)
 
     def load_from_yaml(self, file_path: str):
         """Loads a system layout from a YAML file and reconstructs the block tree.
 
+        Uses the libyaml C loader when PyYAML was built with it.
+
         Args:
             file_path (str): The path to the configuration file.
+
+        Raises:
+            ValueError: If the configuration is invalid (see `BlockFactory.from_dict`).
         """
-        with open(file_path, "r") as f:
-            data = yaml.safe_load(f)
+        import yaml
+
+        # The libyaml-based loader parses large generated configs many times faster.
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        with open(file_path, "rb") as f:
+            data = yaml.load(f, Loader=loader)
         self.system_layout = BlockFactory.from_dict(data)
 
-    def save_to_json(self, file_path: str):
+    def save_to_json(self, file_path: str, deduplicate: bool = False):
         """Exports the current system layout to a JSON file.
 
         Args:
             file_path (str): The destination path for the JSON file.
+            deduplicate (bool): If True, repeated components are written once into a
+                definitions section and referenced (see `BlockFactory.deduplicate`).
         """
         config = self.system_layout.to_dict()
+        if deduplicate:
+            config = BlockFactory.deduplicate(config)
+        config = BlockFactory.declare_fault_types(config)
         with open(file_path, "w") as f:
             json.dump(config, f, indent=4)
 
@@ -132,3 +345,20 @@ class SystemBase(ABC):
         with open(file_path, "r") as f:
             data = json.load(f)
         self.system_layout = BlockFactory.from_dict(data)
+
+    def save_to_binary(self, file_path: str):
+        """Exports the current system layout to a binary model file (see `BinaryModel`).
+
+        Args:
+            file_path (str): The destination path for the ``.eccb`` file.
+        """
+        with open(file_path, "wb") as f:
+            f.write(BinaryModel.dumps(self.system_layout.to_dict()))
+
+    def load_from_binary(self, file_path: str):
+        """Loads a system layout from a binary model file through a memory map.
+
+        Args:
+            file_path (str): The path to the ``.eccb`` file.
+        """
+        self.system_layout = BinaryModel.load(file_path)
@@ -4,6 +4,7 @@
 
 from typing import Any, Optional, TypeAlias
 
+import graphviz
 from graphviz import Digraph
 
 from ..core import (
@@ -12,6 +13,7 @@ from ..core import (
     BasicEvent,
     CoverageBlock,
     PipelineBlock,
+    ReplicateBlock,
     SplitBlock,
     SumBlock,
     TransformationBlock,
@@ -68,6 +70,7 @@ class SafetyVisualizer(SafetyObserver):
     PREFIX_NODE_ASIL = "asil_"
     PREFIX_CLUSTER_SUM = "cluster_sum_"
     PREFIX_CLUSTER_PIPE = "cluster_pipe_"
+    PREFIX_CLUSTER_REP = "cluster_rep_"
     PREFIX_CLUSTER_COMP = "cluster_comp_"
     PREFIX_LANE = "lane_"
     RANK_SAME = "same"
@@ -79,6 +82,10 @@ class SafetyVisualizer(SafetyObserver):
     SUM_FONT_SIZE = "10"
     LABEL_PLUS = "+"
 
+    # --- Replication Node Constants ---
+    PREFIX_NODE_REP = "rep_"
+    LABEL_TIMES = "×"
+
     # --- Key Constants ---
     PATH_TYPE_RF = "rf"
     PATH_TYPE_LATENT = "latent"
@@ -248,6 +255,8 @@ class SafetyVisualizer(SafetyObserver):
             return self._draw_asil_block(block, input_ports, spfm_out, lfm_out, container)
         elif isinstance(block, PipelineBlock):
             return self._draw_pipeline_block(block, input_ports, spfm_in, lfm_in, container)
+        elif isinstance(block, ReplicateBlock):
+            return self._draw_replicate_block(block, input_ports, spfm_in, lfm_in, spfm_out, lfm_out, container, predecessors)
         elif isinstance(block, SumBlock):
             return self._draw_sum_block(
                 block,
@@ -754,6 +763,7 @@ class SafetyVisualizer(SafetyObserver):
                             SplitBlock,
                             TransformationBlock,
                             PipelineBlock,
+                            ReplicateBlock,
                         ),
                     )
 
@@ -820,6 +830,69 @@ class SafetyVisualizer(SafetyObserver):
 
         return final_ports
 
+    def _draw_replicate_block(
+        self,
+        block: ReplicateBlock,
+        input_ports: FlowMap,
+        spfm_in: dict,
+        lfm_in: dict,
+        spfm_out: dict,
+        lfm_out: dict,
+        container: Digraph,
+        predecessors: Optional[list[str]] = None,
+    ) -> FlowMap:
+        """Draws the replicated block once and scales every changed path with a '×N' badge."""
+        cluster_name = f"{self.PREFIX_CLUSTER_REP}{id(block)}"
+        with container.subgraph(name=cluster_name) as c:
+            c.attr(
+                label=f"{block.name} {self.LABEL_TIMES}{block.count}",
+                style=self.STYLE_DOTTED,
+                color=self.COLOR_HEADER,
+                fontcolor=self.COLOR_TEXT_SECONDARY,
+            )
+
+            child_spfm, child_lfm = block.child.compute_fit(spfm_in, lfm_in)
+            child_res = self.on_block_computed(
+                block.child,
+                input_ports,
+                spfm_in,
+                lfm_in,
+                child_spfm,
+                child_lfm,
+                c,
+                predecessors=predecessors,
+            )
+
+            final_ports: FlowMap = {}
+            for fault, ports in child_res.items():
+                final_ports[fault] = {}
+                for path_type, rates, color in (
+                    (self.PATH_TYPE_RF, spfm_out, self.COLOR_RF),
+                    (self.PATH_TYPE_LATENT, lfm_out, self.COLOR_LATENT),
+                ):
+                    port = ports.get(path_type)
+                    if not port or port == input_ports.get(fault, {}).get(path_type):
+                        final_ports[fault][path_type] = port
+                        continue
+
+                    node_id = f"{self.PREFIX_NODE_REP}{fault.name}_{path_type}_{id(block)}"
+                    c.node(
+                        node_id,
+                        label=f"{self.LABEL_TIMES}{block.count}\n{rates.get(fault, 0.0):.2f}",
+                        shape=self.SUM_NODE_SHAPE,
+                        width=self.SUM_NODE_SIZE,
+                        height=self.SUM_NODE_SIZE,
+                        fixedsize=self.FALSE,
+                        color=color,
+                        fontcolor=color,
+                        fontsize=self.FONT_SIZE_DATA,
+                        group=self._get_lane_id(fault.name, path_type),
+                    )
+                    c.edge(port, f"{node_id}:{self.COMPASS_SOUTH}", color=color)
+                    final_ports[fault][path_type] = f"{node_id}:{self.COMPASS_NORTH}"
+
+        return final_ports
+
     def _draw_transformation_block(
         self,
         block: TransformationBlock,
@@ -871,10 +944,23 @@ class SafetyVisualizer(SafetyObserver):
 
         return new_ports
 
-    def render(self, filename: str):
+    def render(self, filename: str, view: bool = True) -> str:
         """Exports the current graph to a PDF file.
 
         Args:
             filename (str): The path/name for the exported file (without extension).
+            view (bool): Whether to open the PDF in the system viewer afterwards.
+
+        Returns:
+            str: The path of the rendered PDF file.
+        """
+        return self.dot.render(filename, view=view)
+
+    @staticmethod
+    def view(pdf_path: str):
+        """Opens an already rendered PDF file with the system viewer.
+
+        Args:
+            pdf_path (str): The path of the PDF file.
         """
-        self.dot.render(filename, view=True)
+        graphviz.view(pdf_path)
@@ -0,0 +1,154 @@
+import pickle
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from ecc_analyzer.core import Base, BasicEvent, ParameterOverrides, SumBlock
+from ecc_analyzer.interfaces import FaultType
+
+
+class Counter(Base):
+    """Component that counts how often its blocks are built."""
+
+    builds = 0
+
+    def __init__(self, name: str, rate: float = 10.0):
+        self.rate = rate
+        super().__init__(name)
+
+    def configure_blocks(self):
+        type(self).builds += 1
+        self.root_block = SumBlock(self.name, [BasicEvent(FaultType.SBE, self.rate)])
+
+
+class LazyCounter(Counter):
+    lazy = True
+    builds = 0
+
+
+def test_eager_component_builds_in_constructor():
+    """Verify that components configure their blocks on construction by default."""
+    component = Counter("Eager")
+
+    assert component.is_configured
+    assert Counter.builds >= 1
+
+
+def test_lazy_component_builds_on_first_use():
+    """Verify that a lazy component is built once, on first evaluation."""
+    LazyCounter.builds = 0
+    component = LazyCounter("Lazy")
+
+    assert not component.is_configured
+    assert LazyCounter.builds == 0
+
+    spfm, _ = component.compute_fit({}, {})
+    component.compute_fit({}, {})
+
+    assert spfm[FaultType.SBE] == pytest.approx(10.0)
+    assert component.is_configured
+    assert LazyCounter.builds == 1
+
+
+def test_lazy_component_untouched_siblings_stay_unbuilt():
+    """Verify that only the components reached by a query are built."""
+    used, unused = LazyCounter("Used"), LazyCounter("Unused")
+
+    assert used.to_dict()["root_block"]["type"] == "SumBlock"
+    assert used.is_configured
+    assert not unused.is_configured
+
+
+def test_lazy_component_overrides_rebuild_copy_only():
+    """Verify that overriding an attribute defers the rebuild of the copy and keeps the original."""
+    component = LazyCounter("Lazy")
+    component.compute_fit({}, {})
+
+    updated = ParameterOverrides.apply(component, {"rate": 4.0})
+
+    assert not updated.is_configured
+    assert updated.compute_fit({}, {})[0][FaultType.SBE] == pytest.approx(4.0)
+    assert component.compute_fit({}, {})[0][FaultType.SBE] == pytest.approx(10.0)
+
+
+class SlowLazyComponent(Base):
+    """Lazy component whose build takes long enough for threads to overlap."""
+
+    lazy = True
+
+    def __init__(self, name: str):
+        self.builds = 0
+        super().__init__(name)
+
+    def configure_blocks(self):
+        self.builds += 1
+        time.sleep(0.01)
+        self.root_block = SumBlock(self.name, [BasicEvent(FaultType.SBE, 10.0)])
+
+
+def test_shared_lazy_component_is_built_once():
+    """Verify that concurrent first evaluations of a lazy component build it once."""
+    component = SlowLazyComponent("Lazy")
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        results = list(executor.map(lambda _: component.compute_fit({}, {}), range(16)))
+
+    assert component.builds == 1
+    assert all(spfm == {FaultType.SBE: 10.0} for spfm, _ in results)
+
+
+class MeetingLazyComponent(Base):
+    """Lazy component whose build waits until another component is being built as well."""
+
+    lazy = True
+
+    def __init__(self, name: str, barrier: threading.Barrier):
+        self.barrier = barrier
+        super().__init__(name)
+
+    def configure_blocks(self):
+        self.barrier.wait()
+        self.root_block = BasicEvent(FaultType.SBE, 1.0)
+
+
+def test_independent_lazy_components_build_concurrently():
+    """Verify that building one component does not block building another."""
+    barrier = threading.Barrier(2, timeout=5)
+    components = [MeetingLazyComponent(f"Lazy_{index}", barrier) for index in range(2)]
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        results = list(executor.map(lambda component: component.compute_fit({}, {}), components))
+
+    assert all(spfm == {FaultType.SBE: 1.0} for spfm, _ in results)
+
+
+def test_components_pickle_with_their_own_lock():
+    """Verify that pickled components get a fresh build lock and still build lazily."""
+    component = LazyCounter("Pickled")
+
+    restored = pickle.loads(pickle.dumps(component))
+
+    assert restored._build_lock is not component._build_lock
+    assert not restored.is_configured
+    assert restored.compute_fit({}, {})[0][FaultType.SBE] == pytest.approx(10.0)
+
+
+class FailingLazyComponent(Base):
+    """Lazy component whose build fails."""
+
+    lazy = True
+
+    def configure_blocks(self):
+        raise ValueError("Broken component.")
+
+
+def test_failed_lazy_build_keeps_failing():
+    """Verify that a failed build is retried and raises instead of passing the rates through."""
+    component = FailingLazyComponent("Broken")
+
+    for _ in range(2):
+        with pytest.raises(ValueError, match="Broken component"):
+            component.compute_fit({FaultType.SBE: 1.0}, {})
+    assert not component.is_configured
@@ -0,0 +1,91 @@
+import pytest
+
+from ecc_analyzer.core import BasicEvent, BinaryModel, BlockFactory, SplitBlock
+from ecc_analyzer.generic_safety_system import GenericSafetySystem
+from ecc_analyzer.interfaces import FaultType
+
+CONFIG = {
+    "type": "SumBlock",
+    "name": "Root",
+    "sub_blocks": [
+        {"type": "BasicEvent", "fault_type": "SBE", "rate": 100.0, "is_spfm": True},
+        {
+            "type": "PipelineBlock",
+            "name": "Path",
+            "sub_blocks": [
+                {"type": "SplitBlock", "name": "Split", "fault_to_split": "SBE", "distribution_rates": {"DBE": 0.25, "MBE": 0.5}, "is_spfm": True},
+                {"type": "CoverageBlock", "target_fault": "DBE", "dc_rate_c_or_cR": 0.9, "dc_rate_latent_cL": 0.05, "is_spfm": False},
+                {"type": "TransformationBlock", "source_fault": "MBE", "target_fault": "OTH", "factor": 0.1},
+            ],
+        },
+        {"type": "BasicEvent", "fault_type": "OTH", "rate": 0.1, "is_spfm": False},
+    ],
+}
+
+
+def test_round_trip_matches_to_dict():
+    """Verify that decoding reproduces the to_dict form and equivalent blocks."""
+    data = BlockFactory.from_dict(CONFIG).to_dict()
+    model = BinaryModel(BinaryModel.dumps(data))
+
+    assert len(model) == 7
+    assert model.to_dict() == data
+    assert model.build().to_dict() == data
+    assert model.build().compute_fit({}, {}) == BlockFactory.from_dict(CONFIG).compute_fit({}, {})
+
+
+def test_lazy_sub_tree_access():
+    """Verify that sub-trees can be decoded without decoding their siblings."""
+    model = BinaryModel(BinaryModel.dumps(CONFIG))
+
+    first, path, last = model.children(0)
+
+    assert last == 6
+    assert model.to_dict(path)["name"] == "Path"
+    block = model.build(model.children(path)[0])
+    assert isinstance(block, SplitBlock)
+    assert block.distribution_rates == {FaultType.DBE: 0.25, FaultType.MBE: 0.5}
+    assert isinstance(model.build(first), BasicEvent)
+
+
+def test_invalid_input():
+    """Verify that foreign files and unsupported blocks are rejected."""
+    data = BinaryModel.dumps(CONFIG)
+
+    with pytest.raises(ValueError, match="bad magic"):
+        BinaryModel(b"JSON" + data[4:])
+    with pytest.raises(ValueError, match="Unsupported binary model version 1"):
+        BinaryModel(data[:4] + (1).to_bytes(2, "little") + data[6:])
+    with pytest.raises(ValueError, match="truncated"):
+        BinaryModel(data[:-4])
+    with pytest.raises(ValueError, match="no binary encoding"):
+        BinaryModel.dumps({"type": "Events", "name": "Events", "root_block": None})
+
+
+def test_generic_system_loads_binary(tmp_path):
+    """Verify that a saved binary model loads through the memory-mapped file path."""
+    model_path = tmp_path / "model.eccb"
+    model_path.write_bytes(BinaryModel.dumps(CONFIG))
+
+    system = GenericSafetySystem("Binary", 1000.0, str(model_path))
+    system.save_to_binary(str(tmp_path / "copy.eccb"))
+
+    assert system.system_layout.to_dict() == CONFIG
+    assert (tmp_path / "copy.eccb").read_bytes() == model_path.read_bytes()
+
+
+def test_declared_fault_types():
+    """Verify that custom fault types are declared in the model and unknown ones are rejected."""
+    with FaultType.scope():
+        custom = FaultType.register("TEST_BINARY_DECLARED")
+        data = {"type": "SumBlock", "name": "Root", "sub_blocks": [{"type": "BasicEvent", "fault_type": custom.name, "rate": 1.0, "is_spfm": True}, CONFIG]}
+        model = BinaryModel(BinaryModel.dumps(data))
+
+        assert model.fault_types == ["TEST_BINARY_DECLARED"]
+        assert model.build().compute_fit({}, {})[0][custom] == 1.0
+
+        undeclared = bytearray(BinaryModel.dumps(CONFIG))
+        undeclared[undeclared.index(b"MBE") : undeclared.index(b"MBE") + 3] = b"XYZ"
+        with pytest.raises(ValueError, match="Unknown fault type 'XYZ': not declared"):
+            BinaryModel(bytes(undeclared)).build()
+        assert FaultType.get("XYZ") is None
@@ -94,3 +94,71 @@ def test_from_dict_missing_type():
     """Verify behavior when the 'type' key is missing."""
     with pytest.raises(ValueError, match="Unknown block type: None"):
         BlockFactory.from_dict({"name": "NoType"})
+
+
+def test_from_dict_reports_all_errors_with_paths():
+    """Verify that one pass reports every invalid value with its location."""
+    data = {
+        "type": "SumBlock",
+        "name": "Root",
+        "sub_blocks": [
+            {"type": "BasicEvent", "fault_type": "XYZ", "rate": "high"},
+            {"type": "SplitBlock", "name": "Split", "fault_to_split": "OTH", "distribution_rates": {"SBE": 0.7, "DBE": 0.6}},
+            {"type": "CoverageBlock", "target_fault": "SBE", "coverage": 0.9},
+        ],
+    }
+
+    with pytest.raises(ValueError) as error:
+        BlockFactory.from_dict(data)
+
+    message = str(error.value)
+    assert "$.sub_blocks[0].fault_type: unknown fault type 'XYZ'" in message
+    assert "$.sub_blocks[0].rate: expected non-negative number, got 'high'" in message
+    assert "$.sub_blocks[1].distribution_rates: sum of distribution rates (1.3000) must not exceed 1.0" in message
+    assert "$.sub_blocks[2].coverage: unknown parameter for CoverageBlock" in message
+    assert "$.sub_blocks[2]: missing required parameter 'dc_rate_c_or_cR' for CoverageBlock" in message
+
+
+def test_from_dict_shared_definitions():
+    """Verify that references share one block object unless they override parameters."""
+    data = {
+        "definitions": {"channel": {"type": "PipelineBlock", "name": "Channel", "sub_blocks": [{"type": "BasicEvent", "fault_type": "SBE", "rate": 10.0}]}},
+        "layout": {
+            "type": "SumBlock",
+            "name": "Root",
+            "sub_blocks": [{"ref": "channel"}, {"ref": "channel"}, {"ref": "channel", "overrides": {"0/lambda_BE": 20.0}}],
+        },
+    }
+    block = BlockFactory.from_dict(data)
+
+    first, second, third = block.sub_blocks
+    assert first is second
+    assert third is not first
+    assert first.sub_blocks[0].lambda_BE == 10.0
+    assert third.sub_blocks[0].lambda_BE == 20.0
+
+
+def test_from_dict_invalid_references():
+    """Verify that unknown and cyclic references are reported with their paths."""
+    data = {
+        "definitions": {"loop": {"type": "SumBlock", "name": "Loop", "sub_blocks": [{"ref": "loop"}]}},
+        "layout": {"type": "SumBlock", "name": "Root", "sub_blocks": [{"ref": "missing"}, {"ref": "loop"}]},
+    }
+
+    with pytest.raises(ValueError) as error:
+        BlockFactory.from_dict(data)
+
+    assert "$.layout.sub_blocks[0]: unknown definition 'missing'" in str(error.value)
+    assert "$.definitions.loop.sub_blocks[0]: definition 'loop' references itself" in str(error.value)
+
+
+def test_deduplicate_round_trip():
+    """Verify that a deduplicated document rebuilds an equivalent layout."""
+    pipe = {"type": "PipelineBlock", "name": "Pipe", "sub_blocks": [{"type": "BasicEvent", "fault_type": "SBE", "rate": 1.0, "is_spfm": True}]}
+    data = {"type": "SumBlock", "name": "Root", "sub_blocks": [{"type": "SumBlock", "name": "Group", "sub_blocks": [pipe, pipe]}] * 2}
+
+    document = BlockFactory.deduplicate(data)
+
+    assert document["layout"]["sub_blocks"] == [{"ref": "Group"}, {"ref": "Group"}]
+    assert document["definitions"]["Group"]["sub_blocks"] == [{"ref": "Pipe"}, {"ref": "Pipe"}]
+    assert BlockFactory.from_dict(document).to_dict() == data
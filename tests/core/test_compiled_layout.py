@@ -0,0 +1,88 @@
+import pytest
+
+from ecc_analyzer.core import BlockFactory, CompiledLayout
+from ecc_analyzer.interfaces import FaultType
+from ecc_analyzer.models.lpddr4 import Lpddr4System
+from ecc_analyzer.models.lpddr5 import Lpddr5System
+
+CONFIG = {
+    "type": "SumBlock",
+    "name": "Root",
+    "sub_blocks": [
+        {"type": "BasicEvent", "fault_type": "SBE", "rate": 100.0, "is_spfm": True},
+        {
+            "type": "PipelineBlock",
+            "name": "Path",
+            "sub_blocks": [
+                {"type": "SplitBlock", "name": "Split", "fault_to_split": "SBE", "distribution_rates": {"DBE": 0.25, "SBE": 0.5}, "is_spfm": True},
+                {"type": "CoverageBlock", "target_fault": "DBE", "dc_rate_c_or_cR": 0.9, "dc_rate_latent_cL": 0.05, "is_spfm": True},
+                {"type": "TransformationBlock", "source_fault": "SBE", "target_fault": "OTH", "factor": 0.1},
+                {"type": "CoverageBlock", "target_fault": "DBE", "dc_rate_c_or_cR": 0.5, "is_spfm": False},
+            ],
+        },
+        {"type": "ReplicateBlock", "name": "Banks", "count": 8, "child": {"type": "BasicEvent", "fault_type": "OTH", "rate": 0.1, "is_spfm": False}},
+    ],
+}
+
+
+def assert_rates_equal(actual, expected):
+    """Compares rate dictionaries, ignoring entries that are zero."""
+    assert actual.keys() == {fault for fault, rate in expected.items() if rate != 0.0}
+    for fault, rate in actual.items():
+        assert rate == pytest.approx(expected[fault])
+
+
+@pytest.mark.parametrize("mode", ["sparse", "dense"])
+def test_matches_interpreter(mode):
+    """Verify that both evaluation modes reproduce the block-by-block results."""
+    layout = BlockFactory.from_dict(CONFIG)
+    compiled = CompiledLayout(layout, mode=mode)
+    spfm_in = {FaultType.SBE: 3.0, FaultType.DBE: 1.0}
+    lfm_in = {FaultType.DBE: 2.0}
+
+    spfm, lfm = compiled.compute_fit(spfm_in, lfm_in)
+    expected_spfm, expected_lfm = layout.compute_fit(spfm_in, lfm_in)
+    assert_rates_equal(spfm, expected_spfm)
+    assert_rates_equal(lfm, expected_lfm)
+    assert compiled.to_dict() == layout.to_dict()
+
+
+@pytest.mark.parametrize("system_class", [Lpddr4System, Lpddr5System])
+def test_reference_models(system_class):
+    """Verify that the shipped models give the same metrics when compiled."""
+    system = system_class("Compiled", 2000.0)
+    expected = system.run_analysis()
+    system.system_layout = CompiledLayout(system.system_layout)
+
+    metrics = system.run_analysis()
+    for key, value in expected.items():
+        assert metrics[key] == pytest.approx(value)
+
+
+def test_sparse_memory_scales_with_interactions():
+    """Verify that thousands of fault types are stored sparsely and evaluated correctly."""
+    with FaultType.scope():
+        faults = [FaultType.register(f"TEST_SPARSE_{index}") for index in range(2000)]
+        layout = {
+            "type": "PipelineBlock",
+            "name": "Chain",
+            "sub_blocks": [{"type": "BasicEvent", "fault_type": fault.name, "rate": 1.0} for fault in faults]
+            + [{"type": "CoverageBlock", "target_fault": fault.name, "dc_rate_c_or_cR": 0.9} for fault in faults],
+        }
+        compiled = CompiledLayout(BlockFactory.from_dict(layout))
+
+        statistics = compiled.statistics()
+        assert statistics["mode"] == "sparse"
+        assert statistics["nnz"] == 3 * len(faults)
+        spfm, lfm = compiled.compute_fit({}, {})
+        assert spfm[faults[-1]] == pytest.approx(0.1)
+        assert lfm[faults[0]] == pytest.approx(0.9)
+
+
+def test_rejects_uncompilable_layouts():
+    """Verify that unknown modes and per-instance parameters are reported."""
+    layout = BlockFactory.from_dict(CONFIG)
+    with pytest.raises(ValueError, match="Unknown mode"):
+        CompiledLayout(layout, mode="fast")
+    with pytest.raises(ValueError, match="per-instance parameters cannot be compiled"):
+        CompiledLayout(BlockFactory.from_dict({"type": "ReplicateBlock", "name": "Banks", "count": 2, "child": {"type": "BasicEvent", "fault_type": "SBE", "rate": [1.0, 2.0]}}))
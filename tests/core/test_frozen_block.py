@@ -0,0 +1,94 @@
+import copy
+import gc
+import pickle
+import tracemalloc
+
+import pytest
+
+from ecc_analyzer.core import BasicEvent, BlockFactory, CoverageBlock, ParameterOverrides, SplitBlock
+from ecc_analyzer.interfaces import FaultType
+
+# Traced bytes per block when building the benchmark layout below. Blocks with a
+# per-instance __dict__ and their own distribution maps needed about 167 bytes; the
+# slotted blocks with shared maps need about 87.
+BYTES_PER_BLOCK_BUDGET = 110
+
+
+def bank(index: int) -> dict:
+    return {
+        "type": "PipelineBlock",
+        "name": "Bank",
+        "sub_blocks": [
+            {"type": "BasicEvent", "fault_type": "SBE", "rate": 1.0 + index % 10},
+            {"type": "SplitBlock", "name": "Split", "fault_to_split": "SBE", "distribution_rates": {"DBE": 0.25, "MBE": 0.5}},
+            {"type": "CoverageBlock", "target_fault": "DBE", "dc_rate_c_or_cR": 0.9},
+            {"type": "TransformationBlock", "source_fault": "MBE", "target_fault": "OTH", "factor": 0.1},
+        ],
+    }
+
+
+def test_blocks_are_immutable_and_hashable():
+    """Verify that blocks reject assignment, compare by value and survive pickling."""
+    block = BlockFactory.from_dict(bank(0))
+    twin = BlockFactory.from_dict(bank(0))
+
+    with pytest.raises(AttributeError, match="immutable"):
+        block.name = "Other"
+    assert not hasattr(block, "__dict__")
+    assert block == twin and hash(block) == hash(twin)
+    assert block != BlockFactory.from_dict(bank(1))
+    assert len({block, twin, copy.copy(block), pickle.loads(pickle.dumps(block))}) == 1
+
+
+def test_replace_and_overrides_copy_on_write():
+    """Verify that replace and parameter overrides leave the original untouched."""
+    event = BasicEvent(FaultType.SBE, 1.0)
+    assert event.replace(lambda_BE=2.0).lambda_BE == 2.0
+    assert event.lambda_BE == 1.0
+    with pytest.raises(ValueError, match="Unknown parameter"):
+        event.replace(rate=2.0)
+
+    layout = BlockFactory.from_dict(bank(0))
+    changed = ParameterOverrides.apply(layout, {"0/lambda_BE": 5.0})
+    assert changed.sub_blocks[0].lambda_BE == 5.0
+    assert layout.sub_blocks[0].lambda_BE == 1.0
+    assert changed.sub_blocks[1] is layout.sub_blocks[1]
+
+
+def test_replace_goes_through_the_constructor():
+    """Verify that replace recomputes derived values and applies the constructor checks."""
+    split = SplitBlock("Split", FaultType.SBE, {FaultType.DBE: 0.5})
+    with pytest.raises(ValueError, match="must not exceed 1.0"):
+        split.replace(distribution_rates={FaultType.DBE: 0.75, FaultType.MBE: 0.5})
+
+    coverage = CoverageBlock(FaultType.SBE, 0.9)
+    assert coverage.replace(c_R=0.6).c_L == pytest.approx(0.4)
+    assert coverage.replace(c_L=0.2).replace(c_R=0.6).c_L == 0.2
+
+
+def test_distribution_maps_and_names_are_shared():
+    """Verify that equal rate maps and names are stored once."""
+    first = SplitBlock("Split", FaultType.SBE, {FaultType.DBE: 0.25})
+    second = SplitBlock("".join(["Spl", "it"]), FaultType.SBE, {FaultType.DBE: 0.25})
+
+    assert first.distribution_rates is second.distribution_rates
+    assert first.name is second.name
+    with pytest.raises(TypeError):
+        first.distribution_rates[FaultType.DBE] = 0.5
+
+
+def test_memory_per_block_benchmark():
+    """Benchmark the traced memory per block of a large layout against the budget."""
+    config = {"type": "SumBlock", "name": "Root", "sub_blocks": [bank(index) for index in range(1000)]}
+    block_count = 1 + 5 * 1000
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        layout = BlockFactory.from_dict(config)
+        traced, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert len(layout.sub_blocks) == 1000
+    assert traced / block_count < BYTES_PER_BLOCK_BUDGET
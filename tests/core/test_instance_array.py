@@ -0,0 +1,111 @@
+import pytest
+
+from ecc_analyzer.core import BinaryModel, BlockFactory, InstanceArray, PipelineBlock, SumBlock
+from ecc_analyzer.evaluation_context import EvaluationContext
+from ecc_analyzer.interfaces import FaultType
+from ecc_analyzer.visualization import SafetyVisualizer
+
+RATES = [1.0, 2.0, 3.0, 4.0]
+COVERAGES = [0.9, 0.9, 0.5, 0.5]
+CONFIG = {
+    "type": "ReplicateBlock",
+    "name": "Banks",
+    "count": 4,
+    "child": {
+        "type": "PipelineBlock",
+        "name": "Bank",
+        "sub_blocks": [
+            {"type": "BasicEvent", "fault_type": "SBE", "rate": RATES, "is_spfm": True},
+            {"type": "CoverageBlock", "target_fault": "SBE", "dc_rate_c_or_cR": COVERAGES, "dc_rate_latent_cL": 0.8, "is_spfm": True},
+        ],
+    },
+}
+
+
+def test_broadcasting_arithmetic():
+    """Verify element-wise operations with arrays and numbers."""
+    values = InstanceArray([1.0, 2.0])
+
+    assert 1.0 - values == InstanceArray([0.0, -1.0])
+    assert values * InstanceArray([3.0, 4.0]) == InstanceArray([3.0, 8.0])
+    assert 0.5 + values * 2 == InstanceArray([2.5, 4.5])
+    assert InstanceArray.any_positive(InstanceArray([0.0, 1.0])) and not InstanceArray.any_positive(InstanceArray([0.0, -1.0]))
+    assert InstanceArray.any_positive(0.5) and not InstanceArray.any_positive(0.0)
+    with pytest.raises(TypeError):
+        values > 1.5
+    assert f"{values:.1f}" == "1.0–2.0"
+    with pytest.raises(ValueError, match="cannot be combined"):
+        values + InstanceArray([1.0, 2.0, 3.0])
+
+
+def test_heterogeneous_instances_match_separate_subtrees():
+    """Verify that one vectorized pass equals a SumBlock of individually parameterized copies."""
+    copies = []
+    for rate, coverage in zip(RATES, COVERAGES):
+        child = {**CONFIG["child"], "sub_blocks": [dict(CONFIG["child"]["sub_blocks"][0], rate=rate), dict(CONFIG["child"]["sub_blocks"][1], dc_rate_c_or_cR=coverage)]}
+        copies.append(BlockFactory.from_dict(child))
+
+    spfm, lfm = BlockFactory.from_dict(CONFIG).compute_fit({FaultType.SBE: 1.0}, {})
+    expected_spfm, expected_lfm = SumBlock("Banks", copies).compute_fit({FaultType.SBE: 1.0}, {})
+
+    assert isinstance(spfm[FaultType.SBE], float)
+    assert spfm[FaultType.SBE] == pytest.approx(expected_spfm[FaultType.SBE])
+    assert lfm[FaultType.SBE] == pytest.approx(expected_lfm[FaultType.SBE])
+
+
+def test_serialization_and_validation():
+    """Verify that arrays survive to_dict and that malformed arrays are reported."""
+    assert BlockFactory.from_dict(CONFIG).to_dict() == CONFIG
+
+    with pytest.raises(ValueError, match=r"rate\[1\]: expected non-negative number"):
+        BlockFactory.from_dict({**CONFIG, "count": 2, "child": {"type": "BasicEvent", "fault_type": "SBE", "rate": [1.0, "x"]}})
+    with pytest.raises(ValueError, match=r"\$\.rate: per-instance values are only allowed inside a ReplicateBlock"):
+        BlockFactory.from_dict({"type": "BasicEvent", "fault_type": "SBE", "rate": [1.0, 2.0]})
+    with pytest.raises(ValueError, match=r"\$\.child\.sub_blocks\[0\]\.rate: expected 3 values, one per instance of ReplicateBlock 'Banks' \(\$\), got 4"):
+        BlockFactory.from_dict({**CONFIG, "count": 3})
+    with pytest.raises(ValueError, match="Per-instance parameter 'rate' has no binary encoding"):
+        BinaryModel.dumps(CONFIG)
+
+
+def test_nested_replicate_blocks():
+    """Verify per-instance values on either level of nested ReplicateBlocks and their checks."""
+
+    def nested(outer_rate, inner_child):
+        inner = {"type": "ReplicateBlock", "name": "Dies", "count": 3, "child": inner_child}
+        coverage = {"type": "CoverageBlock", "target_fault": "SBE", "dc_rate_c_or_cR": 0.5}
+        child = {"type": "PipelineBlock", "name": "Channel", "sub_blocks": [{"type": "BasicEvent", "fault_type": "SBE", "rate": outer_rate}, inner, coverage]}
+        return BlockFactory.from_dict({"type": "ReplicateBlock", "name": "Channels", "count": 2, "child": child})
+
+    def event(rate):
+        return {"type": "BasicEvent", "fault_type": "SBE", "rate": rate}
+
+    transform = {"type": "TransformationBlock", "source_fault": "SBE", "target_fault": "DBE", "factor": 0.1}
+
+    assert nested(1.0, event([1.0, 2.0, 3.0])).compute_fit({}, {})[0][FaultType.SBE] == pytest.approx(2 * 0.5 * (1.0 + 6.0))
+    assert nested([1.0, 2.0], event(1.0)).compute_fit({}, {})[0][FaultType.SBE] == pytest.approx(0.5 * (1.0 + 2.0) + 2 * 0.5 * 3.0)
+    assert nested([1.0, 2.0], transform).compute_fit({}, {})[0][FaultType.DBE] == pytest.approx(3 * 0.1 * (1.0 + 2.0))
+
+    with pytest.raises(ValueError, match=r"\$\.child\.sub_blocks\[1\]: nested ReplicateBlock with per-instance values inside ReplicateBlock 'Channels'"):
+        nested([1.0, 2.0], event([1.0, 2.0, 3.0]))
+    with pytest.raises(ValueError, match=r"\$\.child\.sub_blocks\[1\]\.child\.rate: expected 3 values, one per instance of ReplicateBlock 'Dies'"):
+        nested(1.0, event([1.0, 2.0]))
+
+
+def test_overrides_with_per_instance_values_are_checked():
+    """Verify that per-instance override values must fit their ReplicateBlock."""
+    layout = BlockFactory.from_dict(CONFIG)
+
+    assert EvaluationContext(layout, 1000.0, {"0/0/lambda_BE": [1.0, 1.0, 1.0, 1.0]}).evaluate()[1][FaultType.SBE] > 0
+    with pytest.raises(ValueError, match=r"Invalid overrides: \$\.child\.sub_blocks\[0\]\.rate: expected 4 values"):
+        EvaluationContext(layout, 1000.0, {"0/0/lambda_BE": [1.0, 2.0]}).evaluate()
+
+
+def test_visualizer_labels_show_ranges():
+    """Verify that per-instance parameters are drawn as value ranges."""
+    block = BlockFactory.from_dict(CONFIG)
+    assert isinstance(block.child, PipelineBlock)
+    visualizer = SafetyVisualizer("test")
+    spfm, lfm = block.compute_fit({}, {})
+    visualizer.on_block_computed(block, {}, {}, {}, spfm, lfm)
+
+    assert "1.00–4.00" in visualizer.dot.source
@@ -0,0 +1,68 @@
+import pytest
+
+from ecc_analyzer.core import BasicEvent, CoverageBlock, ParallelLayout, PipelineBlock, SplitBlock, SumBlock
+from ecc_analyzer.core.parallel_layout import block_cost
+from ecc_analyzer.interfaces import FaultType
+from ecc_analyzer.models.lpddr5 import Lpddr5System
+
+
+def channel(index: int, events: int = 20) -> PipelineBlock:
+    """Builds one generated per-channel sub-tree."""
+    sources = SumBlock(f"Sources_{index}", [BasicEvent(FaultType.SBE, 1.0 + index + 0.1 * event) for event in range(events)])
+    return PipelineBlock(
+        f"Channel_{index}",
+        [
+            sources,
+            BasicEvent(FaultType.DBE, 0.3 * index),
+            CoverageBlock(FaultType.SBE, 0.9, 0.5),
+            SplitBlock(f"Split_{index}", FaultType.DBE, {FaultType.DBE: 0.8, FaultType.TBE: 0.2}),
+        ],
+    )
+
+
+def system_layout(channels: int = 6) -> SumBlock:
+    """Builds a system of independent channels plus light shared sources."""
+    return PipelineBlock("System", [SumBlock("Channels", [channel(index) for index in range(channels)] + [BasicEvent(FaultType.OTH, 2.0)])])
+
+
+def test_block_cost_counts_evaluations():
+    """Verify that the cost model counts every block of a sub-tree once."""
+    assert block_cost(BasicEvent(FaultType.SBE, 1.0)) == 1
+    assert block_cost(channel(0, events=20)) == 1 + (1 + 20) + 3
+
+
+def test_plan_offloads_heavy_children_only():
+    """Verify that only SumBlocks with several heavy children are parallelized."""
+    layout = ParallelLayout(system_layout(), executor="thread", min_cost=10)
+    assert layout.offloaded == {(0,): (0, 1, 2, 3, 4, 5)}
+
+    light = ParallelLayout(system_layout(), executor="thread", min_cost=1000)
+    assert light.offloaded == {}
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_parallel_matches_sequential(executor):
+    """Verify that the parallel evaluation yields exactly the sequential rates."""
+    layout = system_layout()
+    expected = layout.compute_fit({}, {})
+
+    with ParallelLayout(layout, workers=2, executor=executor, min_cost=10) as parallel:
+        assert parallel.compute_fit({}, {}) == expected
+        assert parallel.compute_fit({FaultType.SBE: 5.0}, {}) == layout.compute_fit({FaultType.SBE: 5.0}, {})
+
+
+def test_parallel_descends_into_components():
+    """Verify that parallel work is found below components and pipelines."""
+    system = Lpddr5System("LPDDR5", 2000.0)
+    expected = system.run_analysis()
+
+    with ParallelLayout(system.system_layout, workers=2, executor="thread", min_cost=2) as parallel:
+        assert parallel.offloaded
+        system.system_layout = parallel
+        assert system.run_analysis() == expected
+
+
+def test_unknown_executor():
+    """Verify that an unknown pool kind is rejected."""
+    with pytest.raises(ValueError, match="Unknown executor"):
+        ParallelLayout(system_layout(), executor="gpu")
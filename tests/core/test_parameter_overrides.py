@@ -0,0 +1,108 @@
+import pytest
+
+from ecc_analyzer.core import BasicEvent, CoverageBlock, ParameterOverrides, PipelineBlock, SplitBlock, SumBlock
+from ecc_analyzer.interfaces import FaultType
+from ecc_analyzer.models.lpddr5 import Lpddr5System
+
+
+def build_layout():
+    return SumBlock(
+        "Root",
+        [
+            PipelineBlock("Path", [BasicEvent(FaultType.SBE, 100.0), CoverageBlock(FaultType.SBE, 0.9)]),
+            BasicEvent(FaultType.OTH, 5.0),
+        ],
+    )
+
+
+def test_resolve_by_name_and_index():
+    """Verify that path segments select children by name or position."""
+    layout = build_layout()
+
+    assert ParameterOverrides.resolve(layout, "Path/0/lambda_BE") == 100.0
+    assert ParameterOverrides.resolve(layout, "Path/1/c_R") == 0.9
+    assert ParameterOverrides.resolve(layout, "1/lambda_BE") == 5.0
+
+
+def test_apply_does_not_mutate_original():
+    """Verify that overrides produce a new tree and share untouched sub-trees."""
+    layout = build_layout()
+
+    updated = ParameterOverrides.apply(layout, {"Path/1/c_R": 0.5})
+
+    assert layout.sub_blocks[0].sub_blocks[1].c_R == 0.9
+    assert updated.sub_blocks[0].sub_blocks[1].c_R == 0.5
+    assert updated.sub_blocks[1] is layout.sub_blocks[1]
+
+    spfm, _ = updated.compute_fit({}, {})
+    assert spfm[FaultType.SBE] == pytest.approx(50.0)
+
+
+def test_apply_rederives_default_latent_coverage():
+    """Verify that a c_R override yields the same block as building it with the new c_R."""
+    layout = build_layout()
+
+    updated = ParameterOverrides.apply(layout, {"Path/1/c_R": 0.5})
+    explicit = ParameterOverrides.apply(SumBlock("Root", [CoverageBlock(FaultType.SBE, 0.9, 0.2)]), {"0/c_R": 0.5})
+
+    assert updated.sub_blocks[0].sub_blocks[1] == CoverageBlock(FaultType.SBE, 0.5)
+    assert updated.compute_fit({}, {})[1][FaultType.SBE] == pytest.approx(50.0)
+    assert explicit.sub_blocks[0].c_L == 0.2
+
+
+def test_apply_checks_values():
+    """Verify that override values pass the same checks as configuration values."""
+    layout = build_layout()
+
+    with pytest.raises(ValueError, match="lambda_BE: expected non-negative number, got -5.0"):
+        ParameterOverrides.apply(layout, {"Path/0/lambda_BE": -5.0})
+    with pytest.raises(ValueError, match="c_R: expected number in \\[0, 1\\], got 'abc'"):
+        ParameterOverrides.apply(layout, {"Path/1/c_R": "abc"})
+    with pytest.raises(ValueError, match="distribution_rates.MBE: rate 1.5 is outside"):
+        ParameterOverrides.apply(SplitBlock("Split", FaultType.SBE, {FaultType.MBE: 0.5}), {"distribution_rates": {FaultType.MBE: 1.5}})
+    with pytest.raises(ValueError, match="mbe_dc: expected number"):
+        ParameterOverrides.apply(Lpddr5System("Override_Test", total_fit=4200.0).system_layout, {"DRAM_Path/SEC-DED/mbe_dc": "high"})
+
+
+def test_apply_reconfigures_components():
+    """Verify that overriding a component attribute rebuilds its internal blocks."""
+    system = Lpddr5System("Override_Test", total_fit=4200.0)
+    baseline = system.run_analysis()
+
+    updated = system.run_analysis({"DRAM_Path/SEC-DED/mbe_dc": 0.9, "total_fit": 5000.0})
+
+    assert updated["Lambda_RF_Sum"] < baseline["Lambda_RF_Sum"]
+    assert system.run_analysis() == baseline
+
+
+def test_unknown_parameter():
+    """Verify that invalid paths raise a ValueError."""
+    layout = build_layout()
+
+    with pytest.raises(ValueError, match="has no child 'Missing'"):
+        ParameterOverrides.apply(layout, {"Missing/rate": 1.0})
+    with pytest.raises(ValueError, match="Unknown parameter 'rate'"):
+        ParameterOverrides.apply(layout, {"Path/0/rate": 1.0})
+    with pytest.raises(ValueError, match="Invalid parameter path"):
+        ParameterOverrides.resolve(layout, "Path//c_R")
+
+
+def test_parameter_index_paths_round_trip():
+    """Verify that every indexed path resolves to its listed value."""
+    system = Lpddr5System("Index_Test", total_fit=4200.0)
+    index = ParameterOverrides.parameter_index(system.system_layout)
+
+    assert index["DRAM_Path/SEC-DED/mbe_dc"] == 0.5
+    assert all(ParameterOverrides.resolve(system.system_layout, path) == value for path, value in index.items())
+
+
+def test_unshare_expands_shared_blocks():
+    """Verify that shared block objects are expanded into distinct copies."""
+    event = BasicEvent(FaultType.SBE, 1.0)
+    layout = SumBlock("Root", [event, event])
+
+    expanded = ParameterOverrides.unshare(layout)
+
+    assert expanded.sub_blocks[0] is not expanded.sub_blocks[1]
+    assert layout.sub_blocks[0] is layout.sub_blocks[1]
+    assert expanded.compute_fit({}, {}) == layout.compute_fit({}, {})
@@ -16,7 +16,7 @@ def test_pipeline_block_initialization():
     pipeline = PipelineBlock(name=name, sub_blocks=sub_blocks)
 
     assert pipeline.name == name
-    assert pipeline.sub_blocks == sub_blocks
+    assert pipeline.sub_blocks == tuple(sub_blocks)
 
 
 def test_pipeline_block_sequential_processing():
@@ -0,0 +1,78 @@
+import copy
+
+import pytest
+
+from ecc_analyzer.core import BinaryModel, BlockFactory, ParameterOverrides, ReplicateBlock, SumBlock
+from ecc_analyzer.interfaces import FaultType
+from ecc_analyzer.visualization import SafetyVisualizer
+
+CHANNEL = {
+    "type": "PipelineBlock",
+    "name": "Channel",
+    "sub_blocks": [
+        {"type": "BasicEvent", "fault_type": "SBE", "rate": 10.0, "is_spfm": True},
+        {"type": "SplitBlock", "name": "Split", "fault_to_split": "SBE", "distribution_rates": {"DBE": 0.25}, "is_spfm": True},
+        {"type": "CoverageBlock", "target_fault": "DBE", "dc_rate_c_or_cR": 0.9, "dc_rate_latent_cL": 0.5, "is_spfm": True},
+    ],
+}
+CONFIG = {"type": "ReplicateBlock", "name": "Channels", "child": CHANNEL, "count": 16}
+
+
+def test_matches_sum_of_copies():
+    """Verify that replicating a block equals summing that many independent copies."""
+    spfm_in = {FaultType.SBE: 1.0, FaultType.DBE: 2.0}
+    lfm_in = {FaultType.DBE: 0.5}
+    replicated = BlockFactory.from_dict(CONFIG)
+    copies = SumBlock("Channels", [BlockFactory.from_dict(copy.deepcopy(CHANNEL)) for _ in range(16)])
+
+    spfm, lfm = replicated.compute_fit(spfm_in, lfm_in)
+    expected_spfm, expected_lfm = copies.compute_fit(spfm_in, lfm_in)
+    assert spfm.keys() == expected_spfm.keys()
+    assert lfm.keys() == expected_lfm.keys()
+    for fault in expected_spfm:
+        assert spfm[fault] == pytest.approx(expected_spfm[fault])
+    for fault in expected_lfm:
+        assert lfm[fault] == pytest.approx(expected_lfm[fault])
+
+
+def test_serialization_round_trips():
+    """Verify the dictionary and binary forms reproduce the block."""
+    block = BlockFactory.from_dict(CONFIG)
+
+    assert block.to_dict() == CONFIG
+    assert BlockFactory.from_dict(block.to_dict()).compute_fit({}, {}) == block.compute_fit({}, {})
+    assert BinaryModel(BinaryModel.dumps(CONFIG)).to_dict() == CONFIG
+    assert BinaryModel(BinaryModel.dumps(CONFIG)).build().to_dict() == CONFIG
+
+
+def test_invalid_count_is_rejected():
+    """Verify that the factory rejects a count that is not a non-negative integer."""
+    with pytest.raises(ValueError, match=r"\$\.count: expected non-negative integer"):
+        BlockFactory.from_dict({**CONFIG, "count": 2.5})
+    with pytest.raises(ValueError, match="must not be negative"):
+        ReplicateBlock("Channels", BlockFactory.from_dict(CHANNEL), -1)
+
+
+def test_parameter_paths_reach_through_replication():
+    """Verify that the count and the child parameters can be overridden."""
+    block = BlockFactory.from_dict(CONFIG)
+    index = ParameterOverrides.parameter_index(block)
+    assert index["count"] == 16
+    assert index["Channel/0/lambda_BE"] == 10.0
+
+    doubled = ParameterOverrides.apply(block, {"count": 32, "Channel/0/lambda_BE": 5.0})
+    assert doubled.compute_fit({}, {}) == pytest.approx(block.compute_fit({}, {}))
+    assert block.count == 16
+
+
+def test_visualizer_draws_child_once_with_badge():
+    """Verify that the diagram holds one instance of the child and a scaling badge."""
+    block = BlockFactory.from_dict(CONFIG)
+    visualizer = SafetyVisualizer("test")
+    spfm, lfm = block.compute_fit({}, {})
+    visualizer.on_block_computed(block, {}, {}, {}, spfm, lfm)
+
+    source = visualizer.dot.source
+    assert source.count("cluster_pipe_") == 1
+    assert "Channels ×16" in source
+    assert "rep_SBE_rf" in source
@@ -14,7 +14,7 @@ def test_sum_block_initialization():
     sb = SumBlock(name=name, sub_blocks=sub_blocks)
 
     assert sb.name == name
-    assert sb.sub_blocks == sub_blocks
+    assert sb.sub_blocks == tuple(sub_blocks)
 
 
 def test_sum_block_compute_fit_complex():
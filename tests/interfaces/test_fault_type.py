@@ -0,0 +1,95 @@
+import copy
+import json
+import pickle
+
+import pytest
+
+from ecc_analyzer.core import BinaryModel, BlockFactory
+from ecc_analyzer.generic_safety_system import GenericSafetySystem
+from ecc_analyzer.interfaces import FaultType
+
+
+def test_builtin_members_behave_like_enum():
+    """Verify the Enum-style interface of the built-in fault types."""
+    assert FaultType.SBE is FaultType["SBE"] is FaultType.__members__["SBE"]
+    assert FaultType.SBE.name == "SBE"
+    assert FaultType.SBE.value == 1
+    assert [fault.name for fault in FaultType][: len(FaultType.BUILTIN)] == list(FaultType.BUILTIN)
+    assert FaultType.is_builtin(FaultType.SBE_IF)
+    assert repr(FaultType.DBE) == "<FaultType.DBE: 2>"
+
+
+def test_register_interns_dense_ids():
+    """Verify that registered fault types are interned with consecutive indices."""
+    first = FaultType.register("TEST_REGION_0")
+    second = FaultType.register("TEST_REGION_1")
+
+    assert FaultType.register("TEST_REGION_0") is first
+    assert second.index == first.index + 1
+    assert FaultType.TEST_REGION_1 is second
+    assert not FaultType.is_builtin(first)
+    assert pickle.loads(pickle.dumps(first)) is first
+    assert copy.deepcopy({first: 1.0}) == {first: 1.0}
+    with pytest.raises(ValueError, match="valid identifier"):
+        FaultType.register("bank-0")
+    with pytest.raises(ValueError, match="reserved"):
+        FaultType.register("register")
+
+
+def test_scope_removes_temporary_fault_types():
+    """Verify that fault types registered within a scope are removed again."""
+    count = len(FaultType)
+    with FaultType.scope():
+        fault = FaultType.register("TEST_SCOPED")
+        assert FaultType.by_index(fault.index) is fault
+
+    assert len(FaultType) == count
+    assert FaultType.get("TEST_SCOPED") is None
+    assert FaultType.by_index(0) is FaultType.SBE
+
+
+def test_configs_declare_fault_types(tmp_path):
+    """Verify that documents declare new fault types and that saved models round-trip."""
+    layout = {
+        "type": "PipelineBlock",
+        "name": "Bank",
+        "sub_blocks": [
+            {"type": "BasicEvent", "fault_type": "TEST_BIT_7", "rate": 10.0, "is_spfm": True},
+            {"type": "SplitBlock", "name": "Split", "fault_to_split": "TEST_BIT_7", "distribution_rates": {"SBE": 0.5, "TEST_BIT_8": 0.5}, "is_spfm": True},
+        ],
+    }
+    with pytest.raises(ValueError, match="unknown fault type 'TEST_BIT_7'"):
+        BlockFactory.from_dict(layout)
+
+    block = BlockFactory.from_dict({"fault_types": ["TEST_BIT_7", "TEST_BIT_8"], "layout": layout})
+    spfm, _ = block.compute_fit({}, {})
+    assert spfm == {FaultType.SBE: 5.0, FaultType.TEST_BIT_8: 5.0}
+    assert BlockFactory.declare_fault_types(block.to_dict()) == {"fault_types": ["TEST_BIT_7", "TEST_BIT_8"], "layout": block.to_dict()}
+
+    config_path = tmp_path / "bank.json"
+    config_path.write_text(json.dumps({"fault_types": ["TEST_BIT_7", "TEST_BIT_8"], "layout": layout}))
+    system = GenericSafetySystem("Bank", 100.0, str(config_path))
+    system.save_to_json(str(tmp_path / "saved.json"))
+    assert json.loads((tmp_path / "saved.json").read_text())["fault_types"] == ["TEST_BIT_7", "TEST_BIT_8"]
+    system.load_from_json(str(tmp_path / "saved.json"))
+    assert system.system_layout.to_dict() == block.to_dict()
+    assert BinaryModel(BinaryModel.dumps(block.to_dict())).build().to_dict() == block.to_dict()
+
+
+def test_invalid_declarations_are_reported():
+    """Verify that malformed fault type declarations are reported with their path."""
+    with pytest.raises(ValueError, match=r"\$\.fault_types\[1\]: Invalid fault type name"):
+        BlockFactory.from_dict({"fault_types": ["TEST_OK", "not ok"], "layout": {"type": "BasicEvent", "fault_type": "TEST_OK", "rate": 1.0}})
+
+
+def test_registration_is_bounded(monkeypatch):
+    """Verify that malformed names are rejected and the number of fault types is capped."""
+    with pytest.raises(ValueError, match="valid identifier"):
+        FaultType.register(["SBE"])
+
+    with FaultType.scope():
+        monkeypatch.setattr(FaultType, "LIMIT", len(FaultType) + 1)
+        FaultType.register("TEST_LIMITED_0")
+        assert FaultType.register("SBE") is FaultType.SBE
+        with pytest.raises(ValueError, match=r"\$\.fault_types\[0\]: Cannot register fault type 'TEST_LIMITED_1'"):
+            BlockFactory.from_dict({"fault_types": ["TEST_LIMITED_1"], "layout": {"type": "BasicEvent", "fault_type": "SBE", "rate": 1.0}})
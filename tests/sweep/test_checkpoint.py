@@ -0,0 +1,37 @@
+import pytest
+
+from ecc_analyzer.sweep.checkpoint import OnlineStatistics, SweepCheckpoint
+
+SPEC = {"kind": "test", "size": 10}
+
+
+def metrics(value):
+    return {"SPFM": value, "LFM": value / 2, "Lambda_RF_Sum": value * 10, "ASIL_Achieved": "ASIL B"}
+
+
+def test_missing_ranges_and_reload(tmp_path):
+    """Verify that flushed ranges survive a restart and gaps are reported."""
+    checkpoint = SweepCheckpoint(str(tmp_path), SPEC, flush_interval=3600.0)
+    checkpoint.add(0, 2, [metrics(0.1), metrics(0.2)])
+    checkpoint.add(5, 6, [metrics(0.5)])
+    checkpoint.flush()
+    checkpoint.add(6, 7, [metrics(0.6)])
+
+    restored = SweepCheckpoint(str(tmp_path), SPEC)
+
+    assert restored.missing_ranges(10) == [(2, 5), (6, 10)]
+    assert restored.completed[5] == (6, [metrics(0.5)])
+    assert restored.statistics.count == 3
+
+
+def test_online_statistics():
+    """Verify the running mean, variance and extremes."""
+    statistics = OnlineStatistics()
+    for value in (1.0, 2.0, 3.0, 4.0):
+        statistics.update(metrics(value))
+
+    assert statistics.mean["SPFM"] == pytest.approx(2.5)
+    assert statistics.variance("SPFM") == pytest.approx(5.0 / 3.0)
+    assert statistics.minimum["LFM"] == 0.5
+    assert statistics.maximum["Lambda_RF_Sum"] == 40.0
+    assert OnlineStatistics(statistics.to_dict()).to_dict() == statistics.to_dict()
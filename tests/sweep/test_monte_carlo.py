@@ -0,0 +1,86 @@
+from functools import partial
+
+import pytest
+
+from ecc_analyzer.models.lpddr5 import Lpddr5System
+from ecc_analyzer.sweep import MonteCarloSampler
+from ecc_analyzer.sweep.monte_carlo import derive_stream_seed, percentile
+
+FACTORY = partial(Lpddr5System, "LPDDR5_MC", 4200.0)
+DISTRIBUTIONS = {
+    "DRAM_Path/SEC-DED/mbe_dc": ("uniform", 0.3, 0.9),
+    "DRAM_Path/DRAM_Sources/DRAM_Sources/0/lambda_BE": ("normal", 1610.0, 50.0),
+}
+
+
+def test_percentile_interpolation():
+    """Verify linear interpolation between closest ranks."""
+    values = [1.0, 2.0, 3.0, 4.0]
+    assert percentile(values, 0.0) == 1.0
+    assert percentile(values, 50.0) == pytest.approx(2.5)
+    assert percentile(values, 100.0) == 4.0
+
+
+def test_stream_seeds_are_distinct():
+    """Verify that every stream index yields a different seed."""
+    seeds = {derive_stream_seed(42, index) for index in range(1000)}
+    assert len(seeds) == 1000
+    assert derive_stream_seed(42, 0) != derive_stream_seed(43, 0)
+
+
+def test_results_independent_of_worker_count():
+    """Verify that 1-worker and multi-worker runs produce bit-identical results."""
+    serial = MonteCarloSampler(FACTORY, DISTRIBUTIONS, seed=7, stream_size=16, max_workers=1).run(100)
+    parallel = MonteCarloSampler(FACTORY, DISTRIBUTIONS, seed=7, stream_size=16, max_workers=3).run(100)
+
+    assert serial == parallel
+    assert serial["samples"] == 100
+    assert serial["metadata"]["seed_material"]["master_seed"] == 7
+    assert serial["metadata"]["seed_material"]["streams"] == 7
+
+
+def test_different_seeds_differ():
+    """Verify that the master seed controls the drawn samples."""
+    first = MonteCarloSampler(FACTORY, DISTRIBUTIONS, seed=1, max_workers=1).sample(10)
+    second = MonteCarloSampler(FACTORY, DISTRIBUTIONS, seed=2, max_workers=1).sample(10)
+    assert first != second
+
+
+def test_unsupported_distribution():
+    """Verify that unknown distribution names are rejected."""
+    with pytest.raises(ValueError, match="Unsupported distribution 'weibull'"):
+        MonteCarloSampler(FACTORY, {"a/b": ("weibull", 1.0, 2.0)}, seed=0)
+
+
+def test_checkpointed_sampling_resumes_identically(tmp_path):
+    """Verify that a resumed sampling run matches an uninterrupted run."""
+    sampler = MonteCarloSampler(FACTORY, DISTRIBUTIONS, seed=11, stream_size=8, max_workers=1)
+    reference = sampler.run(40)
+
+    partial_run = MonteCarloSampler(FACTORY, DISTRIBUTIONS, seed=11, stream_size=8, max_workers=1).sample(16, checkpoint_dir=str(tmp_path / "other"))
+    assert partial_run == sampler.sample(40)[:16]
+
+    sampler.sample(40, checkpoint_dir=str(tmp_path / "run"))
+    resumed = MonteCarloSampler(FACTORY, DISTRIBUTIONS, seed=11, stream_size=8, max_workers=2).run(40, checkpoint_dir=str(tmp_path / "run"))
+
+    assert resumed == reference
+
+
+def test_invalid_draws_are_counted(tmp_path):
+    """Verify that negative rate draws are recorded instead of ending the run."""
+    distributions = {"DRAM_Path/DRAM_Sources/DRAM_Sources/0/lambda_BE": ("normal", 10.0, 20.0)}
+    sampler = MonteCarloSampler(FACTORY, distributions, seed=3, stream_size=8, max_workers=1)
+
+    summary = sampler.run(40, checkpoint_dir=str(tmp_path / "run"))
+    samples = sampler.sample(40)
+
+    invalid = [result for result in samples if "error" in result]
+    assert 0 < summary["invalid_samples"] == len(invalid) < 40
+    assert sum(summary["asil_distribution"].values()) == 40 - len(invalid)
+
+
+def test_unknown_distribution_path_fails_fast():
+    """Verify that a distribution on an unknown parameter is rejected before sampling."""
+    sampler = MonteCarloSampler(FACTORY, {"DRAM_Path/SEC-DED/nope": ("uniform", 0.1, 0.2)}, seed=0)
+    with pytest.raises(ValueError, match="nope"):
+        sampler.sample(4)
@@ -0,0 +1,111 @@
+from functools import partial
+
+import pytest
+
+from ecc_analyzer.models.lpddr5 import Lpddr5System
+from ecc_analyzer.sweep import ParameterSweep, parameter_sweep
+
+FACTORY = partial(Lpddr5System, "LPDDR5_Sweep", 4200.0)
+
+
+def test_grid_cartesian_product():
+    """Verify that the grid contains every combination with the last axis varying fastest."""
+    grid = ParameterSweep.grid({"a": [1, 2], "b": [10, 20, 30]})
+
+    assert len(grid) == 6
+    assert grid[0] == {"a": 1, "b": 10}
+    assert grid[1] == {"a": 1, "b": 20}
+    assert grid[-1] == {"a": 2, "b": 30}
+
+
+def test_chunk_bounds_cover_range_and_shrink():
+    """Verify that guided chunks cover all indices exactly once with non-increasing sizes."""
+    sweep = ParameterSweep(FACTORY, max_workers=4, min_chunk_size=2)
+    bounds = sweep.chunk_bounds(1000)
+
+    assert bounds[0][0] == 0
+    assert bounds[-1][1] == 1000
+    assert all(prev[1] == nxt[0] for prev, nxt in zip(bounds, bounds[1:]))
+    sizes = [stop - start for start, stop in bounds]
+    assert sizes == sorted(sizes, reverse=True)
+    assert all(size >= 2 for size in sizes[:-1])
+
+
+def test_sweep_matches_serial_analysis():
+    """Verify that parallel results equal direct analysis and keep the input order."""
+    grid = ParameterSweep.grid({"DRAM_Path/SEC-DED/mbe_dc": [0.3, 0.5, 0.7, 0.9], "total_fit": [4200.0, 8000.0]})
+    system = FACTORY()
+    expected = [system.run_analysis(p) for p in grid]
+
+    parallel = ParameterSweep(FACTORY, max_workers=2).run(grid)
+    serial = ParameterSweep(FACTORY, max_workers=1).run(grid)
+
+    assert parallel == expected
+    assert serial == expected
+
+
+def test_sweep_propagates_errors():
+    """Verify that invalid parameter paths surface in the caller."""
+    with pytest.raises(ValueError, match="has no child"):
+        ParameterSweep(FACTORY, max_workers=2).run([{"Missing/value": 1.0}])
+
+
+def test_shared_memory_sweep_matches_pickled_sweep():
+    """Verify that the shared-memory path produces the same results as the default path."""
+    grid = ParameterSweep.grid({"DRAM_Path/SEC-DED/mbe_dc": [0.3, 0.6, 0.9], "total_fit": [4200.0, 8000.0]})
+    grid.append({"DRAM_Path/SEC-DED/mbe_dc": 0.75})
+
+    default = ParameterSweep(FACTORY, max_workers=2).run(grid)
+    shared = ParameterSweep(FACTORY, max_workers=2, shared_memory=True).run(grid)
+
+    assert shared == default
+
+
+def test_checkpoint_resume_skips_completed_work(tmp_path):
+    """Verify that a resumed sweep reuses checkpointed chunks and yields identical results."""
+    grid = ParameterSweep.grid({"DRAM_Path/SEC-DED/mbe_dc": [0.2, 0.4, 0.6, 0.8], "total_fit": [4200.0, 8000.0]})
+    sweep = ParameterSweep(FACTORY, max_workers=1, min_chunk_size=3)
+
+    interrupted = sweep.imap(grid, checkpoint_dir=str(tmp_path))
+    first_part = [next(interrupted) for _ in range(4)]
+    interrupted.close()
+
+    resumed = ParameterSweep(FACTORY, max_workers=2).run(grid, checkpoint_dir=str(tmp_path))
+
+    assert resumed[:4] == first_part
+    assert resumed == sweep.run(grid)
+
+
+def test_checkpoint_rejects_different_job(tmp_path):
+    """Verify that a checkpoint directory cannot be reused for another parameter grid."""
+    sweep = ParameterSweep(FACTORY, max_workers=1)
+    sweep.run([{"total_fit": 4200.0}], checkpoint_dir=str(tmp_path))
+
+    with pytest.raises(ValueError, match="belongs to a different job"):
+        sweep.run([{"total_fit": 5000.0}], checkpoint_dir=str(tmp_path))
+
+
+def test_invalid_parameter_set_fails_before_evaluation(monkeypatch):
+    """Verify that one invalid parameter set is reported with its index before any chunk runs."""
+    grid = ParameterSweep.grid({"DRAM_Path/SEC-DED/mbe_dc": [0.3, 0.5, 0.7]})
+    grid.insert(2, {"DRAM_Path/SEC-DED/mbe_dc": "high"})
+    grid.append({"total_fit": "high"})
+    sweep = ParameterSweep(FACTORY, max_workers=1)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("no work may be dispatched for an invalid sweep")
+
+    monkeypatch.setattr(sweep, "map_tasks", fail)
+    with pytest.raises(ValueError, match=r"Invalid parameter set 2: .*mbe_dc: expected number"):
+        sweep.run(grid)
+    with pytest.raises(ValueError, match=r"Invalid parameter set 3: total_fit: expected number"):
+        sweep.run(grid[:2] + grid[3:])
+
+
+def test_serial_sweep_restores_worker_model():
+    """Verify that a single-worker sweep leaves no worker-local model in the calling process."""
+    assert parameter_sweep.worker_system() is None
+
+    ParameterSweep(FACTORY, max_workers=1).run([{"total_fit": 5000.0}])
+
+    assert parameter_sweep.worker_system() is None
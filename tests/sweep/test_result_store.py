@@ -0,0 +1,51 @@
+from functools import partial
+
+import pytest
+
+from ecc_analyzer.core import AsilBlock
+from ecc_analyzer.models.lpddr5 import Lpddr5System
+from ecc_analyzer.sweep import ParameterSweep, ResultStore
+
+
+def test_append_and_read_columns(tmp_path):
+    """Verify that results are stored column-wise and read back as typed views."""
+    system = Lpddr5System("Store", total_fit=4200.0)
+    results = [system.run_detailed_analysis({"DRAM_Path/SEC-DED/mbe_dc": value}) for value in (0.3, 0.5, 0.7)]
+
+    with ResultStore(str(tmp_path)) as store:
+        store.extend(results)
+        with store.column("Lambda_RF_Sum") as rf, store.column("ASIL_Code") as asil, store.column("spfm.SBE") as sbe:
+            assert len(store) == 3
+            assert rf.format == "d"
+            assert list(rf) == [r["metrics"]["Lambda_RF_Sum"] for r in results]
+            assert [AsilBlock.ASIL_LABELS[code] for code in asil] == [r["metrics"]["ASIL_Achieved"] for r in results]
+            assert list(sbe) == [r["rates"]["spfm"].get("SBE", 0.0) for r in results]
+
+
+def test_reopen_discards_uncommitted_bytes(tmp_path):
+    """Verify that a re-opened store only exposes committed rows and keeps appending."""
+    metrics = {"SPFM": 0.99, "LFM": 0.9, "Lambda_RF_Sum": 5.0, "ASIL_Achieved": "ASIL D"}
+    with ResultStore(str(tmp_path), fault_types=["SBE"]) as store:
+        store.extend([metrics, metrics])
+    with open(tmp_path / "SPFM.col", "ab") as f:
+        f.write(b"\x00" * 4)
+
+    with ResultStore(str(tmp_path)) as store:
+        assert len(store) == 2
+        assert store.fault_types == ["SBE"]
+        store.extend([{**metrics, "SPFM": 0.5}])
+        with store.column("SPFM") as spfm:
+            assert list(spfm) == [0.99, 0.99, 0.5]
+        with pytest.raises(ValueError, match="Unknown column"):
+            store.column("spfm.DBE")
+
+
+def test_sweep_writes_to_store(tmp_path):
+    """Verify that a sweep appends its results to the store in input order."""
+    sweep = ParameterSweep(partial(Lpddr5System, "Store_Sweep", 4200.0), max_workers=1)
+    grid = ParameterSweep.grid({"DRAM_Path/SEC-DED/mbe_dc": [0.3, 0.5, 0.7, 0.9]})
+
+    with ResultStore(str(tmp_path)) as store:
+        assert sweep.run_to_store(grid, store) == 4
+        with store.column("LFM") as lfm:
+            assert list(lfm) == [r["LFM"] for r in sweep.run(grid)]
@@ -0,0 +1,72 @@
+from functools import partial
+
+import pytest
+
+from ecc_analyzer.models.lpddr5 import Lpddr5System
+from ecc_analyzer.sweep import ParameterSweep, ResultsDatabase
+
+
+def make_database(tmp_path):
+    sweep = ParameterSweep(partial(Lpddr5System, "DB_Sweep", 4200.0), max_workers=1)
+    grid = ParameterSweep.grid({"DRAM_Path/SEC-DED/mbe_dc": [0.2, 0.4, 0.6, 0.8], "total_fit": [1000.0, 4200.0]})
+    database = ResultsDatabase(str(tmp_path / "results.sqlite"), batch_size=3)
+    assert database.extend(zip(grid, sweep.imap(grid))) == len(grid)
+    return database, grid, sweep.run(grid)
+
+
+def test_query_filters_on_metrics_and_parameters(tmp_path):
+    """Verify that queries combine ASIL, metric and parameter conditions."""
+    database, grid, results = make_database(tmp_path)
+    expected = [parameters for parameters, metrics in zip(grid, results) if metrics["ASIL_Achieved"] == "ASIL A" and metrics["Lambda_RF_Sum"] < 450.0 and parameters["DRAM_Path/SEC-DED/mbe_dc"] <= 0.6]
+
+    assert len(expected) == 2
+    rows = database.query(asil="ASIL A", filters={"Lambda_RF_Sum": ("<", 450.0), "DRAM_Path/SEC-DED/mbe_dc": ("<=", 0.6)})
+
+    assert [{"DRAM_Path/SEC-DED/mbe_dc": r["DRAM_Path/SEC-DED/mbe_dc"], "total_fit": r["total_fit"]} for r in rows] == expected
+    assert all(row["ASIL_Achieved"] == "ASIL A" for row in rows)
+    assert database.count(asil="ASIL A", filters={"Lambda_RF_Sum": ("<", 450.0), "DRAM_Path/SEC-DED/mbe_dc": ("<=", 0.6)}) == len(expected)
+    assert database.count(min_asil="QM (Quality Management)") == len(grid)
+    database.close()
+
+
+def test_ordering_indexes_and_reopen(tmp_path):
+    """Verify sorting, parameter indexes and persistence across connections."""
+    database, grid, results = make_database(tmp_path)
+    database.create_index("DRAM_Path/SEC-DED/mbe_dc")
+    database.close()
+
+    with ResultsDatabase(str(tmp_path / "results.sqlite")) as reopened:
+        assert reopened.parameters == ["DRAM_Path/SEC-DED/mbe_dc", "total_fit"]
+        best = reopened.query(order_by="Lambda_RF_Sum", limit=1)[0]
+        assert best["Lambda_RF_Sum"] == min(r["Lambda_RF_Sum"] for r in results)
+        plan = reopened.connection.execute('EXPLAIN QUERY PLAN SELECT * FROM results WHERE "DRAM_Path/SEC-DED/mbe_dc" <= 0.6').fetchall()
+        assert "idx_DRAM_Path/SEC-DED/mbe_dc" in str(plan)
+
+
+def test_invalid_queries(tmp_path):
+    """Verify that unknown columns and operators are rejected."""
+    database, _, _ = make_database(tmp_path)
+
+    with pytest.raises(ValueError, match="Unknown column"):
+        database.query(filters={"missing": ("<", 1.0)})
+    with pytest.raises(ValueError, match="Unknown ASIL level"):
+        database.query(asil="ASIL E")
+    with pytest.raises(ValueError, match="Unsupported operator"):
+        database.query(filters={"SPFM": ("; DROP TABLE results; --", 1.0)})
+    database.close()
+
+
+def test_parameter_columns_are_case_insensitive(tmp_path):
+    """Verify that paths colliding with existing columns up to case are rejected."""
+    database, _, results = make_database(tmp_path)
+
+    for path in ("spfm", "ID", "asil_code"):
+        with pytest.raises(ValueError, match="collide with result columns"):
+            database.extend([({path: 1.0}, results[0])])
+    with pytest.raises(ValueError, match="differs only by case from column 'total_fit'"):
+        database.extend([({"TOTAL_FIT": 1.0}, results[0])])
+    with pytest.raises(ValueError, match="differs only by case"):
+        database.extend([({"a/x": 1.0, "A/X": 2.0}, results[0])])
+
+    assert database.parameters == ["DRAM_Path/SEC-DED/mbe_dc", "total_fit"]
+    database.close()
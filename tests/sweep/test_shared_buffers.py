@@ -0,0 +1,28 @@
+import math
+from concurrent.futures import ProcessPoolExecutor
+
+from ecc_analyzer.models.lpddr5 import Lpddr5System
+from ecc_analyzer.sweep.shared_buffers import OUTPUT_COLUMNS, SharedSweepBuffers, _evaluate_shared_rows, _init_shared_worker
+
+
+def test_buffers_layout_and_in_place_evaluation():
+    """Verify the input matrix layout and that a worker writes into the output matrix."""
+    system = Lpddr5System("Shared_Test", 4200.0)
+    parameter_sets = [{"total_fit": 5000.0}, {"DRAM_Path/SEC-DED/mbe_dc": 0.9}]
+
+    with SharedSweepBuffers(system, parameter_sets) as buffers:
+        assert buffers.columns == ["total_fit", "DRAM_Path/SEC-DED/mbe_dc"]
+        inputs = buffers.inputs.buf.cast("d")
+        assert inputs[0] == 5000.0
+        assert math.isnan(inputs[1])
+        assert math.isnan(inputs[2])
+        assert inputs[3] == 0.9
+        inputs.release()
+
+        with ProcessPoolExecutor(max_workers=1, initializer=_init_shared_worker, initargs=(buffers.names,)) as executor:
+            assert executor.submit(_evaluate_shared_rows, 0, 2).result() == 2
+
+        results = buffers.read_outputs(0, 2)
+
+    assert len(OUTPUT_COLUMNS) == 4
+    assert results == [system.run_analysis(p) for p in parameter_sets]
@@ -0,0 +1,103 @@
+import multiprocessing
+import os
+import time
+
+from ecc_analyzer.models.lpddr5 import Lpddr5System
+from ecc_analyzer.sweep import FileWorkQueue, ParameterSweep
+
+GRID = ParameterSweep.grid({"DRAM_Path/SEC-DED/mbe_dc": [0.2, 0.4, 0.6, 0.8], "total_fit": [4200.0, 5000.0, 8000.0]})
+
+
+def run_node(directory, worker_id):
+    FileWorkQueue(directory).run_worker(worker_id, poll_interval=0.01, idle_timeout=5.0)
+
+
+def test_local_processes_as_nodes(tmp_path):
+    """Verify that several worker processes complete the sweep and results merge in order."""
+    system = Lpddr5System("Queue_Test", 4200.0)
+    queue = FileWorkQueue(str(tmp_path))
+    assert queue.publish(system, GRID, unit_size=5) == 3
+
+    nodes = [multiprocessing.Process(target=run_node, args=(str(tmp_path), f"node{i}")) for i in range(3)]
+    for node in nodes:
+        node.start()
+    results = queue.collect(poll_interval=0.01, timeout=30.0)
+    for node in nodes:
+        node.join(timeout=10.0)
+
+    assert results == [system.run_analysis(p) for p in GRID]
+    assert (tmp_path / "done").exists()
+    assert os.listdir(tmp_path / "pending") == []
+
+
+def test_claim_is_exclusive(tmp_path):
+    """Verify that a unit can only be claimed once."""
+    queue = FileWorkQueue(str(tmp_path))
+    queue.publish(Lpddr5System("Claim_Test", 4200.0), GRID[:2], unit_size=2)
+
+    first = queue.claim("a")
+    second = queue.claim("b")
+
+    assert first is not None and first.name.startswith("unit-000000-") and "@a@" in first.name
+    assert second is None
+
+
+def test_straggler_is_requeued(tmp_path):
+    """Verify that units held past their lease by a dead worker are re-issued."""
+    system = Lpddr5System("Straggler_Test", 4200.0)
+    queue = FileWorkQueue(str(tmp_path))
+    queue.publish(system, GRID, unit_size=12)
+
+    assert queue.claim("dead-node") is not None
+    time.sleep(0.05)
+    assert queue.requeue_stragglers(lease_seconds=10.0) == 0
+    assert queue.requeue_stragglers(lease_seconds=0.01) == 1
+
+    assert queue.run_worker("live-node", idle_timeout=0.0) == 1
+    assert queue.collect(timeout=1.0) == [system.run_analysis(p) for p in GRID]
+
+
+def test_directory_is_reused_for_a_new_job(tmp_path):
+    """Verify that publishing again discards the previous job and ignores its late results."""
+    system = Lpddr5System("Reuse_Test", 4200.0)
+    queue = FileWorkQueue(str(tmp_path))
+    queue.publish(system, GRID[:4], unit_size=2)
+    late_unit = queue.claim("slow-node").name.split("@")[0]
+    assert queue.run_worker("first-node", idle_timeout=0.0) == 1
+    queue.requeue_stragglers(lease_seconds=0.0)
+    assert queue.run_worker("first-node", idle_timeout=0.0) == 1
+    assert queue.collect(timeout=1.0) == [system.run_analysis(p) for p in GRID[:4]]
+
+    other = Lpddr5System("Reuse_Test", 8000.0)
+    queue.publish(other, GRID[4:], unit_size=2)
+    assert not (tmp_path / "done").exists()
+    assert os.listdir(tmp_path / "results") == []
+    # The slow worker of the first job only delivers its shard now.
+    (tmp_path / "results" / late_unit).write_text('{"unit": 0, "start": 0, "results": []}')
+
+    assert queue.run_worker("second-node", idle_timeout=0.0) == 4
+    assert queue.collect(timeout=1.0) == [other.run_analysis(p) for p in GRID[4:]]
+
+
+def test_worker_starts_before_publish(tmp_path):
+    """Verify that a worker polling a fresh directory waits instead of failing."""
+    queue = FileWorkQueue(str(tmp_path / "fresh"))
+
+    assert queue.claim("early") is None
+    assert queue.run_worker("early", poll_interval=0.01, idle_timeout=0.05) == 0
+
+
+def test_invalid_parameter_set_is_reported(tmp_path):
+    """Verify that a parameter set the model rejects yields an error result instead of a stuck unit."""
+    system = Lpddr5System("Invalid_Test", 4200.0)
+    queue = FileWorkQueue(str(tmp_path))
+    parameter_sets = [GRID[0], {"DRAM_Path/nope": 2.0}, GRID[1]]
+    queue.publish(system, parameter_sets, unit_size=3)
+
+    assert queue.run_worker("node", idle_timeout=0.0) == 1
+    results = queue.collect(timeout=1.0)
+
+    assert results[0] == system.run_analysis(GRID[0])
+    assert "Unknown parameter 'nope'" in results[1]["error"]
+    assert results[2] == system.run_analysis(GRID[1])
+    assert os.listdir(tmp_path / "claimed") == []
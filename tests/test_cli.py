@@ -0,0 +1,83 @@
+import csv
+import json
+
+import pytest
+
+from ecc_analyzer.cli import EXIT_ERROR, EXIT_OK, EXIT_TARGET_MISSED, expand_models, main, report_names
+from ecc_analyzer.generic_safety_system import GenericSafetySystem
+
+CONFIG = {
+    "type": "PipelineBlock",
+    "name": "Root",
+    "sub_blocks": [
+        {"type": "BasicEvent", "fault_type": "SBE", "rate": 100.0},
+        {"type": "CoverageBlock", "target_fault": "SBE", "dc_rate_c_or_cR": 0.999, "dc_rate_latent_cL": 0.0},
+    ],
+}
+
+
+def write_models(directory, count):
+    directory.mkdir()
+    for index in range(count):
+        (directory / f"model_{index}.json").write_text(json.dumps(CONFIG))
+
+
+def test_expand_models(tmp_path):
+    """Verify directories, globs and per-file total FIT values."""
+    write_models(tmp_path / "models", 2)
+
+    models = expand_models([str(tmp_path / "models"), str(tmp_path / "models" / "model_1.json") + "=5000"], 1000.0)
+
+    assert [fit for _, fit in models] == [1000.0, 1000.0, 5000.0]
+    with pytest.raises(ValueError, match="No model files match"):
+        expand_models([str(tmp_path / "*.yaml")], 1000.0)
+    with pytest.raises(ValueError, match="No total FIT"):
+        expand_models([str(tmp_path / "models")], None)
+
+
+def test_batch_streams_rows_and_exit_codes(tmp_path):
+    """Verify the JSONL output and the exit codes for passed and missed ASIL targets."""
+    write_models(tmp_path / "models", 3)
+    output = tmp_path / "results.jsonl"
+    args = [str(tmp_path / "models" / "*.json"), "--total-fit", "1000", "--no-pdf", "--workers", "2", "--output", str(output)]
+
+    assert main(args + ["--require-asil", "A"]) == EXIT_OK
+    rows = [json.loads(line) for line in output.read_text().splitlines()]
+    assert sorted(row["name"] for row in rows) == ["model_0", "model_1", "model_2"]
+    assert all(row["meets_target"] and row["error"] is None for row in rows)
+
+    assert main(args + ["--require-asil", "D"]) == EXIT_TARGET_MISSED
+
+
+def test_batch_reports_broken_models(tmp_path):
+    """Verify that a broken model yields an error row and exit code 2 without aborting the batch."""
+    write_models(tmp_path / "models", 1)
+    (tmp_path / "models" / "broken.json").write_text('{"type": "SumBlock"}')
+    output = tmp_path / "results.csv"
+
+    assert main([str(tmp_path / "models"), "--total-fit", "1000", "--no-pdf", "--workers", "1", "--format", "csv", "--output", str(output)]) == EXIT_ERROR
+
+    with open(output, newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert [row["name"] for row in rows] == ["broken", "model_0"]
+    assert "missing required parameter" in rows[0]["error"]
+    assert rows[1]["error"] == "" and rows[1]["ASIL_Achieved"]
+
+
+def test_same_named_models_get_distinct_reports(tmp_path, monkeypatch):
+    """Verify that models with the same file name in different folders do not share a report."""
+    write_models(tmp_path / "fleet", 0)
+    for folder in ("a", "b"):
+        write_models(tmp_path / "fleet" / folder, 1)
+    (tmp_path / "fleet" / "a" / "model_0.yaml").write_text("")
+    rendered = []
+    monkeypatch.setattr(GenericSafetySystem, "generate_pdf", lambda self, filename, view: rendered.append(filename) or self.run_analysis())
+
+    pdf_dir = tmp_path / "reports"
+    args = [str(tmp_path / "fleet" / "**" / "*.json"), "--total-fit", "1000", "--workers", "1", "--pdf-dir", str(pdf_dir), "--output", str(tmp_path / "out.jsonl")]
+    assert main(args) == EXIT_OK
+
+    assert rendered == [str(pdf_dir / "a" / "model_0"), str(pdf_dir / "b" / "model_0")]
+    assert (pdf_dir / "a").is_dir() and (pdf_dir / "b").is_dir()
+    paths = [str(tmp_path / "fleet" / "a" / name) for name in ("model_0.json", "model_0.yaml", "model_0.json")]
+    assert report_names(paths) == ["model_0.json", "model_0.yaml", "model_0.json_2"]
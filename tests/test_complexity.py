@@ -0,0 +1,113 @@
+import json
+
+import pytest
+
+from ecc_analyzer.complexity import ComplexityAnalyzer, main
+from ecc_analyzer.core import BasicEvent, CoverageBlock, InstanceArray, PipelineBlock, ReplicateBlock, SplitBlock, SumBlock
+from ecc_analyzer.interfaces import FaultType
+from ecc_analyzer.models.lpddr5 import Lpddr5System
+
+
+def channel() -> PipelineBlock:
+    """Builds one channel; separate calls yield equal but distinct objects."""
+    return PipelineBlock(
+        "Channel",
+        [
+            SumBlock("Sources", [BasicEvent(FaultType.SBE, 10.0), BasicEvent(FaultType.DBE, 1.0)]),
+            CoverageBlock(FaultType.SBE, 0.9),
+            SplitBlock("Split", FaultType.DBE, {FaultType.TBE: 1.0}),
+        ],
+    )
+
+
+def issues(report: dict) -> list[str]:
+    return [entry["issue"] for entry in report["flags"]]
+
+
+def test_counts_shape_and_fault_types():
+    """Verify block counts, depth, fan-out and fault types, counting shared blocks per position."""
+    shared = channel()
+    layout = SumBlock("System", [shared, shared, channel(), BasicEvent(FaultType.OTH, 1.0)])
+
+    report = ComplexityAnalyzer(layout).analyze()
+
+    assert report["blocks"] == 1 + 3 * 6 + 1
+    assert report["unique_blocks"] == 1 + 2 * 6 + 1
+    assert report["by_type"] == {"BasicEvent": 7, "CoverageBlock": 3, "PipelineBlock": 3, "SplitBlock": 3, "SumBlock": 4}
+    assert report["depth"] == 4
+    assert report["sum_fan_out"] == {"count": 4, "max": 4, "mean": pytest.approx(10 / 4)}
+    assert report["fault_types"] == ["DBE", "OTH", "SBE", "TBE"]
+    assert report["repeated_subtrees"] == [{"type": "PipelineBlock", "name": "Channel", "size": 6, "occurrences": 3}]
+    assert issues(report) == []
+
+
+def test_cost_estimates_for_system():
+    """Verify that a system is accepted and compiled evaluation is suggested for it."""
+    report = ComplexityAnalyzer(Lpddr5System("LPDDR5", 2000.0)).analyze()
+
+    costs = report["cost"]
+    assert report["compiled"]["mode"] == "sparse"
+    assert 0 < costs["compiled"] < costs["interpreted"] < costs["sweep_row"]
+    assert report["suggested_engine"] == "compiled"
+    assert "Suggested engine: compiled" in ComplexityAnalyzer.format_report(report)
+
+
+def test_flags_deep_wrapper_chain():
+    """Verify that deep single-child chains are analyzed without recursion and flagged once."""
+    block = BasicEvent(FaultType.SBE, 1.0)
+    for level in range(600):
+        block = SumBlock(f"Wrapper_{level}", [block])
+
+    report = ComplexityAnalyzer(block, compile_layout=False).analyze()
+
+    assert report["depth"] == 601
+    assert report["recursion_depth"] == 3 * 600 + 1
+    assert issues(report) == ["wrapper_chain", "deep_nesting"]
+    assert report["flags"][0]["block"] == "Wrapper_599"
+    assert report["cost"]["compiled"] is None
+    with pytest.raises(RecursionError):
+        block.compute_fit({}, {})
+
+
+def test_deep_nesting_follows_evaluation_frames():
+    """Verify that nesting is only flagged when evaluation would come close to the recursion limit."""
+    block = BasicEvent(FaultType.SBE, 1.0)
+    for level in range(600):
+        block = PipelineBlock(f"Stage_{level}", [block, CoverageBlock(FaultType.SBE, 0.5)])
+
+    report = ComplexityAnalyzer(block, compile_layout=False).analyze()
+
+    assert report["recursion_depth"] == 601
+    assert "deep_nesting" not in issues(report)
+    assert block.compute_fit({}, {})[0][FaultType.SBE] == pytest.approx(0.5**600)
+
+
+def test_flags_wide_identical_sum_and_parallel_candidates():
+    """Verify the suggestions for wide sums of identical children and heavy parallel children."""
+    wide = SumBlock("Banks", [BasicEvent(FaultType.SBE, 1.0) for _ in range(300)])
+    heavy = SumBlock("Channels", [SumBlock(f"Channel_{index}", [BasicEvent(FaultType.SBE, float(event)) for event in range(1000)]) for index in range(2)])
+
+    assert issues(ComplexityAnalyzer(wide).analyze()) == ["wide_identical_sum"]
+    assert ComplexityAnalyzer(wide).analyze()["flags"][0]["suggestion"].endswith("count=300.")
+    assert issues(ComplexityAnalyzer(heavy).analyze()) == ["parallel_candidate"]
+
+
+def test_flags_layout_that_cannot_be_compiled():
+    """Verify that per-instance parameters fall back to the interpreted engine."""
+    layout = ReplicateBlock("Banks", BasicEvent(FaultType.SBE, InstanceArray([1.0, 2.0])), 2)
+
+    report = ComplexityAnalyzer(layout).analyze()
+
+    assert report["compiled"] is None
+    assert report["suggested_engine"] == "interpreted"
+    assert issues(report) == ["not_compilable"]
+
+
+def test_main_prints_json(tmp_path, capsys):
+    """Verify the command line entry point."""
+    path = tmp_path / "model.json"
+    path.write_text(json.dumps(SumBlock("System", [channel()]).to_dict()))
+
+    main([str(path), "--json"])
+
+    assert json.loads(capsys.readouterr().out)["blocks"] == 7
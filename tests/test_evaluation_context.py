@@ -0,0 +1,79 @@
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from ecc_analyzer.core import BasicEvent, SumBlock
+from ecc_analyzer.evaluation_context import EvaluationContext
+from ecc_analyzer.interfaces import FaultType
+from ecc_analyzer.models.lpddr5 import Lpddr5System
+
+THREADS = 16
+
+
+@pytest.fixture
+def short_switch_interval():
+    """Makes the interpreter switch threads often, to provoke interleavings."""
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+def variants(count: int) -> list[dict]:
+    """Builds distinct override sets for the LPDDR5 model."""
+    return [{"DRAM_Path/DRAM_Sources/fault_sbe": 100.0 + index, "total_fit": 2000.0 + 10 * index} for index in range(count)]
+
+
+def test_context_is_immutable():
+    """Verify that an evaluation context cannot be modified after creation."""
+    context = EvaluationContext(SumBlock("Root", [BasicEvent(FaultType.SBE, 10.0)]), 1000.0)
+
+    with pytest.raises(AttributeError):
+        context.total_fit = 5.0
+
+    metrics, spfm, _ = context.evaluate()
+    assert spfm[FaultType.SBE] == pytest.approx(10.0)
+    assert metrics["SPFM"] == pytest.approx(0.99)
+
+
+def test_concurrent_analyses_match_sequential(short_switch_interval):
+    """Verify that many threads analysing one shared model get the sequential results."""
+    system = Lpddr5System("Shared", 2000.0)
+    runs = variants(64) * 4
+    expected = [system.run_detailed_analysis(overrides) for overrides in runs]
+
+    with ThreadPoolExecutor(max_workers=THREADS) as executor:
+        results = list(executor.map(system.run_detailed_analysis, runs))
+
+    assert results == expected
+
+
+def test_reload_during_analyses_never_mixes_models(short_switch_interval):
+    """Verify that every run sees one complete model while another thread swaps layouts."""
+    system = Lpddr5System("Shared", 2000.0)
+    other = SumBlock("Other", [BasicEvent(FaultType.SBE, 50.0)])
+    layouts = (system.system_layout, other)
+    allowed = [system.run_analysis()]
+    system.system_layout = other
+    allowed.append(system.run_analysis())
+
+    stop = threading.Event()
+
+    def swap():
+        position = 0
+        while not stop.is_set():
+            position ^= 1
+            system.system_layout = layouts[position]
+
+    writer = threading.Thread(target=swap)
+    writer.start()
+    try:
+        with ThreadPoolExecutor(max_workers=THREADS) as executor:
+            results = list(executor.map(lambda _: system.run_analysis(), range(400)))
+    finally:
+        stop.set()
+        writer.join()
+
+    assert all(result in allowed for result in results)
@@ -0,0 +1,47 @@
+import json
+import subprocess
+import sys
+
+# Generous upper bound for importing a model in a fresh interpreter. Loading Graphviz
+# and PyYAML eagerly roughly doubles the import time, and slow CI runners stay well below.
+IMPORT_BUDGET_SECONDS = 0.5
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+from ecc_analyzer.models.lpddr5 import Lpddr5System
+Lpddr5System("Probe", 4200.0).run_analysis()
+elapsed = time.perf_counter() - start
+print(json.dumps({"elapsed": elapsed, "graphviz": "graphviz" in sys.modules, "yaml": "yaml" in sys.modules}))
+"""
+
+
+def run_probe(code: str) -> dict:
+    output = subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True).stdout
+    return json.loads(output)
+
+
+def test_analysis_does_not_load_optional_backends():
+    """Verify that a pure analysis never imports Graphviz or PyYAML."""
+    probe = run_probe(PROBE)
+
+    assert probe["graphviz"] is False
+    assert probe["yaml"] is False
+
+
+def test_import_time_budget():
+    """Verify that importing a model and running one analysis stays within the budget."""
+    elapsed = min(run_probe(PROBE)["elapsed"] for _ in range(3))
+
+    assert elapsed < IMPORT_BUDGET_SECONDS
+
+
+def test_backends_load_on_first_use(tmp_path):
+    """Verify that YAML export still works once requested."""
+    code = f"""
+import json, sys
+from ecc_analyzer.models.lpddr5 import Lpddr5System
+Lpddr5System("Probe", 4200.0).save_to_yaml({str(tmp_path / "model.yaml")!r})
+print(json.dumps({{"yaml": "yaml" in sys.modules}}))
+"""
+    assert run_probe(code)["yaml"] is True
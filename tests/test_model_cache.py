@@ -0,0 +1,104 @@
+import json
+import os
+import pickle
+
+import pytest
+
+from ecc_analyzer.core import BlockFactory
+from ecc_analyzer.generic_safety_system import GenericSafetySystem
+from ecc_analyzer.model_cache import ModelCache
+
+CONFIG = {
+    "type": "SumBlock",
+    "name": "Root",
+    "sub_blocks": [
+        {"type": "BasicEvent", "fault_type": "SBE", "rate": 100.0},
+        {"type": "PipelineBlock", "name": "Path", "sub_blocks": [{"type": "CoverageBlock", "target_fault": "SBE", "dc_rate_c_or_cR": 0.9}]},
+    ],
+}
+
+
+def write_config(path, config):
+    with open(path, "w") as f:
+        json.dump(config, f)
+
+
+def test_cache_hit_skips_parsing(tmp_path, monkeypatch):
+    """Verify that an unchanged config is served from the cache without BlockFactory."""
+    config_path = tmp_path / "model.json"
+    write_config(config_path, CONFIG)
+    cache = ModelCache(str(tmp_path / "cache"))
+
+    first = GenericSafetySystem("Cached", 1000.0, str(config_path), model_cache=cache)
+    assert len(list((tmp_path / "cache" / "models").glob("*.pkl"))) == 1
+
+    def fail(data):
+        raise AssertionError("BlockFactory must not be called on a cache hit")
+
+    monkeypatch.setattr(BlockFactory, "from_dict", staticmethod(fail))
+    second = GenericSafetySystem("Cached", 1000.0, str(config_path), model_cache=cache)
+
+    assert second.run_analysis() == first.run_analysis()
+    assert second.parameter_index == {"0/lambda_BE": 100.0, "Path/0/c_R": 0.9, "Path/0/c_L": pytest.approx(0.1)}
+
+
+def test_changed_content_misses(tmp_path):
+    """Verify that editing the config file invalidates the cache entry."""
+    config_path = tmp_path / "model.json"
+    write_config(config_path, CONFIG)
+    cache = ModelCache(str(tmp_path / "cache"))
+    key_before = cache.key(str(config_path))
+
+    changed = json.loads(json.dumps(CONFIG))
+    changed["sub_blocks"][0]["rate"] = 50.0
+    write_config(config_path, changed)
+
+    assert cache.key(str(config_path)) != key_before
+    system = GenericSafetySystem("Changed", 1000.0, str(config_path), model_cache=cache)
+    assert system.system_layout.sub_blocks[0].lambda_BE == 50.0
+
+
+def test_corrupt_entry_is_rebuilt(tmp_path):
+    """Verify that an unreadable cache entry falls back to parsing."""
+    config_path = tmp_path / "model.json"
+    write_config(config_path, CONFIG)
+    cache = ModelCache(str(tmp_path / "cache"))
+    cache.directory.mkdir(parents=True)
+    (cache.directory / f"{cache.key(str(config_path))}.pkl").write_bytes(b"garbage")
+
+    system = GenericSafetySystem("Corrupt", 1000.0, str(config_path), model_cache=cache)
+
+    assert system.system_layout.name == "Root"
+
+
+@pytest.mark.parametrize("content", [pickle.dumps({"layout": None, "parameters": {}})[:-4], pickle.dumps(["layout"])])
+def test_stale_entry_is_rebuilt(tmp_path, content):
+    """Verify that truncated entries or entries holding other objects are misses."""
+    config_path = tmp_path / "model.json"
+    write_config(config_path, CONFIG)
+    cache = ModelCache(str(tmp_path / "cache"))
+    cache.directory.mkdir(parents=True)
+    entry_path = cache.directory / f"{cache.key(str(config_path))}.pkl"
+    entry_path.write_bytes(content)
+
+    system = GenericSafetySystem("Stale", 1000.0, str(config_path), model_cache=cache)
+
+    assert system.system_layout.name == "Root"
+    assert entry_path.read_bytes() != content
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid"), reason="POSIX ownership checks only")
+def test_writable_entry_is_not_loaded(tmp_path):
+    """Verify that an entry writable by other users is rebuilt instead of unpickled."""
+    config_path = tmp_path / "model.json"
+    write_config(config_path, CONFIG)
+    cache = ModelCache(str(tmp_path / "cache"))
+    cache.directory.mkdir(parents=True)
+    entry_path = cache.directory / f"{cache.key(str(config_path))}.pkl"
+    entry_path.write_bytes(pickle.dumps({"layout": "planted", "parameters": {}}))
+    entry_path.chmod(0o666)
+
+    layout, _ = cache.load(str(config_path), lambda: BlockFactory.from_dict(CONFIG))
+
+    assert layout.name == "Root"
+    assert entry_path.stat().st_mode & 0o777 == 0o644
@@ -0,0 +1,118 @@
+import os
+
+from ecc_analyzer.core import AsilBlock, BasicEvent, ParameterOverrides, SplitBlock, SumBlock
+from ecc_analyzer.interfaces import FaultType
+from ecc_analyzer.models.lpddr5 import Lpddr5System
+from ecc_analyzer.result_cache import ResultCache
+from ecc_analyzer.visualization import SafetyVisualizer
+
+
+def test_run_analysis_uses_cache(tmp_path, monkeypatch):
+    """Verify that an identical analysis is served from the cache with metrics and rates."""
+    system = Lpddr5System("Cached", total_fit=4200.0)
+    system.result_cache = ResultCache(str(tmp_path))
+    expected = system.run_analysis({"DRAM_Path/SEC-DED/mbe_dc": 0.9})
+
+    key = system.result_cache.key(system.system_layout, 4200.0, {"DRAM_Path/SEC-DED/mbe_dc": 0.9})
+    assert system.result_cache.get(key)["rates"]["spfm"]
+
+    def fail(*args):
+        raise AssertionError("Metrics must not be recomputed on a cache hit")
+
+    monkeypatch.setattr(AsilBlock, "compute_metrics", fail)
+    assert system.run_analysis({"DRAM_Path/SEC-DED/mbe_dc": 0.9}) == expected
+
+
+def test_key_depends_on_inputs():
+    """Verify that layout, total FIT and overrides all change the key."""
+    system = Lpddr5System("Keyed", total_fit=4200.0)
+    layout = system.system_layout
+    key = ResultCache.key(layout, 4200.0)
+
+    assert ResultCache.key(layout, 4200.0) == key
+    assert ResultCache.key(layout, 5000.0) != key
+    assert ResultCache.key(layout, 4200.0, {"DRAM_Path/SEC-DED/mbe_dc": 0.9}) != key
+    assert ResultCache.key(ParameterOverrides.apply(layout, {"DRAM_Path/SEC-DED/mbe_dc": 0.9}), 4200.0) != key
+
+
+def test_layout_is_hashed_once_per_layout(tmp_path, monkeypatch):
+    """Verify that repeated runs on one layout hash it once, and a new layout is hashed again."""
+    system = Lpddr5System("Digest", total_fit=4200.0)
+    system.result_cache = ResultCache(str(tmp_path))
+    digests = []
+    layout_digest = ResultCache.layout_digest
+    monkeypatch.setattr(ResultCache, "layout_digest", staticmethod(lambda layout: digests.append(layout) or layout_digest(layout)))
+
+    for mbe_dc in (0.5, 0.6, 0.5):
+        system.run_analysis({"DRAM_Path/SEC-DED/mbe_dc": mbe_dc})
+    assert len(digests) == 1
+
+    system.system_layout = ParameterOverrides.apply(system.system_layout, {"DRAM_Path/SEC-DED/mbe_dc": 0.9})
+    system.run_analysis()
+    assert len(digests) == 2
+
+
+def test_overrides_with_fault_type_keys(tmp_path):
+    """Verify that overrides keyed by fault types are cached, and uncanonical ones skip the cache."""
+    layout = SumBlock("Root", [BasicEvent(FaultType.SBE, 100.0), SplitBlock("Split", FaultType.SBE, {FaultType.MBE: 0.5})])
+    rates = {"1/distribution_rates": {FaultType.MBE: 0.25}}
+
+    assert ResultCache.key(layout, 1000.0, rates) == ResultCache.key(layout, 1000.0, {"1/distribution_rates": {"MBE": 0.25}})
+    assert ResultCache.key(layout, 1000.0, {"1/distribution_rates": object()}) is None
+
+
+def test_corrupt_entry_is_a_miss(tmp_path):
+    """Verify that unreadable entries are misses and get recomputed."""
+    system = Lpddr5System("Corrupt", total_fit=4200.0)
+    system.result_cache = ResultCache(str(tmp_path))
+    expected = system.run_analysis()
+    key = system.result_cache.key(system.system_layout, 4200.0)
+    path = system.result_cache._path(key, ".json")
+
+    for data in (b'{"metrics": {"SPFM"', b"\xff\xfe", b"[]"):
+        path.write_bytes(data)
+        assert system.result_cache.get(key) is None
+        assert system.run_analysis() == expected
+        assert system.result_cache.get(key)["metrics"] == expected
+
+
+def test_lru_eviction(tmp_path):
+    """Verify that the least recently used entries are evicted first."""
+    cache = ResultCache(str(tmp_path), max_bytes=300)
+    for index in range(3):
+        cache.put(f"{index:064x}", {"metrics": {"padding": "x" * 60}})
+        path = cache._path(f"{index:064x}", ".json")
+        os.utime(path, (1000 + index, 1000 + index))
+
+    assert cache.get(f"{0:064x}") is not None
+    cache.put(f"{3:064x}", {"metrics": {"padding": "x" * 60}})
+
+    assert cache.size() <= 300 * cache.LOW_WATERMARK
+    assert cache.get(f"{1:064x}") is None
+    assert cache.get(f"{0:064x}") is not None
+    assert cache.get(f"{3:064x}") is not None
+
+
+def test_generate_pdf_reuses_rendering(tmp_path, monkeypatch):
+    """Verify that a cached rendering is written and opened instead of re-rendered."""
+    system = Lpddr5System("Rendered", total_fit=4200.0)
+    system.result_cache = ResultCache(str(tmp_path / "cache"))
+    rendered = []
+    viewed = []
+
+    def render(self, filename, view=True):
+        rendered.append(filename)
+        with open(f"{filename}.pdf", "wb") as f:
+            f.write(b"%PDF-cached")
+        return f"{filename}.pdf"
+
+    monkeypatch.setattr(SafetyVisualizer, "render", render)
+    monkeypatch.setattr(SafetyVisualizer, "view", staticmethod(viewed.append))
+
+    first = system.generate_pdf(str(tmp_path / "first"))
+    second = system.generate_pdf(str(tmp_path / "second"))
+
+    assert rendered == [str(tmp_path / "first")]
+    assert viewed == [str(tmp_path / "second.pdf")]
+    assert (tmp_path / "second.pdf").read_bytes() == b"%PDF-cached"
+    assert second == first
@@ -0,0 +1,218 @@
+import asyncio
+import json
+import threading
+import time
+
+import pytest
+
+from ecc_analyzer.core import ParameterOverrides
+from ecc_analyzer.evaluation_context import EvaluationContext
+from ecc_analyzer.generic_safety_system import GenericSafetySystem
+from ecc_analyzer.models.lpddr5 import Lpddr5System
+from ecc_analyzer.service import AnalysisService
+
+TOTAL_FIT = 2000.0
+SBE_PATH = "DRAM_Path/DRAM_Sources/0/lambda_BE"
+
+
+def flatten(data: dict) -> dict:
+    """Replaces the hardware components of a serialized layout by their root blocks."""
+    if "root_block" in data:
+        return flatten(data["root_block"])
+    if "sub_blocks" in data:
+        return {**data, "sub_blocks": [flatten(child) for child in data["sub_blocks"]]}
+    return data
+
+
+@pytest.fixture
+def model_file(tmp_path):
+    """Writes the LPDDR5 layout to a JSON file and returns a system loaded from it and the path."""
+    path = tmp_path / "lpddr5.json"
+    path.write_text(json.dumps(flatten(Lpddr5System("LPDDR5", TOTAL_FIT).system_layout.to_dict())))
+    system = GenericSafetySystem("LPDDR5", TOTAL_FIT, str(path))
+    assert SBE_PATH in ParameterOverrides.parameter_index(system.system_layout)
+    return system, path
+
+
+def test_analyze_matches_system(model_file):
+    """Verify that the service reports the metrics of the model, with and without overrides."""
+    system, path = model_file
+    service = AnalysisService(workers=0)
+
+    metrics = service.analyze({"config": str(path), "total_fit": TOTAL_FIT})
+    assert metrics["SPFM"] == pytest.approx(system.run_analysis()["SPFM"])
+    assert metrics["ASIL_Achieved"] == system.run_analysis()["ASIL_Achieved"]
+
+    overrides = {SBE_PATH: 5000.0, "total_fit": 3000.0}
+    metrics = service.analyze({"config": str(path), "total_fit": TOTAL_FIT, "overrides": overrides})
+    assert metrics["LFM"] == pytest.approx(system.run_analysis(overrides)["LFM"])
+
+
+def test_models_are_cached_by_content(model_file):
+    """Verify that repeated requests hit the cache, edits reload and the LRU bound holds."""
+    system, path = model_file
+    service = AnalysisService(cache_size=1, workers=0)
+    request = {"config": str(path), "total_fit": TOTAL_FIT}
+
+    service.analyze(request)
+    service.analyze(request)
+    assert (service.hits, service.misses) == (1, 1)
+
+    service.analyze({"model": system.system_layout.to_dict(), "total_fit": TOTAL_FIT})
+    assert service.stats()["models"] == 1
+
+    path.write_text(json.dumps({"type": "BasicEvent", "fault_type": "SBE", "rate": 10.0, "is_spfm": True}))
+    assert service.analyze(request)["Lambda_RF_Sum"] == pytest.approx(10.0)
+    assert service.misses == 3
+
+
+def test_warm_analysis_is_much_faster_than_cold(model_file):
+    """Verify that a warm single analysis costs a fraction of a cold one (about 1/50 when measured)."""
+    _, path = model_file
+    request = {"config": str(path), "total_fit": TOTAL_FIT}
+
+    cold = []
+    for _ in range(5):
+        service = AnalysisService(workers=0)
+        start = time.perf_counter()
+        service.analyze(request)
+        cold.append(time.perf_counter() - start)
+
+    durations = []
+    for _ in range(200):
+        start = time.perf_counter()
+        service.analyze(request)
+        durations.append(time.perf_counter() - start)
+    assert sorted(durations)[len(durations) // 2] < min(cold) / 5
+
+
+def test_invalid_rows_do_not_end_a_sweep():
+    """Verify that rows failing with any exception report an error and later rows are evaluated."""
+    service = AnalysisService(workers=0)
+    model = {"type": "SumBlock", "name": "Root", "sub_blocks": [{"type": "BasicEvent", "fault_type": "SBE", "rate": 1.0}]}
+    rows = [{"0/lambda_BE": "abc"}, {"total_fit": "abc"}, {"0/lambda_BE": 2.0}]
+
+    results = service.evaluate_rows({"model": model, "total_fit": TOTAL_FIT}, rows)
+
+    assert "expected non-negative number" in results[0]["error"]
+    assert results[1]["error"].startswith("TypeError")
+    assert results[2]["Lambda_RF_Sum"] == pytest.approx(2.0)
+
+
+def test_cold_models_load_off_the_event_loop(model_file, monkeypatch):
+    """Verify that parsing a cold model runs in a thread while the event loop keeps running."""
+    _, path = model_file
+    service = AnalysisService(workers=0)
+    loop_threads = set()
+    parse = AnalysisService._parse
+
+    def parse_in_thread(data, suffix):
+        loop_threads.add(threading.get_ident())
+        return parse(data, suffix)
+
+    monkeypatch.setattr(AnalysisService, "_parse", staticmethod(parse_in_thread))
+
+    async def scenario():
+        served = await service.model_async({"config": str(path), "total_fit": TOTAL_FIT})
+        return served, threading.get_ident()
+
+    served, loop_thread = asyncio.run(scenario())
+
+    assert served is service.model({"config": str(path), "total_fit": TOTAL_FIT})
+    assert loop_threads and loop_thread not in loop_threads
+    assert (service.hits, service.misses) == (1, 1)
+
+
+def test_analyses_with_overrides_run_off_the_event_loop(model_file, monkeypatch):
+    """Verify that tree evaluations of single analyses run in a thread, compiled ones on the loop."""
+    system, path = model_file
+    service = AnalysisService(workers=0)
+    evaluate = EvaluationContext.evaluate
+    threads = []
+
+    def evaluate_in_thread(context, asil_block=None):
+        threads.append(threading.get_ident())
+        return evaluate(context, asil_block)
+
+    monkeypatch.setattr(EvaluationContext, "evaluate", evaluate_in_thread)
+    request = {"config": str(path), "total_fit": TOTAL_FIT}
+
+    async def scenario():
+        served = await service.model_async(request)
+        plain = await service._analyze_async(served, request)
+        overridden = await service._analyze_async(served, {**request, "overrides": {SBE_PATH: 5.0}})
+        return plain, overridden, threading.get_ident()
+
+    plain, overridden, loop_thread = asyncio.run(scenario())
+
+    assert len(threads) == 1 and threads[0] != loop_thread
+    assert plain == system.run_analysis()
+    assert overridden == system.run_analysis({SBE_PATH: 5.0})
+
+
+def test_config_root_confines_paths(model_file, tmp_path):
+    """Verify that config paths cannot leave the configuration root."""
+    _, path = model_file
+    service = AnalysisService(workers=0, config_root=str(tmp_path))
+
+    assert service.analyze({"config": path.name, "total_fit": TOTAL_FIT})["SPFM"] > 0
+    with pytest.raises(ValueError, match="outside the configuration root"):
+        service.analyze({"config": "../other.json", "total_fit": TOTAL_FIT})
+
+
+async def _request(port: int, method: str, path: str, payload=None) -> tuple[int, bytes]:
+    """Sends one HTTP request and returns the status and the decoded body."""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    body = json.dumps(payload).encode() if payload is not None else b""
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: test\r\nConnection: close\r\nContent-Length: {len(body)}\r\n\r\n".encode() + body)
+    response = await reader.read()
+    writer.close()
+
+    head, _, content = response.partition(b"\r\n\r\n")
+    status = int(head.split(b" ")[1])
+    if b"Transfer-Encoding: chunked" in head:
+        decoded = b""
+        while True:
+            size, _, content = content.partition(b"\r\n")
+            if int(size, 16) == 0:
+                break
+            decoded += content[: int(size, 16)]
+            content = content[int(size, 16) + 2 :]
+        content = decoded
+    return status, content
+
+
+def test_http_api_streams_sweeps_through_process_pool(model_file):
+    """Verify the HTTP endpoints, including a sweep offloaded to worker processes."""
+    system, path = model_file
+    service = AnalysisService(workers=2, offload_rows=4, chunk_size=3)
+    rows = [{SBE_PATH: 100.0 + index} for index in range(10)] + [{"total_fit": "abc"}, {"Missing/lambda_BE": 1.0}]
+
+    async def scenario():
+        server = await service.start(port=0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            health = await _request(port, "GET", "/health")
+            analysis = await _request(port, "POST", "/analyze", {"config": str(path), "total_fit": TOTAL_FIT})
+            invalid = await _request(port, "POST", "/analyze", {"total_fit": TOTAL_FIT})
+            unknown = await _request(port, "GET", "/nowhere")
+            sweep = await _request(port, "POST", "/sweep", {"config": str(path), "total_fit": TOTAL_FIT, "rows": rows})
+        return health, analysis, invalid, unknown, sweep
+
+    try:
+        health, analysis, invalid, unknown, sweep = asyncio.run(scenario())
+    finally:
+        service.close()
+
+    assert health == (200, b'{"status": "ok"}')
+    assert analysis[0] == 200 and json.loads(analysis[1])["SPFM"] == pytest.approx(system.run_analysis()["SPFM"])
+    assert invalid[0] == 400 and "names no model" in json.loads(invalid[1])["error"]
+    assert unknown[0] == 404
+
+    assert sweep[0] == 200
+    results = [json.loads(line) for line in sweep[1].decode().splitlines()]
+    assert len(results) == len(rows)
+    for row, result in zip(rows[:-2], results):
+        assert result[SBE_PATH] == row[SBE_PATH]
+        assert result["SPFM"] == pytest.approx(system.run_analysis(row)["SPFM"])
+    assert "error" in results[-2] and "error" in results[-1]
@@ -0,0 +1,82 @@
+import io
+import json
+
+import pytest
+
+from ecc_analyzer.generic_safety_system import GenericSafetySystem
+from ecc_analyzer.models.lpddr5 import Lpddr5System
+from ecc_analyzer.streaming import main, read_rows, write_rows
+
+CONFIG = {
+    "type": "PipelineBlock",
+    "name": "Root",
+    "sub_blocks": [
+        {"type": "BasicEvent", "fault_type": "SBE", "rate": 100.0},
+        {"type": "PipelineBlock", "name": "Path", "sub_blocks": [{"type": "CoverageBlock", "target_fault": "SBE", "dc_rate_c_or_cR": 0.9}]},
+    ],
+}
+
+
+def test_evaluate_stream_is_lazy_and_passes_columns_through():
+    """Verify that rows are evaluated on demand and unmapped columns are kept."""
+    system = Lpddr5System("Stream", total_fit=4200.0)
+    consumed = []
+
+    def rows():
+        for part, mbe_dc in (("A-1", "0.5"), ("A-2", "0.9")):
+            consumed.append(part)
+            yield {"part": part, "DRAM_Path/SEC-DED/mbe_dc": mbe_dc}
+
+    results = system.evaluate_stream(rows())
+    first = next(results)
+
+    assert consumed == ["A-1"]
+    assert first == {"part": "A-1", **system.run_analysis()}
+    assert next(results) == {"part": "A-2", **system.run_analysis({"DRAM_Path/SEC-DED/mbe_dc": 0.9})}
+
+
+def test_evaluate_stream_rejects_non_numeric_values():
+    """Verify that a mapped column with text raises a ValueError."""
+    system = Lpddr5System("Stream", total_fit=4200.0)
+
+    with pytest.raises(ValueError, match="Column 'fit' holds a non-numeric value"):
+        list(system.evaluate_stream([{"fit": "high"}], columns={"fit": "total_fit"}))
+
+
+def test_evaluate_stream_rejects_metric_named_columns():
+    """Verify that a pass-through column cannot be silently replaced by a metric."""
+    system = Lpddr5System("Stream", total_fit=4200.0)
+
+    with pytest.raises(ValueError, match="Column 'SPFM' would be overwritten"):
+        list(system.evaluate_stream([{"part": "A-1", "SPFM": "0.99"}]))
+
+
+def test_csv_and_jsonl_round_trip():
+    """Verify reading and writing of both formats."""
+    rows = [{"part": "A", "SPFM": 0.9}, {"part": "B", "SPFM": 0.95}]
+
+    for fmt in ("csv", "jsonl"):
+        stream = io.StringIO()
+        assert write_rows(rows, stream, fmt) == 2
+        stream.seek(0)
+        assert [row["part"] for row in read_rows(stream, fmt)] == ["A", "B"]
+
+
+def test_cli_maps_columns(tmp_path):
+    """Verify the command line stage from a CSV file to a JSON Lines file."""
+    config_path = tmp_path / "model.json"
+    config_path.write_text(json.dumps(CONFIG))
+    input_path = tmp_path / "variants.csv"
+    input_path.write_text("part,fit,coverage\nP1,100,0.9\nP2,200,0.99\n")
+    output_path = tmp_path / "metrics.jsonl"
+
+    main([str(config_path), "--total-fit", "1000", "--map", "fit=0/lambda_BE", "--map", "coverage=Path/0/c_R", "--input", str(input_path), "--output", str(output_path)])
+
+    results = [json.loads(line) for line in output_path.read_text().splitlines()]
+    assert [row["part"] for row in results] == ["P1", "P2"]
+    assert results[0]["Lambda_RF_Sum"] == pytest.approx(10.0)
+    assert results[1]["Lambda_RF_Sum"] == pytest.approx(2.0)
+
+    direct_path = tmp_path / "direct.json"
+    direct_path.write_text(json.dumps(CONFIG).replace('"rate": 100.0', '"rate": 200.0').replace('"dc_rate_c_or_cR": 0.9', '"dc_rate_c_or_cR": 0.99'))
+    assert results[1]["LFM"] == pytest.approx(GenericSafetySystem("Direct", 1000.0, str(direct_path)).run_analysis()["LFM"])
@@ -1,8 +1,9 @@
 import json
+import pickle
 
 import pytest
 
-from ecc_analyzer.core import BasicEvent, SumBlock
+from ecc_analyzer.core import BasicEvent, CoverageBlock, PipelineBlock, SumBlock
 from ecc_analyzer.interfaces import FaultType
 from ecc_analyzer.system_base import SystemBase
 
@@ -42,6 +43,20 @@ def test_system_base_run_analysis_results():
     assert "ASIL_Achieved" in metrics
 
 
+def test_system_base_locks_are_per_instance():
+    """Verify that systems, also unpickled ones, do not share the lock of their model snapshot."""
+    first = MockSafetySystem("First", total_fit=1000.0)
+    second = MockSafetySystem("Second", total_fit=1000.0)
+    restored = pickle.loads(pickle.dumps(first))
+
+    assert first._model_lock is not second._model_lock
+    assert restored._model_lock is not first._model_lock
+    with first._model_lock:
+        restored.total_fit = 2000.0
+        second.total_fit = 500.0
+    assert (first.total_fit, restored.total_fit, second.total_fit) == (1000.0, 2000.0, 500.0)
+
+
 def test_system_base_json_io(tmp_path):
     """Verify saving to and loading from a JSON file."""
     system_save = MockSafetySystem("SaveSystem", total_fit=500.0)
@@ -76,3 +91,20 @@ def test_system_base_yaml_io(tmp_path):
 
     assert system_load.system_layout.name == "TestLayout"
     assert system_load.system_layout.sub_blocks[0].fault_type == FaultType.SBE
+
+
+def test_system_base_deduplicated_yaml_io(tmp_path):
+    """Verify that repeated components are saved once and loaded as one shared object."""
+    system_save = MockSafetySystem("DedupSystem", total_fit=500.0)
+    channel = PipelineBlock("Channel", [BasicEvent(FaultType.SBE, 10.0), CoverageBlock(FaultType.SBE, 0.9)])
+    system_save.system_layout = SumBlock("Channels", [PipelineBlock("Channel", list(channel.sub_blocks)) for _ in range(4)])
+    file_path = tmp_path / "system.yaml"
+
+    system_save.save_to_yaml(str(file_path), deduplicate=True)
+
+    system_load = MockSafetySystem("LoadDedup", total_fit=500.0)
+    system_load.load_from_yaml(str(file_path))
+
+    assert file_path.read_text().count("CoverageBlock") == 1
+    assert len({id(block) for block in system_load.system_layout.sub_blocks}) == 1
+    assert system_load.run_analysis() == system_save.run_analysis()